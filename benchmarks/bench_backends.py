@@ -0,0 +1,54 @@
+"""
+Compares the row and pandas cleaning backends of clean_table across roster sizes,
+checks that they produce identical output and reports the crossover point where
+the columnar backend starts to win.
+
+Usage (from the project root):
+    python benchmarks/bench_backends.py [--sizes 100 1000 10000 100000 1000000]
+"""
+import argparse
+import contextlib
+import io
+import time
+
+from synthetic import generate_roster
+from cleaner import COLUMNS_TO_CLEAN, ROW_BACKEND, PANDAS_BACKEND, clean_table
+
+
+def timed(rows, backend):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):  # silence "No match found" lines
+        result = clean_table(rows, COLUMNS_TO_CLEAN, backend=backend)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+    
+    # warm the mapping registry so the first size isn't charged for JSON parsing
+    timed(generate_roster(10), ROW_BACKEND)
+    
+    crossover = None
+    for size in args.sizes:
+        rows = generate_roster(size)
+        row_result, row_time = timed(rows, ROW_BACKEND)
+        pandas_result, pandas_time = timed(rows, PANDAS_BACKEND)
+        assert row_result == pandas_result, f"Backends disagree at {size} rows!"
+        
+        if crossover is None and pandas_time < row_time:
+            crossover = size
+        print(
+            f"{size:>9,} rows | rows {row_time:8.3f} s | pandas {pandas_time:8.3f} s | "
+            f"ratio {row_time / max(pandas_time, 1e-9):5.2f}x"
+        )
+    
+    if crossover is None:
+        print("pandas backend was not faster at any tested size")
+    else:
+        print(f"pandas backend is faster from about {crossover:,} rows")
+
+
+if __name__ == "__main__":
+    main()
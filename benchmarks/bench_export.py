@@ -0,0 +1,78 @@
+"""
+Compares the export formats on a cleaned, generated roster: write time and file size
+for TSV (also gzipped, which is what upload_tsv_via_stage stages), Parquet with zstd and
+snappy, and Arrow IPC with lz4 and zstd. Every columnar file is read back and
+checked to hold every row.
+
+Usage (from the project root):
+    python benchmarks/bench_export.py [--sizes 100000 1000000]
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from synthetic import generate_realistic_roster, write_roster_csv
+from cleaner import (
+    COLUMNS_TO_CLEAN, PARQUET_FORMAT, ARROW_FORMAT, readCSV, clean_table,
+    map_headers_to_tsv_columns, build_tsv_projection, write_tsv_rows, write_columnar_rows,
+)
+from columnar_export import read_export_table
+from snowflake_upload import gzip_file
+
+REPEATS = 3
+
+# label -> (suffix, write(rows, path, projection))
+VARIANTS = {
+    "tsv": (".tsv", write_tsv_rows),
+    "tsv+gzip": (".tsv", lambda rows, path, projection: (write_tsv_rows(rows, path, projection), gzip_file(path))),
+    "parquet zstd": (".parquet", lambda rows, path, projection: write_columnar_rows(rows, path, projection, PARQUET_FORMAT, compression="zstd")),
+    "parquet snappy": (".parquet", lambda rows, path, projection: write_columnar_rows(rows, path, projection, PARQUET_FORMAT, compression="snappy")),
+    "arrow lz4": (".arrow", lambda rows, path, projection: write_columnar_rows(rows, path, projection, ARROW_FORMAT, compression="lz4")),
+    "arrow zstd": (".arrow", lambda rows, path, projection: write_columnar_rows(rows, path, projection, ARROW_FORMAT, compression="zstd")),
+}
+
+
+def bench(num_rows: int, work_dir: str) -> None:
+    csv_path = os.path.join(work_dir, f"roster_{num_rows}.csv")
+    write_roster_csv(generate_realistic_roster(num_rows), csv_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        cleaned = clean_table(readCSV(csv_path), COLUMNS_TO_CLEAN)
+        projection = build_tsv_projection(cleaned[0], map_headers_to_tsv_columns(cleaned[0]))
+    data_rows = cleaned[1:]
+
+    tsv_seconds = None
+    for label, (suffix, write) in VARIANTS.items():
+        path = os.path.join(work_dir, f"export_{num_rows}_{label.replace(' ', '_').replace('+', '_')}{suffix}")
+        best = None
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):  # "not integers" warnings
+                write(data_rows, path, projection)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+
+        size_path = path + ".gz" if label == "tsv+gzip" else path
+        if suffix != ".tsv":
+            assert read_export_table(path).num_rows == num_rows, f"{label} lost rows!"
+        if tsv_seconds is None:
+            tsv_seconds = best
+        print(
+            f"{num_rows:>9,} rows | {label:14} | write {best:6.2f} s ({num_rows / best:>10,.0f} rows/s, "
+            f"{tsv_seconds / best:4.1f}x tsv) | {os.path.getsize(size_path) / 2**20:7.1f} MiB"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as work_dir:
+        for size in args.sizes:
+            bench(size, work_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Compares the dashboard queries over the fiscal_summary.py tables with the legacy
+queries over the raw tables: bytes scanned, elapsed time and whether the results
+agree. The result cache is disabled for the session so every run hits storage.
+
+Needs a Snowflake connection (see README) and the summary tables, e.g.
+    python src/fiscal_summary.py
+    python benchmarks/bench_fiscal_summary.py [--repeat 3]
+"""
+import argparse
+import os
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import pandas as pd
+from connection import get_connection_manager
+from report_queries import REPORT_QUERIES, LEGACY_REPORT_QUERIES
+
+QUERY_STATS = """
+    SELECT BYTES_SCANNED, TOTAL_ELAPSED_TIME
+    FROM TABLE(INFORMATION_SCHEMA.QUERY_HISTORY_BY_SESSION())
+    WHERE QUERY_ID = %(query_id)s
+    """
+
+
+def run_query(cur, query):
+    """Runs a query and returns (result, bytes scanned, elapsed ms) from the query history."""
+    cur.execute(query)
+    result = cur.fetch_pandas_all()
+    cur.execute(QUERY_STATS, {"query_id": cur.sfqid})
+    bytes_scanned, elapsed_ms = cur.fetchone()
+    return result, bytes_scanned or 0, elapsed_ms or 0
+
+
+def best_of(cur, query, repeat):
+    runs = [run_query(cur, query) for _ in range(repeat)]
+    result = runs[0][0]
+    return result, min(run[1] for run in runs), min(run[2] for run in runs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per query; the best is reported")
+    args = parser.parse_args()
+
+    with get_connection_manager().connection() as conn:
+        cur = conn.cursor()
+        try:
+            cur.execute("ALTER SESSION SET USE_CACHED_RESULT = FALSE")
+            totals = {"legacy_bytes": 0, "summary_bytes": 0, "legacy_ms": 0, "summary_ms": 0}
+
+            for name, query in REPORT_QUERIES.items():
+                legacy, legacy_bytes, legacy_ms = best_of(cur, LEGACY_REPORT_QUERIES[name], args.repeat)
+                summary, summary_bytes, summary_ms = best_of(cur, query, args.repeat)
+
+                totals["legacy_bytes"] += legacy_bytes
+                totals["summary_bytes"] += summary_bytes
+                totals["legacy_ms"] += legacy_ms
+                totals["summary_ms"] += summary_ms
+
+                try:
+                    pd.testing.assert_frame_equal(legacy, summary, check_dtype=False)
+                    same = "same result"
+                except AssertionError:
+                    same = "RESULTS DIFFER"
+                print(
+                    f"{name:25} | bytes {legacy_bytes:>13,} -> {summary_bytes:>11,} | "
+                    f"{legacy_ms:>7,} ms -> {summary_ms:>6,} ms | {same}"
+                )
+        finally:
+            cur.close()
+
+    print(
+        f"{'total':25} | bytes {totals['legacy_bytes']:>13,} -> {totals['summary_bytes']:>11,} | "
+        f"{totals['legacy_ms']:>7,} ms -> {totals['summary_ms']:>6,} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
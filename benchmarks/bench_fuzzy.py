@@ -0,0 +1,82 @@
+"""
+Benchmarks the fuzzy ORG_ID fallback on distinct hand-typed organization names:
+time of the trigram-indexed FuzzyMatcher against scoring every key, and accepted /
+rejected / wrong counts at several thresholds (the names that exact and substring
+matching already resolve are skipped, as in ColumnResolver).
+
+Usage (from the project root):
+    python benchmarks/bench_fuzzy.py [--count 10000] [--thresholds 0.75 0.8 0.85 0.9]
+"""
+import argparse
+import time
+
+from synthetic import generate_dirty_org_names
+from resolution import build_value_lookup
+from matcher import ValueMatcher
+from fuzzy import FuzzyMatcher, linear_best_match
+from utils import normalize
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.75, 0.8, 0.85, 0.9])
+    parser.add_argument("--skip-linear", action="store_true", help="Don't time the every-key scan")
+    args = parser.parse_args()
+
+    lookup = build_value_lookup("ORG_ID")
+    matcher = ValueMatcher(lookup)
+    names = generate_dirty_org_names(args.count)
+
+    # only values that reach the fuzzy stage
+    pending = []
+    for name, expected in names:
+        value = normalize(name)
+        if value not in lookup and matcher.match(value) is None:
+            pending.append((value, expected))
+    print(f"{len(names):,} distinct names, {len(pending):,} left after exact + substring matching "
+          f"({sum(1 for _, expected in pending if expected is None):,} not in key_ids.json)")
+
+    start = time.perf_counter()
+    fuzzy = FuzzyMatcher(lookup)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = [fuzzy.best_match(value) for value, _ in pending]
+    indexed_time = time.perf_counter() - start
+    avg_candidates = sum(len(fuzzy.candidates(value)) for value, _ in pending) / max(len(pending), 1)
+    print(f"index: {len(fuzzy):,} keys built in {build_time * 1000:.1f} ms, "
+          f"{avg_candidates:.1f} keys scored per value")
+
+    if args.skip_linear:
+        print(f"indexed {indexed_time:.2f} s")
+    else:
+        start = time.perf_counter()
+        linear = [linear_best_match(lookup, value) for value, _ in pending]
+        linear_time = time.perf_counter() - start
+        agree = sum(1 for a, b in zip(indexed, linear) if a is not None and b is not None and a[0] == b[0])
+        print(f"linear {linear_time:.2f} s | indexed {indexed_time:.2f} s | "
+              f"speedup {linear_time / max(indexed_time, 1e-9):.1f}x | same best key {agree / max(len(pending), 1):.1%}")
+
+    for threshold in args.thresholds:
+        correct = wrong = rejected_known = rejected_unknown = 0
+        for (value, expected), best in zip(pending, indexed):
+            accepted = best is not None and best[1] >= threshold
+            if not accepted:
+                if expected is None:
+                    rejected_unknown += 1
+                else:
+                    rejected_known += 1
+            elif fuzzy.values[best[0]] == expected:
+                correct += 1
+            else:
+                wrong += 1
+        accepted = correct + wrong
+        print(
+            f"threshold {threshold:.2f} | accepted {accepted:>6,} (precision {correct / max(accepted, 1):6.1%}) | "
+            f"rejected {rejected_known + rejected_unknown:>6,} ({rejected_known:,} were known orgs)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Compares header mapping with the single-pass HeaderMatcher against the previous
+per-column find_column_by_name loop, on many synthetic instructor header rows.
+
+Usage (from the project root):
+    python benchmarks/bench_header_mapping.py [--files 1000]
+"""
+import argparse
+import contextlib
+import io
+import random
+import time
+
+from synthetic import ROSTER_HEADERS
+from cleaner import TSV_HEADERS, find_column_by_name, map_headers_with_report
+
+EXTRA_HEADERS = ["Timestamp", "Email", "Parent Name", "Phone", "T-Shirt Size", "Notes", "Sex", "zip code", "Student ID"]
+
+
+def legacy_mapping(csv_headers):
+    column_mapping, used = {}, set()
+    for tsv_col in TSV_HEADERS:
+        col_index = find_column_by_name(tsv_col, csv_headers)
+        csv_col = csv_headers[col_index] if col_index is not None else None
+        if csv_col is not None and csv_col not in used:
+            column_mapping[tsv_col] = csv_col
+            used.add(csv_col)
+        else:
+            column_mapping[tsv_col] = None
+    return column_mapping
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=1_000)
+    args = parser.parse_args()
+
+    rng = random.Random(5)
+    header_rows = []
+    for _ in range(args.files):
+        headers = ROSTER_HEADERS + rng.sample(EXTRA_HEADERS, rng.randint(2, len(EXTRA_HEADERS)))
+        rng.shuffle(headers)
+        header_rows.append(headers)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        legacy = [legacy_mapping(headers) for headers in header_rows]
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        single = [map_headers_with_report(headers)[0] for headers in header_rows]
+        single_time = time.perf_counter() - start
+
+    differ = sum(1 for a, b in zip(legacy, single) if a != b)
+    print(
+        f"{args.files:,} header rows | per-column {legacy_time * 1000:8.1f} ms | "
+        f"single pass {single_time * 1000:8.1f} ms | speedup {legacy_time / max(single_time, 1e-9):5.1f}x | "
+        f"{differ} mappings differ"
+    )
+
+
+if __name__ == "__main__":
+    main()
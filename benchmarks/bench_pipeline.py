@@ -0,0 +1,67 @@
+"""
+Compares the chained approach (deepcopy + one clean_column call per column, as the
+GUI used to do) against the single-pass clean_table, reporting wall time and peak
+memory measured with tracemalloc.
+
+Usage (from the project root):
+    python benchmarks/bench_pipeline.py [--sizes 10000 100000]
+"""
+import argparse
+import contextlib
+import copy
+import io
+import time
+import tracemalloc
+
+from synthetic import generate_roster
+from cleaner import COLUMNS_TO_CLEAN, clean_column, clean_table
+
+
+def chained(rows):
+    cleaned = copy.deepcopy(rows)
+    for column_name in COLUMNS_TO_CLEAN:
+        cleaned = clean_column(column_name, cleaned)
+    return cleaned
+
+
+def single_pass(rows):
+    return clean_table(rows, COLUMNS_TO_CLEAN)
+
+
+def single_pass_in_place(rows):
+    return clean_table(rows, COLUMNS_TO_CLEAN, in_place=True)
+
+
+def measure(func, rows):
+    tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):  # silence "No match found" lines
+        result = func(rows)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def bench(num_rows: int) -> None:
+    expected = None
+    for name, func in [("chained", chained), ("clean_table", single_pass), ("clean_table in-place", single_pass_in_place)]:
+        rows = generate_roster(num_rows)
+        result, elapsed, peak = measure(func, rows)
+        if expected is None:
+            expected = result
+        else:
+            assert result == expected, f"{name} output differs from the chained approach!"
+        print(f"{num_rows:>9,} rows | {name:22} | {elapsed:7.2f} s | peak {peak / 2**20:8.1f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+    for size in args.sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Compares the CSV readers (csv.reader, pyarrow, pandas) on a generated roster: whole-file
+reads (readCSV) and streaming (iter_csv_rows), checking that they return the same rows.
+
+Usage (from the project root):
+    python benchmarks/bench_readers.py [--sizes 100000 1000000]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from synthetic import generate_realistic_roster, write_roster_csv
+from csv_readers import CSV_READERS, read_rows, iter_rows
+
+
+def bench(num_rows: int, work_dir: str) -> None:
+    csv_path = os.path.join(work_dir, f"roster_{num_rows}.csv")
+    write_roster_csv(generate_realistic_roster(num_rows), csv_path)
+
+    expected = None
+    for reader in CSV_READERS:
+        start = time.perf_counter()
+        rows = read_rows(csv_path, reader)
+        read_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        streamed = sum(1 for _ in iter_rows(csv_path, reader))
+        stream_time = time.perf_counter() - start
+
+        if expected is None:
+            expected = rows
+        else:
+            assert rows == expected, f"{reader} rows differ!"
+        assert streamed == len(rows), f"{reader} streamed {streamed} rows, read {len(rows)}"
+        del rows
+        print(
+            f"{num_rows:>9,} rows | {reader:8} | read {read_time:6.2f} s ({num_rows / read_time:>10,.0f} rows/s) | "
+            f"stream {stream_time:6.2f} s ({num_rows / stream_time:>10,.0f} rows/s)"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as work_dir:
+        for size in args.sizes:
+            bench(size, work_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Compares rows held as list[list[str]] (readCSV + the row engine) with the columnar,
+dictionary-encoded Roster (read_roster + column-wise cleaning): memory retained after
+reading, peak memory while reading (tracemalloc), read time and cleaning time, and
+checks that both clean to the same rows. read_roster uses the pyarrow reader by default,
+whose own buffers tracemalloc does not see: the Roster peak leaves out the Arrow table,
+which is about the size of the CSV file and freed once the roster is built.
+
+Usage (from the project root):
+    python benchmarks/bench_roster.py [--sizes 100000 1000000]
+"""
+import argparse
+import contextlib
+import gc
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+
+from synthetic import generate_realistic_roster, write_roster_csv
+from cleaner import COLUMNS_TO_CLEAN, CleaningPipeline, readCSV, read_roster
+from roster import rows_nbytes
+
+
+def measure_read(read, csv_path):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    data = read(csv_path)
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return data, elapsed, retained, peak
+
+
+def clean(data):
+    pipeline = CleaningPipeline(COLUMNS_TO_CLEAN)
+    pipeline.prepare(data[0])
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        cleaned = pipeline.run(data)
+    return cleaned, time.perf_counter() - start
+
+
+def bench(num_rows: int, work_dir: str) -> None:
+    csv_path = os.path.join(work_dir, f"roster_{num_rows}.csv")
+    write_roster_csv(generate_realistic_roster(num_rows), csv_path)
+
+    rows, rows_read, rows_retained, rows_peak = measure_read(readCSV, csv_path)
+    rows_size = rows_nbytes(rows)
+    rows_cleaned, rows_clean = clean(rows)
+    del rows
+
+    roster, roster_read, roster_retained, roster_peak = measure_read(read_roster, csv_path)
+    roster_size = roster.nbytes()
+    roster_cleaned, roster_clean = clean(roster)
+    assert roster_cleaned.to_rows() == rows_cleaned, "Roster cleaning differs from the row engine!"
+    del rows_cleaned, roster_cleaned
+
+    for name, read_time, retained, peak, size, clean_time in [
+        ("rows", rows_read, rows_retained, rows_peak, rows_size, rows_clean),
+        ("Roster", roster_read, roster_retained, roster_peak, roster_size, roster_clean),
+    ]:
+        print(
+            f"{num_rows:>9,} rows | {name:6} | held {retained / 2**20:7.1f} MiB (getsizeof {size / 2**20:7.1f}) | "
+            f"peak {peak / 2**20:7.1f} MiB | read {read_time:6.2f} s | clean {clean_time:6.2f} s"
+        )
+    print(f"{'':>14} | memory held {rows_retained / roster_retained:5.1f}x smaller, cleaning {rows_clean / roster_clean:5.1f}x faster")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as work_dir:
+        for size in args.sizes:
+            bench(size, work_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+Benchmark suite for the roster pipeline with regression baselines.
+
+Generates realistic dirty rosters (see synthetic.generate_realistic_roster) at each size,
+writes them to CSV and measures, per stage, throughput (best of a few runs) and peak
+memory (a separate run under tracemalloc):
+
+    read_csv      readCSV on the generated file
+    map_headers   map_headers_with_report on HEADER_ROWS varied instructor header rows
+    clean_column  clean_column once per column in COLUMNS_TO_CLEAN
+    clean_table   the single-pass CleaningPipeline used by the GUI and batch mode
+    write_tsv     transfer_rows_to_tsv_with_mapping of the cleaned rows
+
+Results are compared with benchmarks/baselines.json; a stage whose throughput drops or
+whose peak memory grows past the tolerances is reported as a REGRESSION and the script
+exits with status 1. Baselines are machine-specific: record them with --save-baseline on
+the machine that runs the comparison.
+
+Usage (from the project root):
+    python benchmarks/bench_suite.py [--sizes 10000 100000 1000000] [--save-baseline]
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from synthetic import generate_realistic_roster, generate_realistic_headers, write_roster_csv
+from cleaner import (
+    COLUMNS_TO_CLEAN, readCSV, clean_column, clean_table,
+    map_headers_with_report, map_headers_to_tsv_columns, transfer_rows_to_tsv_with_mapping,
+)
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+HEADER_ROWS = 1_000            # header rows mapped per map_headers measurement
+THROUGHPUT_TOLERANCE = 0.30    # allowed drop in rows/sec
+MEMORY_TOLERANCE = 0.15        # allowed growth in peak bytes
+TIMED_ROWS_PER_SIZE = 300_000  # repeats = this // size (1 to 5), smaller sizes are noisier
+
+
+def measure_time(func, repeats: int) -> float:
+    """Best wall time of func() over repeats runs."""
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def measure_peak(func) -> int:
+    """Peak bytes allocated by func() while it runs, as seen by tracemalloc."""
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def bench_size(num_rows: int, work_dir: str, memory: bool = True) -> dict[str, dict]:
+    """
+    Runs every stage on a generated roster of num_rows rows.
+
+    Returns:
+        dict[str, dict]: stage -> {"seconds", "rows", "rows_per_sec", "peak_bytes"}.
+    """
+    csv_path = os.path.join(work_dir, f"roster_{num_rows}.csv")
+    tsv_path = os.path.join(work_dir, f"roster_{num_rows}.tsv")
+    write_roster_csv(generate_realistic_roster(num_rows), csv_path)
+
+    rng = random.Random(3)
+    header_rows = [[header for _, header in generate_realistic_headers(rng)] for _ in range(HEADER_ROWS)]
+
+    rows = readCSV(csv_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        cleaned = clean_table(rows, COLUMNS_TO_CLEAN)
+        tsv_mapping = map_headers_to_tsv_columns(cleaned[0])
+
+    def clean_each_column():
+        result = rows
+        for column_name in COLUMNS_TO_CLEAN:
+            result = clean_column(column_name, result)
+
+    stages = {
+        "read_csv": (lambda: readCSV(csv_path), num_rows),
+        "map_headers": (lambda: [map_headers_with_report(headers) for headers in header_rows], HEADER_ROWS),
+        "clean_column": (clean_each_column, num_rows),
+        "clean_table": (lambda: clean_table(rows, COLUMNS_TO_CLEAN), num_rows),
+        "write_tsv": (lambda: transfer_rows_to_tsv_with_mapping(cleaned, tsv_path, tsv_mapping), num_rows),
+    }
+    repeats = max(1, min(5, TIMED_ROWS_PER_SIZE // num_rows))
+    results = {}
+    for stage, (func, stage_rows) in stages.items():
+        with contextlib.redirect_stdout(io.StringIO()):  # mapping and "No match found" chatter
+            seconds = measure_time(func, repeats)
+            peak = measure_peak(func) if memory else None
+        results[stage] = {
+            "seconds": seconds,
+            "rows": stage_rows,
+            "rows_per_sec": stage_rows / seconds if seconds > 0 else None,
+            "peak_bytes": peak,
+        }
+        print(format_result(num_rows, stage, results[stage]))
+    return results
+
+
+def format_result(num_rows: int, stage: str, result: dict) -> str:
+    peak = f"peak {result['peak_bytes'] / 2**20:8.1f} MiB" if result["peak_bytes"] is not None else ""
+    return f"{num_rows:>9,} rows | {stage:12} | {result['seconds']:8.3f} s | {result['rows_per_sec']:>12,.0f} rows/s | {peak}"
+
+
+def compare_to_baseline(
+    results: dict[str, dict[str, dict]],
+    baseline: dict[str, dict[str, dict]],
+    throughput_tolerance: float = THROUGHPUT_TOLERANCE,
+    memory_tolerance: float = MEMORY_TOLERANCE
+) -> list[str]:
+    """
+    Compares results with a baseline (both size -> stage -> metrics, sizes as strings).
+
+    Returns:
+        list[str]: One message per regression; sizes or stages missing from the baseline are skipped.
+    """
+    regressions = []
+    for size, stages in results.items():
+        for stage, current in stages.items():
+            expected = baseline.get(size, {}).get(stage)
+            if expected is None:
+                continue
+            if current["rows_per_sec"] and expected.get("rows_per_sec"):
+                floor = expected["rows_per_sec"] * (1 - throughput_tolerance)
+                if current["rows_per_sec"] < floor:
+                    regressions.append(
+                        f"{stage} @ {int(size):,} rows: {current['rows_per_sec']:,.0f} rows/s, "
+                        f"baseline {expected['rows_per_sec']:,.0f} ({current['rows_per_sec'] / expected['rows_per_sec'] - 1:+.0%})"
+                    )
+            if current["peak_bytes"] is not None and expected.get("peak_bytes"):
+                ceiling = expected["peak_bytes"] * (1 + memory_tolerance)
+                if current["peak_bytes"] > ceiling:
+                    regressions.append(
+                        f"{stage} @ {int(size):,} rows: peak {current['peak_bytes'] / 2**20:,.1f} MiB, "
+                        f"baseline {expected['peak_bytes'] / 2**20:,.1f} MiB ({current['peak_bytes'] / expected['peak_bytes'] - 1:+.0%})"
+                    )
+    return regressions
+
+
+def load_baseline(path: str = BASELINE_PATH) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(results: dict[str, dict[str, dict]], path: str = BASELINE_PATH) -> None:
+    """Merges results into the baseline file, keeping sizes that were not re-run."""
+    baseline = load_baseline(path)
+    baseline.update({
+        "recorded_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        "machine": f"{platform.machine()} {platform.processor() or platform.system()}, {os.cpu_count()} CPUs",
+        "python": platform.python_version(),
+    })
+    baseline.setdefault("results", {}).update(results)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2)
+        f.write("\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline file to compare with / save to")
+    parser.add_argument("--save-baseline", action="store_true", help="Record these results as the new baseline")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc runs (faster, no memory check)")
+    parser.add_argument("--throughput-tolerance", type=float, default=THROUGHPUT_TOLERANCE)
+    parser.add_argument("--memory-tolerance", type=float, default=MEMORY_TOLERANCE)
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        for size in args.sizes:
+            results[str(size)] = bench_size(size, work_dir, memory=not args.no_memory)
+
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        print(f"\nBaseline saved to {args.baseline}")
+        return
+
+    baseline = load_baseline(args.baseline).get("results", {})
+    if not baseline:
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to record one.")
+        return
+    regressions = compare_to_baseline(results, baseline, args.throughput_tolerance, args.memory_tolerance)
+    if regressions:
+        print("\n" + "!" * 60)
+        print(f"PERFORMANCE REGRESSION ({len(regressions)}) against {args.baseline}:")
+        for message in regressions:
+            print(f"  ✗ {message}")
+        print("!" * 60)
+        sys.exit(1)
+    print(f"\n✓ No regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
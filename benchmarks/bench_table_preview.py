@@ -0,0 +1,80 @@
+"""
+Measures how long the GUI takes to show a roster preview: the old QTableWidget
+approach (one QTableWidgetItem per cell + resizeColumnsToContents) versus the
+lazy RosterTableModel + QTableView with sampled column sizing.
+
+Usage (from the project root; no display needed):
+    python benchmarks/bench_table_preview.py [--sizes 10000 100000 500000]
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from synthetic import generate_roster
+from PySide6.QtWidgets import QApplication, QTableWidget, QTableWidgetItem, QTableView
+from table_model import RosterTableModel, resize_columns_from_sample
+
+
+def display_table_widget(table, data):
+    """The previous MainWindow.display_table implementation."""
+    headers = data[0]
+    rows = data[1:]
+    
+    table.clear()
+    table.setColumnCount(len(headers))
+    table.setHorizontalHeaderLabels(headers)
+    table.setRowCount(len(rows))
+    
+    for row_ind, row in enumerate(rows):
+        for col_ind, val in enumerate(row):
+            table.setItem(row_ind, col_ind, QTableWidgetItem(str(val)))
+    
+    table.resizeColumnsToContents()
+
+
+def display_table_view(view, data):
+    view.setModel(RosterTableModel(data, view))
+    resize_columns_from_sample(view)
+
+
+def bench(app, num_rows: int, skip_widget: bool) -> None:
+    data = generate_roster(num_rows)
+    
+    view = QTableView()
+    start = time.perf_counter()
+    display_table_view(view, data)
+    app.processEvents()
+    view_time = time.perf_counter() - start
+    
+    if skip_widget:
+        print(f"{num_rows:>9,} rows | QTableWidget  (skipped) | model/view {view_time:8.3f} s")
+        return
+    
+    widget = QTableWidget()
+    start = time.perf_counter()
+    display_table_widget(widget, data)
+    app.processEvents()
+    widget_time = time.perf_counter() - start
+    
+    print(
+        f"{num_rows:>9,} rows | QTableWidget {widget_time:8.2f} s | model/view {view_time:8.3f} s | "
+        f"speedup {widget_time / max(view_time, 1e-9):8.0f}x"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 500_000])
+    parser.add_argument("--widget-limit", type=int, default=100_000,
+                        help="skip the QTableWidget run above this many rows (it takes minutes)")
+    args = parser.parse_args()
+    
+    app = QApplication.instance() or QApplication([])
+    for size in args.sizes:
+        bench(app, size, skip_widget=size > args.widget_limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Synthetic roster generation shared by the benchmark scripts.
+
+Run benchmarks from the project root so the relative `mappings/` paths resolve, e.g.
+    python benchmarks/bench_matcher.py
+"""
+import csv
+import os
+import random
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from utils import create_mapping, load_column_synonyms, load_value_synonyms
+
+ROSTER_HEADERS = ["First Name", "Last Name", "Gender", "Age", "Grade", "Ethnicity", "School"]
+
+UNKNOWN_SCHOOLS = [
+    "Sunnyvale Charter Academy", "Lincoln Heights Magnet", "Mar Vista Prep",
+    "Harbor City Learning Center", "Eastside Homeschool Co-op", "Valley Oak Middle",
+]
+GENDERS = ["M", "F", "Male", "female", "Girl", "boy", "Non-binary", "NP", ""]
+ETHNICITIES = ["Hispanic", "Latino", "Black", "Asian American", "White", "Two or more races", "Other", ""]
+
+
+def generate_roster(num_rows: int, unknown_ratio: float = 0.3, seed: int = 7) -> list[list[str]]:
+    """
+    Generates a roster shaped like the instructor CSVs (header row first).
+
+    Args:
+        num_rows (int): number of data rows.
+        unknown_ratio (float): share of rows whose school is not in key_ids.json.
+        seed (int): random seed, so runs are comparable.
+
+    Returns:
+        list[list[str]]: rows with headers in the first row.
+    """
+    rng = random.Random(seed)
+    schools = list(create_mapping("ORG_ID").keys())
+    rows = [ROSTER_HEADERS[:]]
+    for i in range(num_rows):
+        if rng.random() < unknown_ratio:
+            school = f"{rng.choice(UNKNOWN_SCHOOLS)} #{rng.randint(1, 400)}"
+        else:
+            school = rng.choice(schools)
+        rows.append([
+            f"First{i}", f"Last{i}", rng.choice(GENDERS), str(rng.randint(5, 18)),
+            str(rng.randint(0, 12)), rng.choice(ETHNICITIES), school,
+        ])
+    return rows
+
+
+ABBREVIATIONS = {
+    "elementary": "elem", "school": "sch", "academy": "acad", "middle": "mid",
+    "high": "hs", "saint": "st", "center": "ctr", "unified": "usd", "college": "coll",
+}
+UNKNOWN_WORDS = [
+    "Cedar", "Maple", "Horizon", "Summit", "Riverside", "Pioneer", "Bayview", "Oakridge",
+    "Prairie", "Canyon", "Meadow", "Granite", "Harmony", "Liberty", "Orchard", "Willow",
+]
+UNKNOWN_KINDS = ["Elementary", "Middle School", "Prep", "Learning Lab", "Youth Club", "Institute"]
+
+
+def misspell(name: str, rng: random.Random) -> str:
+    """Applies one or two random edits typical of hand-typed rosters."""
+    for _ in range(rng.randint(1, 2)):
+        edit = rng.randrange(5)
+        words = name.split()
+        if edit == 0 and len(name) > 4:  # drop a character
+            i = rng.randrange(len(name))
+            name = name[:i] + name[i + 1:]
+        elif edit == 1 and len(name) > 4:  # swap neighbours
+            i = rng.randrange(len(name) - 1)
+            name = name[:i] + name[i + 1] + name[i] + name[i + 2:]
+        elif edit == 2:  # abbreviate a word
+            name = " ".join(ABBREVIATIONS.get(word.lower(), word) for word in words)
+        elif edit == 3 and len(words) > 2:  # drop a trailing word
+            name = " ".join(words[:-1])
+        else:  # stray punctuation / casing
+            name = rng.choice([name.upper(), name.lower(), name + ".", name.replace(" ", "  ", 1)])
+    return name
+
+
+def generate_dirty_org_names(count: int, unknown_ratio: float = 0.3, seed: int = 11) -> list[tuple[str, object]]:
+    """
+    Generates distinct hand-typed organization names.
+
+    Returns:
+        list[tuple[str, object]]: (dirty name, expected ORG_ID) pairs; the expected id is
+        None for names of organizations that are not in key_ids.json.
+    """
+    rng = random.Random(seed)
+    orgs = list(create_mapping("ORG_ID").items())
+    names = {}
+    while len(names) < count:
+        if rng.random() < unknown_ratio:
+            name = f"{rng.choice(UNKNOWN_WORDS)} {rng.choice(UNKNOWN_WORDS)} {rng.choice(UNKNOWN_KINDS)}"
+            names.setdefault(misspell(name, rng) if rng.random() < 0.5 else name, None)
+        else:
+            org_name, org_id = rng.choice(orgs)
+            names.setdefault(misspell(org_name, rng), org_id)
+    return list(names.items())
+
+
+# roster columns in the order instructors usually put them; the header text is drawn per file
+REALISTIC_COLUMNS = [
+    "STUDENT_FIRST_NAME", "STUDENT_LAST_NAME", "STUDENT_CODE", "AGE", "GRADE", "GENDER_ID",
+    "ETHNICITY_ID", "ORG_ID", "POSTAL_CODE", "IS_RETURNING_STUDENT_FLAG",
+]
+UNMAPPED_HEADERS = ["Timestamp", "Email", "Parent Name", "Phone", "T-Shirt Size", "Notes"]
+BLANK_RATIO = 0.03  # share of empty gender/ethnicity cells
+
+
+def vary_case(text: str, rng: random.Random) -> str:
+    return rng.choice([text, text.lower(), text.upper(), text.title()])
+
+
+def generate_realistic_headers(rng: random.Random) -> list[tuple[str | None, str]]:
+    """
+    One instructor header row as (column, header) pairs: every REALISTIC_COLUMNS column
+    under a name drawn from column_synonyms.json (or its own name) in random casing, plus
+    a few unmapped columns (column None) at random positions.
+    """
+    synonyms = load_column_synonyms()
+    headers = [(column, vary_case(rng.choice([column] + synonyms.get(column, [])), rng)) for column in REALISTIC_COLUMNS]
+    for extra in rng.sample(UNMAPPED_HEADERS, rng.randint(0, 3)):
+        headers.insert(rng.randint(0, len(headers)), (None, extra))
+    return headers
+
+
+def value_spellings(column_name: str) -> list[str]:
+    """Database names plus every spelling in value_synonyms.json for a column."""
+    spellings = list(create_mapping(column_name).keys())
+    for variants in load_value_synonyms().get(column_name, {}).values():
+        spellings.extend(variants)
+    return spellings
+
+
+def generate_realistic_roster(
+    num_rows: int,
+    distinct_schools: int = 1_500,
+    unknown_ratio: float = 0.15,
+    seed: int = 13
+) -> list[list[str]]:
+    """
+    Generates a dirty roster like the ones instructors send in (header row first):
+    header names from column_synonyms.json, schools drawn from a pool of key_ids.json
+    organizations, half of them misspelled, plus unknown ones, and gender/ethnicity in
+    every spelling value_synonyms.json knows, with blanks. Schools repeat across rows
+    like they do in real rosters, so the pool size sets the number of distinct values.
+
+    Args:
+        num_rows (int): number of data rows.
+        distinct_schools (int): size of the school name pool.
+        unknown_ratio (float): share of the pool that is not in key_ids.json.
+        seed (int): random seed, so runs are comparable.
+
+    Returns:
+        list[list[str]]: rows with headers in the first row.
+    """
+    rng = random.Random(seed)
+    headers = generate_realistic_headers(rng)
+    positions = {column: i for i, (column, _) in enumerate(headers) if column is not None}
+
+    orgs = list(create_mapping("ORG_ID").keys())
+    schools = []
+    for _ in range(distinct_schools):
+        if rng.random() < unknown_ratio:
+            schools.append(f"{rng.choice(UNKNOWN_WORDS)} {rng.choice(UNKNOWN_WORDS)} {rng.choice(UNKNOWN_KINDS)}")
+        else:
+            name = rng.choice(orgs)
+            schools.append(misspell(name, rng) if rng.random() < 0.5 else name)
+    genders = value_spellings("GENDER_ID")
+    ethnicities = value_spellings("ETHNICITY_ID")
+
+    rows = [[header for _, header in headers]]
+    width = len(headers)
+    for i in range(num_rows):
+        row = [""] * width
+        row[positions["STUDENT_FIRST_NAME"]] = f"First{i}"
+        row[positions["STUDENT_LAST_NAME"]] = f"Last{i}"
+        row[positions["STUDENT_CODE"]] = f"S{i:07d}"
+        row[positions["AGE"]] = str(rng.randint(5, 18))
+        row[positions["GRADE"]] = str(rng.randint(0, 12))
+        row[positions["GENDER_ID"]] = "" if rng.random() < BLANK_RATIO else rng.choice(genders)
+        row[positions["ETHNICITY_ID"]] = "" if rng.random() < BLANK_RATIO else rng.choice(ethnicities)
+        row[positions["ORG_ID"]] = rng.choice(schools)
+        row[positions["POSTAL_CODE"]] = str(rng.randint(90001, 93599))
+        row[positions["IS_RETURNING_STUDENT_FLAG"]] = rng.choice(["Y", "N", "yes", "no", ""])
+        rows.append(row)
+    return rows
+
+
+def write_roster_csv(rows: list[list[str]], path: str) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerows(rows)
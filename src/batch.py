@@ -0,0 +1,324 @@
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from cleaner import *
+from resolution import load_value_matcher
+from connection import get_connection_manager
+from snowflake_upload import upload_tsv_via_stage, upload_parquet_via_stage
+from instrumentation import RunReport, profiled
+
+SUMMARY_FILE_NAME = "batch_summary.json"
+PROFILE_FILE_NAME = "batch_profile.prof"
+
+def find_roster_files(source: str) -> list[str]:
+    """
+    Expands a directory (all *.csv inside it) or a glob pattern into a sorted list of CSV paths.
+    """
+    if os.path.isdir(source):
+        pattern = os.path.join(source, "*.csv")
+    else:
+        pattern = source
+    return sorted(path for path in glob.glob(pattern) if os.path.isfile(path))
+
+def output_names(csv_files: list[str]) -> dict[str, str]:
+    """
+    Picks an output name (without extension) for every roster: its file name, or, when
+    several rosters share a file name (e.g. data/*/roster.csv), its path relative to
+    their common directory with the separators replaced by "__".
+    
+    Raises:
+        ValueError: If two rosters still map to the same name, e.g. a file listed twice.
+    """
+    stems = [os.path.splitext(os.path.basename(path))[0] for path in csv_files]
+    counts = {}
+    for stem in stems:
+        counts[stem] = counts.get(stem, 0) + 1
+    if any(count > 1 for count in counts.values()):
+        root = os.path.commonpath([os.path.abspath(path) for path in csv_files])
+    names = {}
+    taken = set()
+    for path, stem in zip(csv_files, stems):
+        if counts[stem] > 1:
+            relative = os.path.splitext(os.path.relpath(os.path.abspath(path), root))[0]
+            stem = relative.replace(os.sep, "__")
+        if stem in taken:
+            raise ValueError(f"Two rosters would be exported to '{stem}': {path}")
+        taken.add(stem)
+        names[path] = stem
+    return names
+
+def init_worker(columns_to_clean: list[str]) -> None:
+    """
+    Process pool initializer: loads the mapping files and builds each column's
+    ValueMatcher once per worker instead of once per file.
+    """
+    load_column_synonym_sets()
+    for column_name in columns_to_clean:
+        load_value_matcher(column_name)
+
+def process_roster(
+    csv_file_path: str,
+    output_dir: str,
+    columns_to_clean: list[str] = COLUMNS_TO_CLEAN,
+    reader: str = DEFAULT_CSV_READER,
+    export_format: str = DEFAULT_EXPORT_FORMAT,
+    output_name: str | None = None
+) -> dict:
+    """
+    Cleans and exports one roster to <output_dir>/<name>.tsv (or .parquet/.arrow, see
+    columnar_export) with the streaming engine. <name> is output_name, or the CSV file
+    name without its extension. A failed roster leaves no output file behind.
+    
+    Returns:
+        dict: Per-file summary with rows written, the header mapping confidence report,
+        unmatched values and fuzzy decisions per column, the values of integer columns
+        that were not integers and were exported as nulls (parquet/arrow only), timings in seconds, the per-stage
+        RunReport (read_csv, clean, write_tsv, ...) and an error message (None on success).
+    """
+    name = output_name or os.path.splitext(os.path.basename(csv_file_path))[0]
+    tsv_file_path = os.path.join(output_dir, f"{name}{EXPORT_SUFFIXES[export_format]}")
+    summary = {
+        "file": csv_file_path,
+        "output": tsv_file_path,
+        "rows": 0,
+        "unmatched": {},
+        "fuzzy": {},
+        "unmapped_columns": [],
+        "rejected": {},
+        "header_mapping": {},
+        "timings": {},
+        "stages": [],
+        "error": None,
+    }
+    start = time.perf_counter()
+    report = RunReport(name)
+    
+    # per-file chatter (mapping tables, "No match found") is summarized instead of printed
+    log = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(log):
+            csv_headers = read_csv_headers(csv_file_path)
+            if csv_headers is None:
+                raise IOError("Could not read CSV file or file is empty!")
+            with report.stage("map_headers"):
+                column_mapping, summary["header_mapping"] = map_headers_with_report(csv_headers)
+            summary["unmapped_columns"] = [tsv_col for tsv_col, csv_col in column_mapping.items() if csv_col is None]
+            mapped = time.perf_counter()
+            
+            pipeline = CleaningPipeline(columns_to_clean)
+            summary["rows"] = stream_csv_to_tsv(
+                csv_file_path, tsv_file_path, column_mapping, pipeline=pipeline, report=report, reader=reader,
+                export_format=export_format
+            )
+            
+        summary["unmatched"] = {
+            column_name: sorted(resolver.unmatched)
+            for column_name, resolver in pipeline.resolvers.items()
+            if resolver.unmatched
+        }
+        summary["rejected"] = report.meta.get("rejected", {})
+        summary["fuzzy"] = {
+            column_name: resolver.fuzzy_report()
+            for column_name, resolver in pipeline.resolvers.items()
+            if resolver.fuzzy_decisions
+        }
+        summary["timings"] = {
+            "map": mapped - start,
+            "clean_and_write": time.perf_counter() - mapped,
+        }
+    except Exception as e:
+        summary["error"] = f"{type(e).__name__}: {e}"
+        # a partial export must not be mistaken for a finished one
+        if os.path.exists(tsv_file_path):
+            os.remove(tsv_file_path)
+    
+    summary["timings"]["total"] = time.perf_counter() - start
+    summary["stages"] = report.finish().to_dict()["stages"]
+    return summary
+
+def merge_stages(results: list[dict]) -> list[dict]:
+    """Sums per-file stage timings and rows into batch totals (worker seconds, not wall time)."""
+    totals = RunReport("batch")
+    for result in results:
+        for entry in result["stages"]:
+            totals.add(entry["stage"], entry["seconds"], entry["rows"])
+    return totals.to_dict()["stages"]
+
+def run_batch(
+    csv_files: list[str],
+    output_dir: str,
+    workers: int | None = None,
+    columns_to_clean: list[str] = COLUMNS_TO_CLEAN,
+    profile: bool = False,
+    reader: str = DEFAULT_CSV_READER,
+    export_format: str = DEFAULT_EXPORT_FORMAT
+) -> dict:
+    """
+    Cleans and exports every roster in a process pool.
+    
+    Args:
+        csv_files (list[str]): Rosters to process.
+        output_dir (str): Directory for the exported files and the summary.
+        workers (int | None): Worker processes (defaults to the CPU count).
+        columns_to_clean (list[str]): Database columns to resolve to IDs.
+        profile (bool): Process the files one by one in this process under cProfile and
+        tracemalloc, and add the hottest functions and peak memory to the summary.
+        reader (str): CSV reader for every file, see csv_readers.
+        export_format (str): Output format for every file, one of EXPORT_FORMATS.
+        
+    Returns:
+        dict: Batch summary with per-file results and overall throughput.
+        
+    Raises:
+        ValueError: If two rosters would be exported to the same file (see output_names).
+    """
+    resolve_export_format(export_format)
+    names = output_names(csv_files)
+    os.makedirs(output_dir, exist_ok=True)
+    workers = 1 if profile else workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    
+    results = []
+    def collect(result):
+        results.append(result)
+        status = "✓" if result["error"] is None else "✗"
+        detail = f"{result['rows']} rows" if result["error"] is None else result["error"]
+        print(f"  {status} {os.path.basename(result['file'])}: {detail} ({result['timings']['total']:.2f} s)")
+    
+    run_report = None
+    if profile:
+        # worker processes are invisible to cProfile, so profile an in-process run
+        run_report = RunReport("batch")
+        init_worker(columns_to_clean)
+        with profiled(run_report, dump_path=os.path.join(output_dir, PROFILE_FILE_NAME)):
+            for csv_file_path in csv_files:
+                collect(process_roster(
+                    csv_file_path, output_dir, columns_to_clean, reader, export_format, names[csv_file_path]
+                ))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(columns_to_clean,)) as pool:
+            futures = {
+                pool.submit(
+                    process_roster, csv_file_path, output_dir, columns_to_clean, reader, export_format, names[csv_file_path]
+                ): csv_file_path
+                for csv_file_path in csv_files
+            }
+            for future in as_completed(futures):
+                collect(future.result())
+    
+    elapsed = time.perf_counter() - start
+    results.sort(key=lambda result: result["file"])
+    total_rows = sum(result["rows"] for result in results)
+    
+    summary = {
+        "workers": workers,
+        "reader": reader,
+        "format": export_format,
+        "files": len(results),
+        "failed": sum(1 for result in results if result["error"] is not None),
+        "total_rows": total_rows,
+        "wall_time": elapsed,
+        "rows_per_sec": total_rows / elapsed if elapsed > 0 else 0.0,
+        "stages": merge_stages(results),
+        "results": results,
+    }
+    if run_report is not None:
+        summary["memory"] = run_report.memory
+        summary["profile"] = run_report.profile
+    with open(os.path.join(output_dir, SUMMARY_FILE_NAME), "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+    return summary
+
+def upload_batch(summary: dict) -> None:
+    """
+    Loads every successfully exported TSV or Parquet file into Snowflake over one pooled
+    session and records the per-file load report under results[i]["upload"].
+    """
+    with get_connection_manager().connection() as conn:
+        for result in summary["results"]:
+            if result["error"] is not None:
+                continue
+            try:
+                if result["output"].endswith(EXPORT_SUFFIXES[PARQUET_FORMAT]):
+                    result["upload"] = upload_parquet_via_stage(conn, result["output"])
+                else:
+                    result["upload"] = upload_tsv_via_stage(conn, result["output"])
+                print(f"  ✓ Uploaded {os.path.basename(result['output'])}: {result['upload']['rows_loaded']} rows")
+            except Exception as e:
+                result["upload"] = {"error": f"{type(e).__name__}: {e}"}
+                print(f"  ✗ Upload failed for {os.path.basename(result['output'])}: {e}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Clean and export a directory (or glob) of roster CSVs to TSV or Parquet.")
+    parser.add_argument("source", help="Directory of CSV files or a glob pattern, e.g. 'data/*.csv'")
+    parser.add_argument("-o", "--output-dir", default="data/batch_output", help="Where exports and the summary are written")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--upload", action="store_true", help="Load the exports into Snowflake after exporting")
+    parser.add_argument("--reader", choices=CSV_READERS, default=DEFAULT_CSV_READER,
+                        help=f"CSV reader (default: {DEFAULT_CSV_READER}); pandas pads short rows and skips whitespace-only lines")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default=DEFAULT_EXPORT_FORMAT, dest="export_format",
+                        help=f"Output format (default: {DEFAULT_EXPORT_FORMAT}); parquet and arrow are typed, compressed columnar files")
+    parser.add_argument("--profile", action="store_true",
+                        help="Run in-process under cProfile/tracemalloc and add a profile to the summary")
+    args = parser.parse_args()
+    if args.upload and args.export_format == ARROW_FORMAT:
+        parser.error("Snowflake cannot load Arrow IPC files; use --format tsv or parquet with --upload")
+    
+    csv_files = find_roster_files(args.source)
+    if not csv_files:
+        print(f"✗ No CSV files found for '{args.source}'")
+        return
+    
+    print(f"Processing {len(csv_files)} files with {args.workers or os.cpu_count()} workers...")
+    try:
+        summary = run_batch(
+            csv_files, args.output_dir, args.workers, profile=args.profile, reader=args.reader, export_format=args.export_format
+        )
+    except ValueError as e:
+        print(f"✗ {e}")
+        return
+    
+    if args.upload:
+        print("\nUploading to Snowflake...")
+        upload_batch(summary)
+        with open(os.path.join(args.output_dir, SUMMARY_FILE_NAME), "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2, default=str)
+    
+    print("\n" + "=" * 60)
+    print(f"Files: {summary['files']} ({summary['failed']} failed)")
+    print(f"Rows: {summary['total_rows']:,} in {summary['wall_time']:.2f} s ({summary['rows_per_sec']:,.0f} rows/sec)")
+    for entry in summary["stages"]:
+        rows = f" ({entry['rows']:,} rows)" if entry["rows"] else ""
+        print(f"  {entry['stage']:14} {entry['seconds']:8.2f} s{rows}")
+    if args.profile:
+        print(f"Peak traced memory: {summary['memory']['peak_bytes'] / 2**20:.1f} MiB")
+        for entry in summary["profile"][:10]:
+            print(f"  {entry['cumulative_seconds']:8.2f} s  {entry['function']}")
+        print(f"Full profile: {os.path.join(args.output_dir, PROFILE_FILE_NAME)}")
+    for result in summary["results"]:
+        weak = [
+            f"{tsv_col}<-'{entry['csv_column']}' ({entry['score']:.2f})"
+            for tsv_col, entry in result["header_mapping"].items()
+            if entry["csv_column"] is not None and entry["score"] < 1.0
+        ]
+        if weak:
+            print(f"  {os.path.basename(result['file'])} inexact header matches: {', '.join(weak)}")
+        for column_name, values in result["unmatched"].items():
+            print(f"  {os.path.basename(result['file'])} {column_name}: {len(values)} unmatched values")
+        for column_name, count in result["rejected"].items():
+            print(f"  {os.path.basename(result['file'])} {column_name}: {count} non-integer values exported as empty")
+        for column_name, report in result["fuzzy"].items():
+            print(
+                f"  {os.path.basename(result['file'])} {column_name}: {len(report['accepted'])} fuzzy matches accepted, "
+                f"{len(report['rejected'])} rejected"
+            )
+    print(f"Summary: {os.path.join(args.output_dir, SUMMARY_FILE_NAME)}")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
@@ -3,34 +3,91 @@ import pandas as pd
 import os
 import json
 import traceback
+from itertools import chain, islice
+from operator import itemgetter
 from difflib import get_close_matches
 from utils import *
+from resolution import ResolutionCache, ColumnResolver, build_value_lookup
+from vectorized import clean_rows_vectorized, is_rectangular
+from header_mapping import get_header_matcher
+from instrumentation import RunReport, timed_stage
+from csv_readers import CSV_READERS, DROP_IN_READERS, DEFAULT_CSV_READER, PYTHON_READER, read_rows, iter_rows
+from roster import Roster, read_roster, DEFAULT_ROSTER_READER
+from columnar_export import (
+    EXPORT_FORMATS, DEFAULT_EXPORT_FORMAT, TSV_FORMAT, PARQUET_FORMAT, ARROW_FORMAT, EXPORT_SUFFIXES,
+    COLUMNAR_CHUNK_SIZE, ColumnarWriter, resolve_export_format, export_path
+)
 
 COL_1, COL_2, COL_3 = "EVENT_ID", "SESSION_ID", "AGE"
 COL_4, COL_5, COL_6 = "GRADE", "ORG_ID", "GENDER_ID"
 COL_7, COL_8, COL_9 = "ETHNICITY_ID", "STUDENT_CODE", "POSTAL_CODE"
 COL_10, COL_11, COL_12 = "IS_RETURNING_STUDENT_FLAG", "STUDENT_FIRST_NAME", "STUDENT_LAST_NAME"
 
+TSV_HEADERS = [
+    COL_1, COL_2, COL_3,
+    COL_4, COL_5, COL_6,
+    COL_7, COL_8, COL_9,
+    COL_10, COL_11, COL_12
+]
+STREAM_CHUNK_SIZE = 10_000 # rows written per csv.writer.writerows call
+PROGRESS_INTERVAL = 5_000 # rows between progress callbacks
+
+ROW_BACKEND, PANDAS_BACKEND = "rows", "pandas"
+CLEANING_BACKENDS = [ROW_BACKEND, PANDAS_BACKEND]
+
+class OperationCancelled(Exception):
+    """Raised from a progress callback to stop a running clean or export."""
+
 # HELPER FUNCTIONS
 
-def readCSV(csv_file_path: str) -> list[list[str]] | None: 
+def readCSV(csv_file_path: str, reader: str = DEFAULT_CSV_READER) -> list[list[str]] | None: 
+    """
+    Reads a whole CSV file. Blank rows are skipped and everything stays a string.
+    
+    Args:
+        csv_file_path (str): Path to CSV file.
+        reader (str): "pyarrow", "pandas" or "python" (csv.reader), see csv_readers.
+        
+    Returns:
+        list[list[str]] | None: Rows with headers first, or None if the file could not be read.
+    """
     try:
-        with open(csv_file_path, mode='r', newline='', encoding='utf-8') as file:
-            csv_reader = csv.reader(file)
-            rows = []
-            for row in csv_reader:
-                if not row:
-                    continue
-                converted_row = []
-                for val in row:
-                    converted_row.append(str(val)) # everything stays a string
-                rows.append(converted_row)
-            return rows
+        return read_rows(csv_file_path, reader)
     except FileNotFoundError:
         print(f"Error: File '{csv_file_path}' not found!")
     except Exception as e:
         print(f"An error has occurred: {e}")
 
+def iter_csv_rows(csv_file_path: str, reader: str = DEFAULT_CSV_READER):
+    """
+    Lazily yields the rows of a CSV file, skipping blank rows. Everything stays a string.
+    Unlike readCSV, errors are raised to the caller and memory stays bounded.
+    
+    Args:
+        csv_file_path (str): Path to CSV file.
+        reader (str): "pyarrow", "pandas" or "python" (csv.reader), see csv_readers.
+        
+    Yields:
+        list[str]: One row at a time, headers first.
+    """
+    return iter_rows(csv_file_path, reader)
+
+def read_csv_headers(csv_file_path: str) -> list[str] | None:
+    """
+    Reads only the header row (first non-blank row) of a CSV file.
+    
+    Args:
+        csv_file_path (str): Path to CSV file.
+        
+    Returns:
+        list[str] | None: The header row, or None if the file is empty.
+    """
+    rows = iter_csv_rows(csv_file_path, PYTHON_READER)
+    try:
+        return next(rows, None)
+    finally:
+        rows.close()
+
 def pretty_print(rows: list[list]) -> None:
     """
     Prints a list of lists in a tabular format.
@@ -71,16 +128,15 @@ def find_column_by_name(target_column: str, csv_headers: list[str]) -> int | Non
         if target_column.upper() == csv_col.upper():
             return col_ind
         
-    # synonym matching
+    # synonym matching (uppercase synonym sets are precomputed by the mapping registry)
     try:
-        synonym_mapping = load_column_synonyms()
-        if target_column in synonym_mapping:
-            synonyms = synonym_mapping[target_column]
+        synonym_sets = load_column_synonym_sets()
+        if target_column in synonym_sets:
+            synonyms = synonym_sets[target_column]
             for col_ind, csv_col in enumerate(csv_headers):
                 if not csv_col:
                     continue
-                csv_col_upper = csv_col.upper()
-                if csv_col_upper in [syn.upper() for syn in synonyms]:
+                if csv_col.upper() in synonyms:
                     return col_ind
     except (FileNotFoundError, json.JSONDecodeError) as e:
         print(f"WARNING: Could not load column synonyms: {e}. Skipping synonym matching.")
@@ -89,83 +145,241 @@ def find_column_by_name(target_column: str, csv_headers: list[str]) -> int | Non
 
 # CORE FUNCTIONS
 
-def clean_column(column_name: str, raw_rows: list[list]) -> list[list [str]]: 
+COLUMNS_TO_CLEAN = ['GENDER_ID', 'ETHNICITY_ID', 'ORG_ID']
+
+class CleaningPipeline:
     """
-    Cleans a column by mapping its values to database IDs using exact match and substring matching.
+    Resolves several columns in a single pass over the rows.
     
-    Args:
-        column_name (str): The name of the column to clean (e.g., "GENDER_ID", "ETHNICITY_ID", "ORG_ID")
-        raw_rows (list[list]): The CSV data with headers in the first row
-        
-    Returns:
-        list[list[str]]: Updated rows with cleaned values replaced by their database IDs
+    Chaining clean_column once per column copies the whole table once per column;
+    the pipeline touches (and optionally copies) every row exactly once.
     """
-    # get mappings from key_ids.json
-    mappings = create_mapping(column_name)
+    def __init__(
+        self,
+        columns: list[str] = COLUMNS_TO_CLEAN,
+        column_positions: dict[str, int] | None = None,
+        caches: dict[str, ResolutionCache] | None = None
+    ):
+        """
+        Args:
+            columns (list[str]): Database columns to clean (e.g., ["GENDER_ID", "ETHNICITY_ID", "ORG_ID"])
+            column_positions (dict[str, int] | None): Known CSV positions, e.g. from manual mapping.
+            Columns not listed here are located with the single-pass HeaderMatcher.
+            caches (dict[str, ResolutionCache] | None): Resolution cache per column. Missing entries get a fresh cache.
+        """
+        self.columns = list(columns)
+        self.column_positions = dict(column_positions or {})
+        caches = caches if caches is not None else {}
+        self.resolvers = {
+            column_name: ColumnResolver(column_name, caches.get(column_name))
+            for column_name in self.columns
+        }
+        self.rows_processed = 0
+        self._targets = []
     
-    # load value synonyms
-    try:
-        value_synonyms = load_value_synonyms()
-    except (FileNotFoundError, json.JSONDecodeError) as e:
-        print(f"WARNING: Could not load value synonyms: {e}. Using only exact matching.")
-        value_synonyms = {}
+    @property
+    def caches(self) -> dict[str, ResolutionCache]:
+        return {column_name: resolver.cache for column_name, resolver in self.resolvers.items()}
+    
+    def prepare(self, csv_headers: list[str]) -> list[str]:
+        """
+        Locates every configured column in the CSV headers.
+        
+        Args:
+            csv_headers (list[str]): Header row of the CSV
+            
+        Returns:
+            list[str]: Columns that could not be found. They are skipped when cleaning
+            unless a position is supplied through column_positions before calling prepare again.
+        """
+        missing = []
+        self._targets = []
+        self._target_resolvers = []
+        # locate every column without a known position in one pass over the headers
+        auto_columns = [column_name for column_name in self.columns if column_name not in self.column_positions]
+        found = {}
+        if auto_columns:
+            taken = set(self.column_positions.values())
+            found = load_header_matcher(auto_columns).match(csv_headers, exclude=taken)
+        for column_name in self.columns:
+            col_pos = self.column_positions.get(column_name)
+            if col_pos is None and column_name in found:
+                col_pos = found[column_name]["index"]
+            if col_pos is None:
+                missing.append(column_name)
+                continue
+            self.column_positions[column_name] = col_pos
+            self._targets.append((col_pos, self.resolvers[column_name].resolve))
+            self._target_resolvers.append((col_pos, self.resolvers[column_name]))
+        return missing
+    
+    def clean_row(self, row: list[str], in_place: bool = False) -> list[str]:
+        new_row = row if in_place else row[:]
+        for col_pos, resolve in self._targets:
+            new_row[col_pos] = resolve(row[col_pos])
+        self.rows_processed += 1
+        return new_row
+    
+    def clean_rows(self, rows, in_place: bool = False):
+        """
+        Lazily cleans an iterable of data rows (no header). Call prepare first.
+        """
+        for row in rows:
+            yield self.clean_row(row, in_place)
+    
+    def run(
+        self,
+        raw_rows: list[list[str]],
+        in_place: bool = False,
+        progress_callback=None,
+        backend: str = ROW_BACKEND,
+        report: RunReport | None = None
+    ) -> list[list[str]]:
+        """
+        Cleans a full table (headers in the first row). Call prepare first.
+        
+        Args:
+            raw_rows (list[list[str]]): The CSV data with headers in the first row
+            in_place (bool): Update the given rows instead of copying each row once (row backend only)
+            progress_callback (Callable[[int], None] | None): Called with the number of rows
+            processed every PROGRESS_INTERVAL rows. Raise OperationCancelled from it to stop.
+            backend (str): Engine for a list of rows: "rows" for the per-row engine, "pandas"
+            for the columnar engine, which resolves each distinct value once and is faster
+            on large lists (see benchmarks/bench_backends.py). Ragged lists (rows of
+            different lengths) always use the row engine. It doesn't apply to a Roster,
+            which is already columnar and always cleaned on its dictionaries; the GUI and
+            read_roster callers therefore never choose a backend.
+            report (RunReport | None): Records the run as a "clean" stage, and the engine
+            that actually ran ("roster", "pandas" or "rows") as meta["backend"].
+        
+        Returns:
+            list[list[str]]: Header row followed by cleaned rows. With in_place=True the
+            original row lists are updated and returned instead of copies.
+        
+        Raises:
+            ValueError: If the backend is unknown.
+        """
+        if backend not in CLEANING_BACKENDS:
+            raise ValueError(f"Unknown cleaning backend '{backend}'! Expected one of {CLEANING_BACKENDS}")
+        
+        with timed_stage(report, "clean", len(raw_rows) - 1):
+            cleaned, engine = self._run(raw_rows, in_place, progress_callback, backend)
+        self.report_unmatched()
+        if report is not None:
+            report.meta["backend"] = engine
+            report.meta["caches"] = {column_name: cache.stats() for column_name, cache in self.caches.items()}
+        return cleaned
+    
+    def report_unmatched(self) -> None:
+        """Prints one line per column listing the values that were kept as they are."""
+        for resolver in self.resolvers.values():
+            message = resolver.format_unmatched()
+            if message is not None:
+                print(message)
+    
+    def _run(self, raw_rows, in_place, progress_callback, backend) -> tuple:
+        """Returns the cleaned table and the name of the engine that cleaned it."""
+        if isinstance(raw_rows, Roster):
+            return self._run_roster(raw_rows, in_place, progress_callback), "roster"
+        
+        if backend == PANDAS_BACKEND and is_rectangular(raw_rows):
+            cleaned = clean_rows_vectorized(raw_rows, self._target_resolvers)
+            self.rows_processed += len(raw_rows) - 1
+            if progress_callback is not None:
+                progress_callback(len(raw_rows) - 1)
+            return cleaned, PANDAS_BACKEND
         
-    # build normalized lookup table: normalized_value -> data_id
-    # this includes both canonical values and their synonyms
-    normalized_lookup = {}
+        clean_row = self.clean_row
+        cleaned = raw_rows if in_place else [raw_rows[0]]
+        total = len(raw_rows)
+        
+        for start in range(1, total, PROGRESS_INTERVAL):
+            chunk = raw_rows[start:start + PROGRESS_INTERVAL]
+            if in_place:
+                for row in chunk:
+                    clean_row(row, in_place=True)
+            else:
+                cleaned.extend([clean_row(row) for row in chunk])
+            if progress_callback is not None:
+                progress_callback(min(start + PROGRESS_INTERVAL, total) - 1)
+        return cleaned, ROW_BACKEND
     
-    for original_key, data_id in mappings.items():
-        # add the canonical form from database
-        normalized_lookup[normalize(original_key)] = data_id
+    def _run_roster(self, roster: Roster, in_place: bool, progress_callback) -> Roster:
+        # each distinct value is resolved once; the row codes are reused as they are
+        cleaned = roster
+        targets = [(col_pos, resolver) for col_pos, resolver in self._target_resolvers if col_pos < roster.width]
+        for number, (col_pos, resolver) in enumerate(targets):
+            column_progress = None
+            if progress_callback is not None:
+                # each column is an equal share of the rows, whatever its number of distinct values
+                def column_progress(done, total, number=number):
+                    progress_callback(int(roster.num_rows * (number + done / total) / len(targets)))
+            cache = resolver.cache
+            lookups = cache.hits + cache.misses
+            cleaned = cleaned.map_column(
+                col_pos, resolver.resolve, in_place=in_place or cleaned is not roster, progress_callback=column_progress
+            )
+            # rows that shared an already resolved dictionary entry count as cache hits
+            cache.record_hits(roster.num_rows - (cache.hits + cache.misses - lookups))
+        self.rows_processed += roster.num_rows
+        if progress_callback is not None:
+            progress_callback(roster.num_rows)
+        return cleaned
+    
+
+def clean_table(
+    raw_rows: list[list[str]],
+    columns: list[str] = COLUMNS_TO_CLEAN,
+    in_place: bool = False,
+    caches: dict[str, ResolutionCache] | None = None,
+    backend: str = ROW_BACKEND
+) -> list[list[str]]:
+    """
+    Cleans all configured columns in one pass over the rows.
+    
+    Args:
+        raw_rows (list[list[str]]): The CSV data with headers in the first row
+        columns (list[str]): Database columns to clean
+        in_place (bool): Update the given rows instead of copying each row once
+        caches (dict[str, ResolutionCache] | None): Resolution cache per column, for reading stats afterwards
+        backend (str): "rows" (per-row engine) or "pandas" (columnar engine), see CleaningPipeline.run.
+        This list-of-rows entry point is where the choice applies; a Roster has its own columnar path.
         
-        # add synonyms if they exist for this column and value
-        if column_name in value_synonyms and original_key in value_synonyms[column_name]:
-            for synonym in value_synonyms[column_name][original_key]:
-                normalized_lookup[normalize(synonym)] = data_id
-                
-    # find which column to clean
+    Returns:
+        list[list[str]]: Updated rows with cleaned values replaced by their database IDs
+    """
+    pipeline = CleaningPipeline(columns, caches=caches)
     csv_headers = raw_rows[0]
-    col_pos = find_column_by_name(column_name, csv_headers)
     
     # ask user manually if col not found
-    # If still not found, ask user manually
-    if col_pos is None:
+    for column_name in pipeline.prepare(csv_headers):
         input_col_name = input(
             f"Column {column_name} not found! Please enter the name of the column closest to '{column_name}' on the CSV file: "
         )
         col_pos = manual_find_column(input_col_name, csv_headers)
+        if col_pos is not None:
+            pipeline.column_positions[column_name] = col_pos
+    pipeline.prepare(csv_headers)
+    
+    return pipeline.run(raw_rows, in_place, backend=backend)
+
+def clean_column(column_name: str, raw_rows: list[list], cache: ResolutionCache | None = None) -> list[list [str]]: 
+    """
+    Cleans a column by mapping its values to database IDs using exact match and substring matching.
+    Each distinct raw value is resolved once and memoized in `cache`.
+    Prefer clean_table when cleaning several columns of the same rows.
+    
+    Args:
+        column_name (str): The name of the column to clean (e.g., "GENDER_ID", "ETHNICITY_ID", "ORG_ID")
+        raw_rows (list[list]): The CSV data with headers in the first row
+        cache (ResolutionCache | None): Resolution cache for this column. Pass one in to read its
+        hit/miss stats afterwards; a fresh cache is used if omitted.
         
-    # process rows and clean values
-    first_row = raw_rows[0]
-    updated_rows = [first_row]
-    
-    for row in raw_rows[1:]:
-        new_row = row[:]
-        raw_value = row[col_pos]
-        normalized_value = normalize(raw_value)
-        
-        #FIXME keep raw value if org name doesnt exist in database!
-        
-        # 1) check for exact match on normalized value (includes all synonyms)
-        data_id = normalized_lookup.get(normalized_value)
-        
-        # 2) substring scan on normalized keys
-        # this handles cases like "Hispanic" matching "Hispanic or Latino"
-        if data_id is None:
-            for key, value in normalized_lookup.items():
-                if key in normalized_value or normalized_value in key:
-                    data_id = value
-                    break
-        
-        # if no match found, keep original value
-        if data_id is None: 
-            print(f"No match found for '{raw_value}'. Keeping original value.")
-            data_id = raw_value
-            
-        new_row[col_pos] = str(data_id)  # Convert to string for CSV consistency
-        updated_rows.append(new_row)
-        
-    return updated_rows
+    Returns:
+        list[list[str]]: Updated rows with cleaned values replaced by their database IDs
+    """
+    caches = {column_name: cache} if cache is not None else None
+    return clean_table(raw_rows, [column_name], caches=caches)
 
 def create_tsv_with_headers(file_path: str) -> bool:
     """"
@@ -223,24 +437,62 @@ def map_csv_to_tsv_columns(csv_file_path: str) -> dict[str, str | None] | None:
     if not os.path.exists(csv_file_path):
         raise FileNotFoundError(f"File '{csv_file_path}' does not exist!")
     
-    tsv_headers = [
-        COL_1, COL_2, COL_3,
-        COL_4, COL_5, COL_6,
-        COL_7, COL_8, COL_9,
-        COL_10, COL_11, COL_12
-    ]
-    
-    # read in CSV headers
+    # read in CSV headers (only the first line is read)
     try:
-        csv_rows = readCSV(csv_file_path)
+        csv_headers = read_csv_headers(csv_file_path)
     except Exception as e:
         raise IOError(f"Error reading CSV file: {e}") from e
     
-    if csv_rows is None or len(csv_rows) == 0:
+    if csv_headers is None:
         raise IOError("Could not read CSV file or file is empty!")
     
-    csv_headers = csv_rows[0]
+    return map_headers_to_tsv_columns(csv_headers)
+
+def map_headers_to_tsv_columns(csv_headers: list[str]) -> dict[str, str | None]:
+    """
+    Maps an in-memory CSV header row to TSV column names. Same rules as map_csv_to_tsv_columns,
+    for callers that already hold the rows.
+
+    Args:
+        csv_headers (list[str]): Header row of the CSV.
+
+    Returns:
+        dict[str, str | None]: Dictionary mapping TSV column names to CSV column names.
+    
+    Raises:
+        ValueError: If the header row is empty or looks like data.
+    """
+    column_mapping, _ = map_headers_with_report(csv_headers)
+    return column_mapping
+
+def load_header_matcher(targets: list[str] = TSV_HEADERS):
+    """
+    Returns the HeaderMatcher for targets, built from column_synonyms.json (exact
+    matching only if the synonyms can't be loaded).
+    """
+    try:
+        synonyms = load_column_synonyms()
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        print(f"WARNING: Could not load synonyms: {e}. Using exact matching only.")
+        synonyms = {}
+    return get_header_matcher(targets, synonyms)
+
+def map_headers_with_report(csv_headers: list[str]) -> tuple[dict[str, str | None], dict[str, dict]]:
+    """
+    Maps all TSV columns at once with the single-pass HeaderMatcher.
+
+    Args:
+        csv_headers (list[str]): Header row of the CSV.
+
+    Returns:
+        tuple[dict[str, str | None], dict[str, dict]]: (TSV column -> CSV column, confidence
+        report). The report has, per TSV column, the CSV column, its score (1.0 exact,
+        0.9 synonym, 0.75 punctuation-insensitive, 0.0 unmapped), the match kind and the
+        other CSV columns that also matched.
     
+    Raises:
+        ValueError: If the header row is empty or looks like data.
+    """
     # check if csv headers is empty
     if ( # checking if first row is just data or actual headers
         not csv_headers
@@ -254,42 +506,177 @@ def map_csv_to_tsv_columns(csv_file_path: str) -> dict[str, str | None] | None:
     csv_headers = [str(header).strip() for header in csv_headers]
     if '' in csv_headers:
         print("Warning: CSV contains empty column headers!")
-        
-    column_mapping = {}
-    used_csv_columns = set()
     
     print("\n=== Column Mapping ===")
     print(f"CSV has {len(csv_headers)} columns")
-    print(f"TSV expects {len(tsv_headers)} columns")
+    print(f"TSV expects {len(TSV_HEADERS)} columns")
     print("\nCSV Columns:", ", ".join(csv_headers))
     print()
     
-    # automatic mapping using find_column_by_name helper
-    for tsv_col in tsv_headers:
-        col_index = find_column_by_name(tsv_col, csv_headers)
+    report = load_header_matcher().match(csv_headers)
+    for entry in report.values():
+        del entry["index"]
+    column_mapping = {tsv_col: report[tsv_col]["csv_column"] for tsv_col in TSV_HEADERS}
+    return column_mapping, report
+
+def build_tsv_projection(csv_headers: list[str], column_mapping: dict[str, str | None]) -> list[int | None]:
+    """
+    Resolves a column mapping into CSV indexes, one per TSV column (None -> empty value).
+    
+    Args:
+        csv_headers (list[str]): Header row of the CSV.
+        column_mapping (dict[str, str | None]): Mapping from TSV columns to CSV columns.
         
-        if col_index is not None:
-            csv_col = csv_headers[col_index]
-            # Check if this CSV column was already used
-            if csv_col not in used_csv_columns:
-                column_mapping[tsv_col] = csv_col
-                used_csv_columns.add(csv_col)
-            else:
-                # Column already mapped, mark as not found
-                column_mapping[tsv_col] = None
+    Returns:
+        list[int | None]: CSV index for each TSV column, in TSV_HEADERS order.
+    """
+    csv_col_to_index = {col: idx for idx, col in enumerate(csv_headers)}
+    projection = []
+    for tsv_col in TSV_HEADERS:
+        csv_col = column_mapping[tsv_col]
+        
+        # use empty str if no mapping found
+        if csv_col is None:
+            projection.append(None)
+        elif csv_col in csv_col_to_index:
+            projection.append(csv_col_to_index[csv_col])
         else:
-            column_mapping[tsv_col] = None
+            print(f"Warning: Mapped column '{csv_col}' not found in CSV headers!")
+            projection.append(None)
+    return projection
+
+def project_row(csv_row: list[str], projection: list[int | None]) -> list[str]:
+    # if csv row is shorter than expected, the value is left empty
+    row_len = len(csv_row)
+    return [
+        csv_row[idx].strip() if idx is not None and idx < row_len else ''
+        for idx in projection
+    ]
+
+def write_tsv_rows(
+    rows,
+    tsv_file_path: str,
+    projection: list[int | None],
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    progress_callback=None
+) -> int:
+    """
+    Writes data rows to a TSV file incrementally, projecting each row onto the TSV columns.
+    Only one chunk of rows is held in memory at a time.
+    
+    Args:
+        rows (Iterable[list[str]]): Data rows (no header).
+        tsv_file_path (str): Path to the destination TSV file.
+        projection (list[int | None]): Output of build_tsv_projection.
+        chunk_size (int): Rows per write call.
+        progress_callback (Callable[[int], None] | None): Called with the number of rows
+        written after each chunk. Raise OperationCancelled from it to stop.
         
-    return column_mapping
+    Returns:
+        int: Number of data rows written.
+    """
+    rows = iter(rows)
+    written = 0
+    with open(tsv_file_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, delimiter='\t', lineterminator=os.linesep)
+        writer.writerow(TSV_HEADERS)
+        while True:
+            chunk = [project_row(row, projection) for row in islice(rows, chunk_size)]
+            if not chunk:
+                break
+            writer.writerows(chunk)
+            written += len(chunk)
+            if progress_callback is not None:
+                progress_callback(written)
+    return written
+
+def write_columnar_rows(
+    rows,
+    file_path: str,
+    projection: list[int | None],
+    export_format: str = PARQUET_FORMAT,
+    chunk_size: int = COLUMNAR_CHUNK_SIZE,
+    progress_callback=None,
+    compression: str | None = None
+) -> tuple[int, dict[str, int]]:
+    """
+    Writes data rows to a typed Parquet or Arrow IPC file (see columnar_export),
+    projecting each row onto the TSV columns, one record batch per chunk.
+    
+    Args:
+        rows (Iterable[list[str]]): Data rows (no header).
+        file_path (str): Path to the destination file.
+        projection (list[int | None]): Output of build_tsv_projection.
+        export_format (str): PARQUET_FORMAT or ARROW_FORMAT.
+        chunk_size (int): Rows per record batch.
+        progress_callback (Callable[[int], None] | None): See write_tsv_rows.
+        compression (str | None): Codec, defaults to PARQUET_COMPRESSION or ARROW_COMPRESSION.
+        
+    Returns:
+        tuple[int, dict[str, int]]: Number of data rows written, and per integer column the
+        number of values that were not integers and were written as nulls (columns without
+        any are left out).
+    """
+    rows = iter(rows)
+    needed = max((idx for idx in projection if idx is not None), default=-1) + 1
+    getters = [None if idx is None else itemgetter(idx) for idx in projection]
+    with ColumnarWriter(file_path, TSV_HEADERS, export_format, compression) as writer:
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            if min(map(len, chunk)) >= needed:
+                # pick each column straight out of the rows; the writer strips the values
+                writer.write_columns([None if get is None else list(map(get, chunk)) for get in getters], len(chunk))
+            else:
+                writer.write_rows([project_row(row, projection) for row in chunk])
+            if progress_callback is not None:
+                progress_callback(writer.rows_written)
+    rejected = {column_name: count for column_name, count in writer.rejected.items() if count}
+    for column_name, count in rejected.items():
+        print(f"Warning: {count} {column_name} values are not integers and were exported as empty.")
+    return writer.rows_written, rejected
 
-def transfer_csv_to_tsv_with_mapping(csv_file_path: str, tsv_file_path: str, column_mapping: dict[str, str | None]) -> bool:
+def write_export_rows(
+    rows,
+    file_path: str,
+    projection: list[int | None],
+    export_format: str = DEFAULT_EXPORT_FORMAT,
+    chunk_size: int | None = None,
+    progress_callback=None
+) -> tuple[int, dict[str, int]]:
+    """
+    Writes data rows as TSV (write_tsv_rows) or a columnar file (write_columnar_rows).
+    chunk_size defaults to each writer's own.
+    
+    Returns:
+        tuple[int, dict[str, int]]: Rows written and the values written as nulls per integer
+        column, see write_columnar_rows (always empty for TSV, which keeps values as text).
+    
+    Raises:
+        ValueError: If the export format is unknown.
+    """
+    if resolve_export_format(export_format) == TSV_FORMAT:
+        return write_tsv_rows(rows, file_path, projection, chunk_size or STREAM_CHUNK_SIZE, progress_callback), {}
+    return write_columnar_rows(
+        rows, file_path, projection, export_format, chunk_size or COLUMNAR_CHUNK_SIZE, progress_callback
+    )
+
+def transfer_csv_to_tsv_with_mapping(
+    csv_file_path: str,
+    tsv_file_path: str,
+    column_mapping: dict[str, str | None],
+    export_format: str = DEFAULT_EXPORT_FORMAT
+) -> bool:
     """
     Transfers data from CSV to TSV using the provided column mapping.
+    Rows are streamed from the CSV to the TSV, so memory stays bounded.
     
     Args:
         csv_file_path (str): Path to the source CSV file.
         tsv_file_path (str): Path to the destination TSV file.
         column_mapping (dict[str, str | None]): Mapping from TSV columns to CSV columns.
+        export_format (str): One of EXPORT_FORMATS; tsv_file_path is used as given.
     
     Returns:
         bool: True if transfer successful, False otherwise.
@@ -300,61 +687,27 @@ def transfer_csv_to_tsv_with_mapping(csv_file_path: str, tsv_file_path: str, col
     """
     try:
         # read CSV file and error handling
-        tsv_headers = [
-            COL_1, COL_2, COL_3,
-            COL_4, COL_5, COL_6,
-            COL_7, COL_8, COL_9,
-            COL_10, COL_11, COL_12
-        ]
-        
-        csv_rows = readCSV(csv_file_path)
+        try:
+            csv_rows = iter_csv_rows(csv_file_path)
+            csv_headers = next(csv_rows, None)
+        except OSError as e:
+            raise IOError(f"Failed to read CSV file: {csv_file_path}") from e
         
-        if csv_rows is None:
-            raise IOError(f"Failed to read CSV file: {csv_file_path}")
-        if len(csv_rows) < 1:
+        if csv_headers is None:
             raise IOError(f"CSV file is empty: {csv_file_path}")
         
-        csv_headers = csv_rows[0]
-        csv_data = csv_rows[1:]
-        
-        if len(csv_data) == 0:
+        first_row = next(csv_rows, None)
+        if first_row is None:
             raise IOError(f"CSV file has headers but no data rows: {csv_file_path}")
         
-        # mapping for csv col to index
-        csv_col_to_index = {col: idx for idx, col in enumerate(csv_headers)}
-        
-        tsv_data = []
+        projection = build_tsv_projection(csv_headers, column_mapping)
         
         # processing logic
-        for row_idx, csv_row in enumerate(csv_data, start=2):
-            tsv_row = []
-            
-            for tsv_col in tsv_headers:
-                csv_col = column_mapping[tsv_col]
-                
-                # use empty str if no mapping found
-                if csv_col is None:
-                    tsv_row.append('')
-                elif csv_col in csv_col_to_index:
-                    csv_idx = csv_col_to_index[csv_col]
-                    # if csv row is shorter than expected
-                    if csv_idx < len(csv_row):
-                        tsv_row.append(csv_row[csv_idx].strip())
-                    else:
-                        tsv_row.append('')
-                else:
-                    print(f"Warning: Mapped column '{csv_col}' not found in CSV headers!")
-                    tsv_row.append('')
-                    
-            tsv_data.append(tsv_row)
-        
-        # write to TSV file
-        df = pd.DataFrame(tsv_data, columns=tsv_headers)
-        df.to_csv(tsv_file_path, sep="\t", index=False)
+        written, _ = write_export_rows(chain([first_row], csv_rows), tsv_file_path, projection, export_format)
         
         # Verify the file was created
         if os.path.exists(tsv_file_path) and os.path.getsize(tsv_file_path) > 0:
-            print(f"Success! Transferred {len(tsv_data)} rows to {tsv_file_path}")
+            print(f"Success! Transferred {written} rows to {tsv_file_path}")
             return True
         else:
             raise IOError(f"Failed to create TSV file or file is empty: {tsv_file_path}")
@@ -365,10 +718,149 @@ def transfer_csv_to_tsv_with_mapping(csv_file_path: str, tsv_file_path: str, col
         print(traceback.format_exc())
         return False
 
+def transfer_rows_to_tsv_with_mapping(
+    rows,
+    tsv_file_path: str,
+    column_mapping: dict[str, str | None],
+    progress_callback=None,
+    report: RunReport | None = None,
+    export_format: str = DEFAULT_EXPORT_FORMAT
+) -> bool:
+    """
+    Transfers in-memory rows to TSV using the provided column mapping, without a CSV round trip.
+    
+    Args:
+        rows (Iterable[list[str]]): Rows with headers first, e.g. cleaned data or a row iterator.
+        tsv_file_path (str): Path to the destination TSV file.
+        column_mapping (dict[str, str | None]): Mapping from TSV columns to CSV columns.
+        progress_callback (Callable[[int], None] | None): See write_tsv_rows.
+        report (RunReport | None): Records the write as a "write_<format>" stage, and in
+        meta["rejected"] the values written as nulls per integer column.
+        export_format (str): One of EXPORT_FORMATS; tsv_file_path is used as given.
+    
+    Returns:
+        bool: True if transfer successful, False otherwise.
+    
+    Raises:
+        OperationCancelled: If the progress callback cancels the transfer.
+    """
+    try:
+        rows = iter(rows)
+        csv_headers = next(rows, None)
+        if csv_headers is None:
+            raise IOError("No rows to transfer!")
+        
+        first_row = next(rows, None)
+        if first_row is None:
+            raise IOError("Rows have headers but no data rows!")
+        
+        projection = build_tsv_projection(csv_headers, column_mapping)
+        with timed_stage(report, f"write_{export_format}") as stage:
+            written, rejected = write_export_rows(
+                chain([first_row], rows), tsv_file_path, projection, export_format, progress_callback=progress_callback
+            )
+            stage["rows"] = written
+        if report is not None:
+            report.meta["rejected"] = rejected
+        
+        if os.path.exists(tsv_file_path) and os.path.getsize(tsv_file_path) > 0:
+            print(f"Success! Transferred {written} rows to {tsv_file_path}")
+            return True
+        else:
+            raise IOError(f"Failed to create TSV file or file is empty: {tsv_file_path}")
+        
+    except OperationCancelled:
+        raise
+    except Exception as e:
+        print(f"Error! Failed to transfer data: {e}")
+        print("TRACEBACK:")
+        print(traceback.format_exc())
+        return False
+
+def stream_csv_to_tsv(
+    csv_file_path: str,
+    tsv_file_path: str,
+    column_mapping: dict[str, str | None] | None = None,
+    columns_to_clean: list[str] = COLUMNS_TO_CLEAN,
+    caches: dict[str, ResolutionCache] | None = None,
+    chunk_size: int | None = None,
+    pipeline: CleaningPipeline | None = None,
+    report: RunReport | None = None,
+    reader: str = DEFAULT_CSV_READER,
+    export_format: str = DEFAULT_EXPORT_FORMAT
+) -> int:
+    """
+    Reads, cleans and writes a roster in one streaming pass with bounded memory:
+    rows are read lazily, cleaned with a CleaningPipeline, projected onto the TSV
+    columns and written in chunks.
+    
+    Args:
+        csv_file_path (str): Path to the raw CSV file.
+        tsv_file_path (str): Path to the destination TSV file.
+        column_mapping (dict[str, str | None] | None): Mapping from TSV columns to CSV columns.
+        Computed with map_csv_to_tsv_columns if omitted.
+        columns_to_clean (list[str]): Database columns to resolve to IDs.
+        caches (dict[str, ResolutionCache] | None): Resolution cache per column, for reading stats afterwards.
+        chunk_size (int | None): Rows per write call, defaults to the writer's own.
+        pipeline (CleaningPipeline | None): Pipeline to clean with, e.g. to inspect its resolvers
+        afterwards. Overrides columns_to_clean and caches.
+        report (RunReport | None): Records map_headers, prepare, read_csv, clean and write_<format>
+        stages. Reading, cleaning and writing are interleaved, so each row is timed as it
+        passes through; leave it out for the fastest run. meta["rejected"] gets the values
+        written as nulls per integer column (see write_columnar_rows).
+        reader (str): CSV reader, see csv_readers.
+        export_format (str): One of EXPORT_FORMATS; tsv_file_path is used as given.
+        
+    Returns:
+        int: Number of data rows written.
+        
+    Raises:
+        IOError: If the CSV file is empty.
+        ValueError: If the export format is unknown.
+    """
+    resolve_export_format(export_format)
+    if column_mapping is None:
+        with timed_stage(report, "map_headers"):
+            column_mapping = map_csv_to_tsv_columns(csv_file_path)
+    
+    csv_rows = iter_csv_rows(csv_file_path, reader)
+    csv_headers = next(csv_rows, None)
+    if csv_headers is None:
+        raise IOError(f"CSV file is empty: {csv_file_path}")
+    
+    with timed_stage(report, "prepare"):
+        if pipeline is None:
+            pipeline = CleaningPipeline(columns_to_clean, caches=caches)
+        for column_name in pipeline.prepare(csv_headers):
+            print(f"Warning: Column {column_name} not found in CSV headers. Leaving it uncleaned.")
+        projection = build_tsv_projection(csv_headers, column_mapping)
+    
+    if report is None:
+        # rows are cleaned in place: each row object is only alive for one chunk
+        written, _ = write_export_rows(
+            pipeline.clean_rows(csv_rows, in_place=True), tsv_file_path, projection, export_format, chunk_size
+        )
+        pipeline.report_unmatched()
+        return written
+    
+    write_stage = f"write_{export_format}"
+    cleaned_rows = report.count(pipeline.clean_rows(report.count(csv_rows, "read_csv"), in_place=True), "clean")
+    with report.stage(write_stage) as stage:
+        written, rejected = write_export_rows(cleaned_rows, tsv_file_path, projection, export_format, chunk_size)
+        stage["rows"] = written
+    # each stage above pulled rows through the one before it
+    report.nest(write_stage, "clean")
+    pipeline.report_unmatched()
+    report.nest("clean", "read_csv")
+    report.meta["caches"] = {column_name: cache.stats() for column_name, cache in pipeline.caches.items()}
+    report.meta["reader"] = reader
+    report.meta["rejected"] = rejected
+    return written
+
 
 def main():
     """
-    Simple test flow: Read CSV -> Clean columns -> Map columns -> Transfer to TSV
+    Simple test flow: Map columns -> Stream (read -> clean -> transfer) to TSV
     """
     print("=" * 60)
     print("CSV TO TSV CONVERTER - TESTING FLOW")
@@ -377,40 +869,13 @@ def main():
     # File paths
     csv_file_path = "data/Uncommon_Goods_Student_Demographics.csv"
     tsv_file_path = "data/Uncommon_Good_Student_Demographics.tsv"
-    temp_csv_path = csv_file_path.replace('.csv', '_cleaned.csv')
-    
-    # Step 1: Read CSV
-    print("\n[1/4] Reading CSV file...")
-    csv_rows = readCSV(csv_file_path)
-    if not csv_rows:
-        print("✗ Failed to read CSV")
-        return
-    print(f"✓ Read {len(csv_rows)} rows (including header)")
-    
-    # Step 2: Clean columns
-    print("\n[2/4] Cleaning columns (GENDER_ID, ETHNICITY_ID, ORG_ID)...")
-    columns_to_clean = ['GENDER_ID', 'ETHNICITY_ID', 'ORG_ID']
-    cleaned_rows = csv_rows
     
-    for column_name in columns_to_clean:
-        try:
-            print(f"  → Cleaning {column_name}...")
-            cleaned_rows = clean_column(column_name, cleaned_rows)
-            print(f"  ✓ {column_name} cleaned")
-        except Exception as e:
-            print(f"  ✗ Failed to clean {column_name}: {e}")
-    
-    # Save cleaned CSV
-    with open(temp_csv_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerows(cleaned_rows)
-    print(f"✓ Cleaned data saved to: {temp_csv_path}")
-    
-    # Step 3: Map columns
-    print("\n[3/4] Mapping CSV columns to TSV columns...")
-    column_mapping = map_csv_to_tsv_columns(temp_csv_path)
-    if not column_mapping:
-        print("✗ Failed to map columns")
+    # Step 1: Map columns (cleaning only changes values, so the raw headers are used)
+    print("\n[1/2] Mapping CSV columns to TSV columns...")
+    try:
+        column_mapping = map_csv_to_tsv_columns(csv_file_path)
+    except (ValueError, IOError) as e:
+        print(f"✗ Failed to map columns: {e}")
         return
     
     # Show mapping results
@@ -420,14 +885,23 @@ def main():
         status = f"→ {csv_col}" if csv_col else "✗ NOT FOUND"
         print(f"  {tsv_col:30} {status}")
     
-    # Step 4: Transfer to TSV
-    print("\n[4/4] Transferring data to TSV...")
-    success = transfer_csv_to_tsv_with_mapping(temp_csv_path, tsv_file_path, column_mapping)
+    # Step 2: Read, clean and write in one streaming pass
+    print(f"\n[2/2] Streaming rows to TSV, cleaning {', '.join(COLUMNS_TO_CLEAN)}...")
+    caches = {column_name: ResolutionCache() for column_name in COLUMNS_TO_CLEAN}
+    try:
+        written = stream_csv_to_tsv(csv_file_path, tsv_file_path, column_mapping, COLUMNS_TO_CLEAN, caches)
+        success = True
+    except Exception as e:
+        print(f"✗ Failed to stream rows: {e}")
+        success = False
     
     # Final summary
     print("\n" + "=" * 60)
     if success:
-        print("✓ SUCCESS! All steps completed")
+        for column_name, cache in caches.items():
+            stats = cache.stats()
+            print(f"  {column_name}: {stats['misses']} distinct values, {stats['hit_rate']:.0%} cache hits")
+        print(f"✓ SUCCESS! Wrote {written} rows")
         print(f"Output file: {tsv_file_path}")
     else:
         print("✗ FAILED during transfer step")
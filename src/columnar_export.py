@@ -0,0 +1,161 @@
+"""
+Typed columnar exports of the EVENT_STUDENT_DEMOGRAPHIC table, next to the TSV:
+
+    tsv      tab separated text, every value a string (write_tsv_rows in cleaner)
+    parquet  Parquet, zstd compressed by default. Snowflake loads it with COPY INTO
+             ... MATCH_BY_COLUMN_NAME (see snowflake_upload.upload_parquet_via_stage).
+    arrow    Arrow IPC file (Feather v2), lz4 compressed. The fastest to write and to
+             read back with pyarrow/pandas, e.g. for the offline store, but not
+             loadable by Snowflake.
+
+AGE, GRADE and the *_ID columns are written as integers, everything else as strings.
+Empty values become nulls, like EMPTY_FIELD_AS_NULL does for the TSV. A value that is
+not an integer in an integer column (e.g. a school name the resolver kept as it was)
+is also written as null and counted in ColumnarWriter.rejected.
+"""
+import os
+
+TSV_FORMAT, PARQUET_FORMAT, ARROW_FORMAT = "tsv", "parquet", "arrow"
+EXPORT_FORMATS = [TSV_FORMAT, PARQUET_FORMAT, ARROW_FORMAT]
+DEFAULT_EXPORT_FORMAT = TSV_FORMAT
+EXPORT_SUFFIXES = {TSV_FORMAT: ".tsv", PARQUET_FORMAT: ".parquet", ARROW_FORMAT: ".arrow"}
+PARQUET_COMPRESSION = "zstd" # "snappy" writes slightly faster, zstd files are smaller
+ARROW_COMPRESSION = "lz4" # uncompressed IPC files are larger than the TSV (see benchmarks/bench_export.py)
+COLUMNAR_CHUNK_SIZE = 65_536 # rows per record batch (one Parquet row group each)
+
+# Snowflake NUMBER columns of EVENT_STUDENT_DEMOGRAPHIC -> Arrow integer type
+INTEGER_COLUMNS = {
+    "EVENT_ID": "int64",
+    "SESSION_ID": "int64",
+    "AGE": "int16",
+    "GRADE": "int16",
+    "ORG_ID": "int64",
+    "GENDER_ID": "int64",
+    "ETHNICITY_ID": "int64",
+}
+# digits allowed per type, so a value that matches always fits
+_INTEGER_PATTERNS = {
+    "int16": r"^-?\d{1,4}$",
+    "int32": r"^-?\d{1,9}$",
+    "int64": r"^-?\d{1,18}$",
+}
+
+def resolve_export_format(export_format: str) -> str:
+    """
+    Checks an export format name.
+
+    Raises:
+        ValueError: If the format is unknown.
+        ImportError: If a columnar format is chosen and pyarrow is not installed.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{export_format}'! Expected one of {EXPORT_FORMATS}")
+    if export_format != TSV_FORMAT:
+        import pyarrow # noqa: F401 -- fail before any file is created
+    return export_format
+
+def export_path(file_path: str, export_format: str) -> str:
+    """Swaps or adds the file extension for an export format."""
+    root, ext = os.path.splitext(file_path)
+    if ext not in EXPORT_SUFFIXES.values():
+        root = file_path
+    return root + EXPORT_SUFFIXES[export_format]
+
+def export_schema(columns: list[str]):
+    """Arrow schema for the export columns: integers for INTEGER_COLUMNS, strings otherwise."""
+    import pyarrow as pa
+
+    return pa.schema([
+        pa.field(column, getattr(pa, INTEGER_COLUMNS.get(column, "string"))())
+        for column in columns
+    ])
+
+def _column_array(values, field, num_rows: int) -> tuple:
+    """
+    Converts one column of strings to an Arrow array of the field's type, stripping
+    whitespace like cleaner.project_row does. values=None is an all-null column.
+
+    Returns:
+        tuple: (array, number of non-empty values that are not integers).
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if values is None:
+        return pa.nulls(num_rows, field.type), 0
+    null = pa.scalar(None, pa.string())
+    strings = pc.utf8_trim_whitespace(pa.array(values, pa.string()))
+    strings = pc.if_else(pc.equal(strings, ""), null, strings)
+    if pa.types.is_string(field.type):
+        return strings, 0
+    # null where the text is not an integer, so the cast can't fail
+    is_integer = pc.match_substring_regex(strings, _INTEGER_PATTERNS[str(field.type)])
+    rejected = pc.sum(pc.invert(is_integer)).as_py() or 0
+    return pc.cast(pc.if_else(is_integer, strings, null), field.type), rejected
+
+class ColumnarWriter:
+    """
+    Writes string columns (or rows), already projected onto the export columns, to a
+    Parquet or Arrow IPC file one record batch at a time.
+
+    Usage:
+        with ColumnarWriter(path, TSV_HEADERS, PARQUET_FORMAT) as writer:
+            writer.write_columns(columns, num_rows)
+    """
+
+    def __init__(self, file_path: str, columns: list[str], export_format: str = PARQUET_FORMAT, compression: str | None = None):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if export_format not in (PARQUET_FORMAT, ARROW_FORMAT):
+            raise ValueError(f"ColumnarWriter writes {PARQUET_FORMAT} or {ARROW_FORMAT}, not '{export_format}'!")
+        self.schema = export_schema(columns)
+        self.export_format = export_format
+        self.rejected = {column: 0 for column in columns if column in INTEGER_COLUMNS}
+        self.rows_written = 0
+        if export_format == PARQUET_FORMAT:
+            self._writer = pq.ParquetWriter(file_path, self.schema, compression=compression or PARQUET_COMPRESSION)
+        else:
+            options = pa.ipc.IpcWriteOptions(compression=compression or ARROW_COMPRESSION)
+            self._writer = pa.ipc.new_file(file_path, self.schema, options=options)
+
+    def write_columns(self, columns: list, num_rows: int) -> None:
+        """
+        Converts one chunk, given as a sequence of strings per export column (None for a
+        column with no values), to a record batch and writes it.
+        """
+        import pyarrow as pa
+
+        if num_rows == 0:
+            return
+        arrays = []
+        for field, values in zip(self.schema, columns):
+            array, rejected = _column_array(values, field, num_rows)
+            arrays.append(array)
+            if rejected:
+                self.rejected[field.name] += rejected
+        self._writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=self.schema))
+        self.rows_written += num_rows
+
+    def write_rows(self, rows: list[list[str]]) -> None:
+        """Writes a chunk of rows with one value per export column."""
+        self.write_columns(list(zip(*rows)) or [None] * len(self.schema), len(rows))
+
+    def close(self) -> None:
+        self._writer.close()
+
+    def __enter__(self) -> "ColumnarWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+def read_export_table(file_path: str):
+    """Reads a Parquet or Arrow IPC export back into an Arrow table."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if file_path.endswith(EXPORT_SUFFIXES[ARROW_FORMAT]):
+        with pa.memory_map(file_path) as source:
+            return pa.ipc.open_file(source).read_all()
+    return pq.read_table(file_path)
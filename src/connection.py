@@ -1,11 +1,18 @@
 from snowflake.core import Root
 import snowflake.connector
+import atexit
 import os
+import threading
+import time
+from contextlib import contextmanager
 from dotenv import find_dotenv, load_dotenv
 
 USER, ACCOUNT, PRIVATE_KEY_PATH = 'USER', 'ACCOUNT', 'PRIVATE_KEY_PATH'
 WAREHOUSE, DATABASE, SCHEMA = 'COMPUTE_WH', 'STEAMCODERS', 'STEAM_DATA_PROD'
 
+POOL_SIZE = 2 # idle sessions kept per manager
+HEALTH_CHECK_INTERVAL = 300 # seconds a session may sit idle before it is pinged on reuse
+
     
 def find_env_variables() -> list[str]: # user, account, privateKeyBytes
     try:
@@ -50,7 +57,14 @@ def find_env_variables() -> list[str]: # user, account, privateKeyBytes
     
     
 
-def make_connection(env_variables: list[str]):
+def make_connection(env_variables: list[str], **connect_options):
+    """
+    Opens a new Snowflake session.
+    
+    Args:
+        env_variables (list[str]): Output of find_env_variables.
+        **connect_options: Extra snowflake.connector.connect options, e.g. client_session_keep_alive=True.
+    """
     try:
         # check for length and empty strings
         if len(env_variables) < 6:
@@ -69,7 +83,8 @@ def make_connection(env_variables: list[str]):
         private_key=private_key,
         warehouse=warehouse,
         database=database,
-        schema=schema
+        schema=schema,
+        **connect_options
         )
         
         return conn
@@ -85,6 +100,149 @@ def make_connection(env_variables: list[str]):
         raise
 
 
+_credentials = None
+_credentials_lock = threading.Lock()
+
+def get_credentials(refresh: bool = False) -> list[str]:
+    """
+    Returns find_env_variables(), parsed once per process (the .env lookup and
+    private key read are not repeated). Pass refresh=True after rotating keys.
+    """
+    global _credentials
+    with _credentials_lock:
+        if _credentials is None or refresh:
+            _credentials = find_env_variables()
+        return _credentials
+
+
+class ConnectionManager:
+    """
+    Small pool of authenticated Snowflake sessions, reused across syncs, chart
+    refreshes and uploads in the same process.
+    
+    Usage:
+        with get_connection_manager().connection() as conn:
+            ...
+    
+    Sessions are opened with client_session_keep_alive, checked before reuse
+    (closed sessions are dropped, sessions idle longer than the health check
+    interval are pinged with SELECT 1) and at most pool_size idle sessions are kept.
+    """
+    def __init__(
+        self,
+        env_variables: list[str] | None = None,
+        pool_size: int = POOL_SIZE,
+        health_check_interval: float = HEALTH_CHECK_INTERVAL,
+        connect=make_connection
+    ):
+        """
+        Args:
+            env_variables (list[str] | None): Credentials; loaded lazily with get_credentials if omitted.
+            pool_size (int): Idle sessions kept for reuse.
+            health_check_interval (float): Seconds of idleness after which a session is pinged before reuse.
+            connect (Callable): Opens a session from credentials, make_connection by default.
+        """
+        self._env_variables = env_variables
+        self.pool_size = pool_size
+        self.health_check_interval = health_check_interval
+        self._connect = connect
+        self._idle = [] # (conn, last_used)
+        self._lock = threading.Lock()
+        self.opened = 0
+        self.reused = 0
+    
+    def _open(self):
+        env_variables = self._env_variables if self._env_variables is not None else get_credentials()
+        conn = self._connect(env_variables, client_session_keep_alive=True)
+        self.opened += 1
+        return conn
+    
+    def _is_healthy(self, conn, last_used: float) -> bool:
+        try:
+            if conn.is_closed():
+                return False
+            if time.monotonic() - last_used >= self.health_check_interval:
+                cur = conn.cursor()
+                try:
+                    cur.execute("SELECT 1")
+                    cur.fetchone()
+                finally:
+                    cur.close()
+            return True
+        except Exception:
+            return False
+    
+    @staticmethod
+    def _close_quietly(conn) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+    
+    def acquire(self):
+        """Returns a healthy session from the pool, opening a new one if none is idle."""
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                conn, last_used = self._idle.pop()
+            if self._is_healthy(conn, last_used):
+                self.reused += 1
+                return conn
+            self._close_quietly(conn)
+        return self._open()
+    
+    def release(self, conn) -> None:
+        """Returns a session to the pool (or closes it if the pool is full or it is closed)."""
+        with self._lock:
+            if len(self._idle) < self.pool_size and not conn.is_closed():
+                self._idle.append((conn, time.monotonic()))
+                return
+        self._close_quietly(conn)
+    
+    @contextmanager
+    def connection(self):
+        """Context manager that borrows a session and returns it to the pool afterwards."""
+        conn = self.acquire()
+        try:
+            yield conn
+        except (ConnectionError, snowflake.connector.errors.OperationalError):
+            # don't hand a broken session to the next caller
+            self._close_quietly(conn)
+            raise
+        except BaseException:
+            self.release(conn)
+            raise
+        else:
+            self.release(conn)
+    
+    def close_all(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            self._close_quietly(conn)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close_all()
+        return False
+
+
+_manager = None
+_manager_lock = threading.Lock()
+
+def get_connection_manager() -> ConnectionManager:
+    """Returns the process-wide ConnectionManager (created on first use, closed at exit)."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = ConnectionManager()
+            atexit.register(_manager.close_all)
+        return _manager
+
+
 def main():
     my_variables = find_env_variables()
     conn = make_connection(my_variables)
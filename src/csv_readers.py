@@ -0,0 +1,226 @@
+"""
+CSV readers for rosters. Every reader returns rows as lists of strings with the header
+row first and blank rows skipped:
+
+    python   csv.reader, row by row. The reference and the fallback.
+    pyarrow  pyarrow.csv with all columns typed as string, multi-threaded. A file with
+             rows of different lengths (which pyarrow rejects) is re-read with the python
+             reader, so the result is always identical.
+    pandas   pandas' C parser with dtype=str. Rows longer than the header fall back to the
+             python reader, but the parser pads shorter rows with "" and skips
+             whitespace-only lines, which csv.reader keeps as they are. It can't tell a
+             missing field from an empty one, so this can't be undone afterwards.
+
+Only the DROP_IN_READERS return exactly csv.reader's rows for every file. The pandas
+reader is not one of them and is offered in batch mode only.
+"""
+import contextlib
+import csv
+import gc
+from itertools import islice
+
+PYTHON_READER, PYARROW_READER, PANDAS_READER = "python", "pyarrow", "pandas"
+CSV_READERS = [PYTHON_READER, PYARROW_READER, PANDAS_READER]
+DROP_IN_READERS = [PYTHON_READER, PYARROW_READER] # same rows as csv.reader, short and whitespace-only rows included
+DEFAULT_CSV_READER = PYTHON_READER # the native readers only pay off on very large files (see benchmarks/bench_readers.py)
+CSV_ENCODING = 'utf-8-sig' # a leading byte order mark is dropped, like the native parsers do
+READ_BLOCK_SIZE = 1 << 22 # bytes per pyarrow block (parsed in parallel when reading a whole file)
+READ_CHUNK_ROWS = 10_000 # rows per pandas chunk when streaming
+
+def iter_rows_python(csv_file_path: str):
+    with open(csv_file_path, mode='r', newline='', encoding=CSV_ENCODING) as file:
+        for row in csv.reader(file):
+            if row:
+                yield row
+
+def read_rows_python(csv_file_path: str) -> list[list[str]]:
+    # csv.reader already yields fresh lists of str, so rows are kept as they are
+    return list(iter_rows_python(csv_file_path))
+
+def _header_width(csv_file_path: str) -> int:
+    rows = iter_rows_python(csv_file_path)
+    try:
+        return len(next(rows, []))
+    finally:
+        rows.close()
+
+def _pyarrow_options(width: int):
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    # positional names keep the header line as the first data row, verbatim
+    column_names = [f"c{i}" for i in range(width)]
+    return (
+        pa_csv.ReadOptions(column_names=column_names, encoding='utf8', block_size=READ_BLOCK_SIZE, use_threads=True),
+        pa_csv.ParseOptions(newlines_in_values=True, ignore_empty_lines=True),
+        pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in column_names},
+            strings_can_be_null=False,
+            quoted_strings_can_be_null=False,
+        ),
+    )
+
+def _batch_rows(batch) -> list[list[str]]:
+    return list(map(list, zip(*(column.to_pylist() for column in batch.columns))))
+
+def read_table_pyarrow(csv_file_path: str):
+    """
+    Reads a CSV file into an Arrow table of string columns c0, c1, ... whose first row is
+    the header row. Returns None for an empty file or one with rows of different lengths.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    width = _header_width(csv_file_path)
+    if width == 0:
+        return None
+    read_options, parse_options, convert_options = _pyarrow_options(width)
+    try:
+        return pa_csv.read_csv(csv_file_path, read_options, parse_options, convert_options)
+    except pa.ArrowInvalid:
+        return None
+
+def read_rows_pyarrow(csv_file_path: str) -> list[list[str]]:
+    table = read_table_pyarrow(csv_file_path)
+    if table is None:
+        # empty, or ragged rows that csv.reader keeps as they are
+        return read_rows_python(csv_file_path)
+    return _batch_rows(table)
+
+def iter_rows_pyarrow(csv_file_path: str):
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    width = _header_width(csv_file_path)
+    if width == 0:
+        return
+    read_options, parse_options, convert_options = _pyarrow_options(width)
+    yielded = 0
+    try:
+        with pa_csv.open_csv(csv_file_path, read_options, parse_options, convert_options) as reader:
+            for batch in reader:
+                rows = _batch_rows(batch)
+                yield from rows
+                yielded += len(rows)
+    except pa.ArrowInvalid:
+        # ragged row further down: continue with the python reader after the rows already yielded.
+        # Both count rows alike: pyarrow keeps a whitespace-only line as a row (or rejects it
+        # as ragged), it only drops empty lines, like csv.reader.
+        yield from islice(iter_rows_python(csv_file_path), yielded, None)
+
+def _pandas_options() -> dict:
+    return {
+        "header": None, "dtype": str, "keep_default_na": False, "na_filter": False,
+        "skip_blank_lines": True, "encoding": CSV_ENCODING, "engine": "c",
+    }
+
+def read_rows_pandas(csv_file_path: str) -> list[list[str]]:
+    import pandas as pd
+
+    if _header_width(csv_file_path) == 0:
+        return []
+    try:
+        return pd.read_csv(csv_file_path, **_pandas_options()).to_numpy().tolist()
+    except pd.errors.ParserError:
+        return read_rows_python(csv_file_path)
+
+def _iter_rows_after_pandas(csv_file_path: str, skip: int):
+    """
+    Yields the python reader's rows after the first `skip` rows pandas returned.
+    pandas also drops unquoted whitespace-only lines, which csv.reader keeps as one-cell
+    rows, so those are passed over without being counted.
+    """
+    with open(csv_file_path, mode='r', newline='', encoding=CSV_ENCODING) as file:
+        last_line = ""
+        def lines():
+            nonlocal last_line
+            for line in file:
+                last_line = line
+                yield line
+        seen = 0
+        for row in csv.reader(lines()):
+            if not row:
+                continue
+            if seen < skip:
+                # a record on one whitespace-only line is the only kind pandas skips
+                if last_line.strip():
+                    seen += 1
+                continue
+            yield row
+
+def iter_rows_pandas(csv_file_path: str, chunk_rows: int = READ_CHUNK_ROWS):
+    import pandas as pd
+
+    if _header_width(csv_file_path) == 0:
+        return
+    yielded = 0
+    try:
+        with pd.read_csv(csv_file_path, chunksize=chunk_rows, **_pandas_options()) as chunks:
+            for chunk in chunks:
+                rows = chunk.to_numpy().tolist()
+                yield from rows
+                yielded += len(rows)
+    except pd.errors.ParserError:
+        yield from _iter_rows_after_pandas(csv_file_path, yielded)
+
+READERS = {
+    PYTHON_READER: (read_rows_python, iter_rows_python),
+    PYARROW_READER: (read_rows_pyarrow, iter_rows_pyarrow),
+    PANDAS_READER: (read_rows_pandas, iter_rows_pandas),
+}
+
+def resolve_reader(reader: str) -> str:
+    """
+    Checks a reader name and falls back to the python reader when the engine's
+    package is not installed.
+
+    Raises:
+        ValueError: If the reader is unknown.
+    """
+    if reader not in READERS:
+        raise ValueError(f"Unknown CSV reader '{reader}'! Expected one of {CSV_READERS}")
+    if reader == PYTHON_READER:
+        return reader
+    try:
+        __import__(reader)
+    except ImportError:
+        print(f"WARNING: {reader} is not installed, reading CSVs with the python reader.")
+        return PYTHON_READER
+    return reader
+
+@contextlib.contextmanager
+def gc_paused():
+    """
+    Pauses the cyclic garbage collector. Building millions of row lists otherwise triggers
+    repeated full collections that cost more than the parsing itself; rows of strings
+    cannot form cycles, so nothing is left for the collector to find.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+def read_rows(csv_file_path: str, reader: str = DEFAULT_CSV_READER) -> list[list[str]]:
+    """
+    Reads a whole CSV file with the given reader.
+
+    Args:
+        csv_file_path (str): Path to CSV file.
+        reader (str): One of CSV_READERS.
+
+    Returns:
+        list[list[str]]: Rows with headers first, blank rows skipped, everything a string.
+    """
+    read = READERS[resolve_reader(reader)][0]
+    with gc_paused():
+        return read(csv_file_path)
+
+def iter_rows(csv_file_path: str, reader: str = DEFAULT_CSV_READER):
+    """
+    Lazily yields the rows of a CSV file with the given reader, in blocks for the native
+    readers, so memory stays bounded.
+    """
+    return READERS[resolve_reader(reader)][1](csv_file_path)
@@ -1,9 +1,30 @@
-from connection import find_env_variables, make_connection
+import argparse
+from reports import run_reports
+from offline_store import OFFLINE_DB_PATH, run_offline_reports
 import pandas as pd
 import seaborn as sns
 import numpy as np
 import matplotlib.pyplot as plt
-def plot_students_per_fiscal_year(conn, query: str, title, xlabel, ylabel):
+
+SAVE_DPI = 150
+
+def show_or_save(output_paths: list[str] | None = None):
+    """
+    Shows the current figure, or (headless) saves it to every path in output_paths,
+    the format following each extension, and closes it so figures don't pile up.
+    """
+    if output_paths is None:
+        plt.show()
+        return
+    fig = plt.gcf()
+    try:
+        for path in output_paths:
+            fig.savefig(path, dpi=SAVE_DPI)
+    finally:
+        plt.close(fig)
+
+def plot_students_per_fiscal_year(conn, query: str, title, xlabel, ylabel, df: pd.DataFrame | None = None,
+    output_paths: list[str] | None = None):
     """
     Plots total students per fiscal year as a bar chart.
     
@@ -13,9 +34,12 @@ def plot_students_per_fiscal_year(conn, query: str, title, xlabel, ylabel):
         title : str : chart title
         xlabel : str : x-axis label
         ylabel : str : y-axis label
+        df : pd.DataFrame : precomputed query result (e.g. from reports.run_reports); skips the query
+        output_paths : list[str] : save the chart to these files instead of showing it
     """
 
-    df = pd.read_sql(query, conn)
+    if df is None:
+        df = pd.read_sql(query, conn)
     print(df) 
 
     fiscal_years = df['FISCAL_YEAR']
@@ -41,10 +65,12 @@ def plot_students_per_fiscal_year(conn, query: str, title, xlabel, ylabel):
     plt.yticks(fontsize=10)
     plt.grid(axis='y', linestyle='--', alpha=0.7)
     plt.tight_layout()
-    plt.show()
+    show_or_save(output_paths)
 
-def plot_eth_bar_graph(conn, query: str, xCol: str, yCol: str, hueCol: str, title, xlabel, ylabel):
-    df = pd.read_sql(query, conn)
+def plot_eth_bar_graph(conn, query: str, xCol: str, yCol: str, hueCol: str, title, xlabel, ylabel, df: pd.DataFrame | None = None,
+    output_paths: list[str] | None = None):
+    if df is None:
+        df = pd.read_sql(query, conn)
     print(df) 
     
     # pivot table
@@ -66,10 +92,12 @@ def plot_eth_bar_graph(conn, query: str, xCol: str, yCol: str, hueCol: str, titl
     plt.xticks(rotation=45)
     plt.legend(title='Ethnicity')
     plt.tight_layout()
-    plt.show()
+    show_or_save(output_paths)
     
-def plot_gender_bar_graph_wide(conn, query: str, title, xlabel, ylabel):
-    df = pd.read_sql(query, conn)
+def plot_gender_bar_graph_wide(conn, query: str, title, xlabel, ylabel, df: pd.DataFrame | None = None,
+    output_paths: list[str] | None = None):
+    if df is None:
+        df = pd.read_sql(query, conn)
     print(df)
 
     # extract fiscal years and gender percentages
@@ -104,11 +132,13 @@ def plot_gender_bar_graph_wide(conn, query: str, title, xlabel, ylabel):
     plt.legend(title='Gender', bbox_to_anchor=(1.02,1), loc='upper left', fontsize=9, title_fontsize=10)
     plt.grid(axis='y', linestyle='--', alpha=0.7)
     plt.tight_layout()
-    plt.show()
+    show_or_save(output_paths)
 
-def plot_grade_level_stacked(conn, query: str, title, xlabel, ylabel):
+def plot_grade_level_stacked(conn, query: str, title, xlabel, ylabel, df: pd.DataFrame | None = None,
+    output_paths: list[str] | None = None):
     # Load query results
-    df = pd.read_sql(query, conn)
+    if df is None:
+        df = pd.read_sql(query, conn)
     df.columns = df.columns.str.lower()  # normalize column names
     print(df.head())  # debug
 
@@ -146,10 +176,12 @@ def plot_grade_level_stacked(conn, query: str, title, xlabel, ylabel):
     plt.xticks(rotation=45)
     plt.ylim(0, 110)  # room for total labels
     plt.tight_layout()
-    plt.show()
+    show_or_save(output_paths)
 
-def plot_event_type_stacked(conn, query: str, title, xlabel, ylabel):
-    df = pd.read_sql(query, conn)
+def plot_event_type_stacked(conn, query: str, title, xlabel, ylabel, df: pd.DataFrame | None = None,
+    output_paths: list[str] | None = None):
+    if df is None:
+        df = pd.read_sql(query, conn)
     print(df)
 
     type_cols = ['CLASS', 'FIELD_TRIP', 'WORKSHOP', 'FUNDRAISER', 'CAMP', 'FUN_ACTIVITY']
@@ -178,250 +210,39 @@ def plot_event_type_stacked(conn, query: str, title, xlabel, ylabel):
     plt.xticks(rotation=45)
     plt.ylim(0, 110)  # leave space for totals above 100%
     plt.tight_layout()
-    plt.show()
+    show_or_save(output_paths)
+
+# chart name -> (plot function, report name, keyword arguments)
+CHARTS = {
+    "students_per_fiscal_year": (plot_students_per_fiscal_year, "students_per_fiscal_year", dict(
+        title="Total Students per Fiscal Year", xlabel="Fiscal Year", ylabel="Total Students")),
+    "ethnicity_percentages": (plot_eth_bar_graph, "ethnicity_percentages", dict(
+        xCol='FISCAL_YEAR', yCol='PCT_OF_YEAR', hueCol='ETHNICITY',
+        title='Ethnicity Percentages by Fiscal Year', xlabel='Fiscal Year', ylabel='Percentage')),
+    "gender_distribution": (plot_gender_bar_graph_wide, "gender_percentages", dict(
+        title="Gender Distribution per Fiscal Year", xlabel="Fiscal Year", ylabel="Percentage")),
+    "grade_level": (plot_grade_level_stacked, "grade_percentages", dict(
+        title="Students per Fiscal Year by Grade Level", xlabel="FISCAL_YEAR", ylabel="STUDENT_COUNT")),
+    "event_type": (plot_event_type_stacked, "event_type", dict(
+        title="Students per Fiscal Year by Event Type", xlabel="FISCAL_YEAR", ylabel="TOTAL_STUDENTS")),
+}
 
 def main():
-    conn = make_connection(find_env_variables())
-    
-    students_per_fiscal_year_query = """
-            WITH esd_counts AS (
-        SELECT 
-            event_id,
-            session_id,
-            COUNT(*) AS student_count
-        FROM EVENT_STUDENT_DEMOGRAPHIC
-        GROUP BY event_id, session_id
-    ),
-    ea_counts AS (
-        SELECT
-            event_id,
-            session_id,
-            COALESCE(actual_attendee_cnt, reserved_attendee_cnt) AS activity_count
-        FROM EVENT_ACTIVITY
-    ),
-    combined AS (
-        SELECT
-            e.session_start_date,
-            COALESCE(esd.student_count, ea.activity_count) AS final_count
-        FROM EVENT_SESSION e
-        LEFT JOIN esd_counts esd
-            ON e.event_id = esd.event_id
-        AND e.session_id = esd.session_id
-        LEFT JOIN ea_counts ea
-            ON e.event_id = ea.event_id
-        AND e.session_id = ea.session_id
-    )
-    SELECT 
-        CASE 
-            WHEN MONTH(session_start_date) >= 7 
-                THEN TO_VARCHAR(YEAR(session_start_date)) || '-' || TO_VARCHAR(YEAR(session_start_date) + 1)
-            ELSE TO_VARCHAR(YEAR(session_start_date) - 1) || '-' || TO_VARCHAR(YEAR(session_start_date))
-        END AS fiscal_year,
-        SUM(final_count) AS total_students
-    FROM combined
-    GROUP BY fiscal_year
-    ORDER BY fiscal_year;
-    """
-    
-    ethnicity_percentages_query = """
-        WITH esd_with_fy AS (
-        SELECT 
-            CASE 
-                WHEN MONTH(s.session_start_date) >= 7 
-                    THEN TO_VARCHAR(YEAR(s.session_start_date)) || '-' || TO_VARCHAR(YEAR(s.session_start_date) + 1)
-                ELSE TO_VARCHAR(YEAR(s.session_start_date) - 1) || '-' || TO_VARCHAR(YEAR(s.session_start_date))
-            END AS fiscal_year,
-            esd.ethnicity_id
-        FROM EVENT_STUDENT_DEMOGRAPHIC esd
-        JOIN EVENT_SESSION s
-            ON esd.event_id = s.event_id
-        AND esd.session_id = s.session_id
-        WHERE esd.ethnicity_id IS NOT NULL
-    ),
-    ethnicity_counts AS (
-        SELECT 
-            fiscal_year,
-            ethnicity_id,
-            COUNT(*) AS student_count
-        FROM esd_with_fy
-        GROUP BY fiscal_year, ethnicity_id
-    ),
-    total_per_year AS (
-        SELECT 
-            fiscal_year,
-            SUM(student_count) AS total_students
-        FROM ethnicity_counts
-        GROUP BY fiscal_year
-    )
-    SELECT 
-        ec.fiscal_year,
-        CASE ec.ethnicity_id
-            WHEN 1 THEN 'American Indian or Alaska Native'
-            WHEN 2 THEN 'Asian'
-            WHEN 3 THEN 'Black or African American'
-            WHEN 4 THEN 'Hispanic or Latino'
-            WHEN 5 THEN 'White'
-            WHEN 6 THEN 'Native Hawaiian and Other Pacific Islander'
-            WHEN 7 THEN 'Multiracial'
-            WHEN 8 THEN 'Other Race'
-            ELSE 'Unknown'
-        END AS ethnicity,
-        ROUND((ec.student_count / t.total_students) * 100, 2) AS pct_of_year
-    FROM ethnicity_counts ec
-    JOIN total_per_year t
-        ON ec.fiscal_year = t.fiscal_year
-    ORDER BY ec.fiscal_year, ethnicity;
-    """
-    
-    gender_percentages_query = """
-            SELECT
-            CONCAT(
-                CASE WHEN MONTH(SES.session_start_date) >= 7 
-                    THEN YEAR(SES.session_start_date)
-                    ELSE YEAR(SES.session_start_date) - 1
-                END,
-                '-',
-                CASE WHEN MONTH(SES.session_start_date) >= 7
-                    THEN YEAR(SES.session_start_date) + 1
-                    ELSE YEAR(SES.session_start_date)
-                END
-            ) AS fiscal_year,
-            ROUND(SUM(CASE WHEN DEM.gender_id = 1 THEN 1 ELSE 0 END) * 100.0 / COUNT(DEM.gender_id), 2) AS pct_male,
-            ROUND(SUM(CASE WHEN DEM.gender_id = 2 THEN 1 ELSE 0 END) * 100.0 / COUNT(DEM.gender_id), 2) AS pct_female,
-            ROUND(SUM(CASE WHEN DEM.gender_id = 3 THEN 1 ELSE 0 END) * 100.0 / COUNT(DEM.gender_id), 2) AS pct_other
-        FROM
-            EVENT_STUDENT_DEMOGRAPHIC AS DEM
-        JOIN
-            EVENT_SESSION AS SES
-            ON DEM.session_id = SES.session_id
-        GROUP BY
-            CONCAT(
-                CASE WHEN MONTH(SES.session_start_date) >= 7 
-                    THEN YEAR(SES.session_start_date)
-                    ELSE YEAR(SES.session_start_date) - 1
-                END,
-                '-',
-                CASE WHEN MONTH(SES.session_start_date) >= 7
-                    THEN YEAR(SES.session_start_date) + 1
-                    ELSE YEAR(SES.session_start_date)
-                END
-            )
-        ORDER BY
-            fiscal_year;
-    """
-    
-    grade_percentages_query = """
-        WITH student_sessions AS (
-    SELECT
-        CASE 
-            WHEN MONTH(s.session_start_date) >= 7 
-            THEN TO_VARCHAR(YEAR(s.session_start_date)) || '-' || TO_VARCHAR(YEAR(s.session_start_date) + 1)
-            ELSE TO_VARCHAR(YEAR(s.session_start_date) - 1) || '-' || TO_VARCHAR(YEAR(s.session_start_date))
-        END AS fiscal_year,
-        CASE 
-            WHEN d.grade = 0 THEN 'K'
-            WHEN d.grade = -1 THEN 'TK'
-            ELSE TO_VARCHAR(d.grade)
-        END AS grade_level
-    FROM EVENT_STUDENT_DEMOGRAPHIC d
-    JOIN EVENT_SESSION s
-      ON d.event_id = s.event_id
-     AND d.session_id = s.session_id   -- <- important: join on both keys
-    WHERE d.grade IS NOT NULL
-)
-SELECT
-    fiscal_year,
-    grade_level,
-    COUNT(*) AS student_count,
-    SUM(COUNT(*)) OVER (PARTITION BY fiscal_year) AS fiscal_total,
-    ROUND(
-        COUNT(*) * 100.0 / NULLIF(SUM(COUNT(*)) OVER (PARTITION BY fiscal_year), 0),
-        2
-    ) AS pct
-FROM student_sessions
-GROUP BY fiscal_year, grade_level
-ORDER BY fiscal_year,
-         CASE 
-            WHEN grade_level = 'TK' THEN 0
-            WHEN grade_level = 'K'  THEN 1
-            ELSE TO_NUMBER(grade_level)
-         END;
-
-    """
-    
-    event_type_query = """
-        WITH esd_counts AS (
-    SELECT 
-        event_id,
-        session_id,
-        COUNT(*) AS student_count
-    FROM EVENT_STUDENT_DEMOGRAPHIC
-    GROUP BY event_id, session_id
-),
-ea_counts AS (
-    SELECT
-        event_id,
-        session_id,
-        COALESCE(actual_attendee_cnt, reserved_attendee_cnt) AS activity_count
-    FROM EVENT_ACTIVITY
-),
-combined AS (
-    SELECT
-        e.session_start_date,
-        e.type_id,
-        COALESCE(esd.student_count, ea.activity_count) AS final_count
-    FROM EVENT_SESSION e
-    LEFT JOIN esd_counts esd
-        ON e.event_id = esd.event_id
-       AND e.session_id = esd.session_id
-    LEFT JOIN ea_counts ea
-        ON e.event_id = ea.event_id
-       AND e.session_id = ea.session_id
-),
-fiscal AS (
-    SELECT 
-        CASE 
-            WHEN MONTH(session_start_date) >= 7 
-                THEN TO_VARCHAR(YEAR(session_start_date)) || '-' || TO_VARCHAR(YEAR(session_start_date) + 1)
-            ELSE TO_VARCHAR(YEAR(session_start_date) - 1) || '-' || TO_VARCHAR(YEAR(session_start_date))
-        END AS fiscal_year,
-        type_id,
-        final_count
-    FROM combined
-)
-SELECT 
-    fiscal_year,
-    SUM(final_count) AS total_students,
-    SUM(CASE WHEN type_id = 1 THEN final_count ELSE 0 END) AS class,
-    SUM(CASE WHEN type_id = 2 THEN final_count ELSE 0 END) AS field_trip,
-    SUM(CASE WHEN type_id = 3 THEN final_count ELSE 0 END) AS workshop,
-    SUM(CASE WHEN type_id = 4 THEN final_count ELSE 0 END) AS fundraiser,
-    SUM(CASE WHEN type_id = 5 THEN final_count ELSE 0 END) AS camp,
-    SUM(CASE WHEN type_id = 6 THEN final_count ELSE 0 END) AS fun_activity
-FROM fiscal
-GROUP BY fiscal_year
-ORDER BY fiscal_year;
-    """
-    
-    # plot_event_type_stacked(conn, event_type_query, title="Students per Fiscal Year by Event Type", xlabel="FISCAL_YEAR",
-    #                         ylabel="TOTAL_STUDENTS")
+    parser = argparse.ArgumentParser(description="Show the fiscal-year dashboard charts.")
+    parser.add_argument("--offline", nargs="?", const=OFFLINE_DB_PATH, default=None, metavar="DB",
+                        help=f"Read the local SQLite store instead of Snowflake (default: {OFFLINE_DB_PATH})")
+    args = parser.parse_args()
     
+    if args.offline:
+        results = run_offline_reports(args.offline)
+    else:
+        # all five queries run concurrently (or come from the local Parquet cache)
+        results = run_reports()
+    conn = None # every plot gets its DataFrame, so no connection is needed here
     
-    plot_grade_level_stacked(
-    conn,
-    grade_percentages_query,
-    title="Students per Fiscal Year by Grade Level",
-    xlabel="FISCAL_YEAR",
-    ylabel="STUDENT_COUNT"
-)    
-    #plot_students_per_fiscal_year(conn, students_per_fiscal_year_query, title="Total Students per Fiscal Year", 
-                                  #xlabel="Fiscal Year", ylabel="Total Students")
-
-    #plot_gender_bar_graph_wide(conn, gender_percentages_query, title="Gender Distribution per Fiscal Year", xlabel="Fiscal Year", 
-                               #ylabel="Percentage")
-    #plot_eth_bar_graph(conn, ethnicity_percentages_query, xCol='FISCAL_YEAR', yCol='PCT_OF_YEAR', hueCol='ETHNICITY',
-                   #title='Ethnicity Percentages by Fiscal Year', xlabel='Fiscal Year', ylabel='Percentage')
+    for plot, report_name, kwargs in CHARTS.values():
+        plot(conn, None, df=results[report_name], **kwargs)
     
     
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
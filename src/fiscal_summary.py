@@ -0,0 +1,128 @@
+"""
+Precomputed fiscal-year model for the dashboard queries.
+
+The fiscal year (July - June) of a session is computed once in SESSION_FISCAL_YEAR,
+and EVENT_STUDENT_DEMOGRAPHIC is aggregated once into two summary tables that the
+queries in report_queries.py read instead of the raw tables:
+
+- FY_SESSION_DEMOGRAPHIC_SUMMARY: student counts per (fiscal year, session, gender,
+  ethnicity, grade).
+- FY_SESSION_ATTENDANCE: one row per session with its final head count (demographic
+  rows, falling back to the EVENT_ACTIVITY attendee counts).
+
+Run `python src/fiscal_summary.py` after loading new rosters to rebuild them.
+"""
+import argparse
+import time
+from connection import get_connection_manager
+from reports import ReportCache
+
+FISCAL_YEAR_TABLE = "SESSION_FISCAL_YEAR"
+DEMOGRAPHIC_SUMMARY_TABLE = "FY_SESSION_DEMOGRAPHIC_SUMMARY"
+ATTENDANCE_SUMMARY_TABLE = "FY_SESSION_ATTENDANCE"
+
+CREATE_FISCAL_YEAR_TABLE = f"""
+    CREATE OR REPLACE TABLE {FISCAL_YEAR_TABLE} AS
+    SELECT
+        event_id,
+        session_id,
+        type_id,
+        session_start_date,
+        IFF(MONTH(session_start_date) >= 7, YEAR(session_start_date), YEAR(session_start_date) - 1) AS fiscal_start_year,
+        TO_VARCHAR(fiscal_start_year) || '-' || TO_VARCHAR(fiscal_start_year + 1) AS fiscal_year
+    FROM EVENT_SESSION;
+    """
+
+CREATE_DEMOGRAPHIC_SUMMARY_TABLE = f"""
+    CREATE OR REPLACE TABLE {DEMOGRAPHIC_SUMMARY_TABLE} CLUSTER BY (fiscal_year) AS
+    SELECT
+        s.fiscal_year,
+        s.event_id,
+        s.session_id,
+        s.type_id,
+        d.gender_id,
+        d.ethnicity_id,
+        d.grade,
+        COUNT(*) AS student_count
+    FROM EVENT_STUDENT_DEMOGRAPHIC d
+    JOIN {FISCAL_YEAR_TABLE} s
+        ON d.event_id = s.event_id
+       AND d.session_id = s.session_id
+    GROUP BY s.fiscal_year, s.event_id, s.session_id, s.type_id, d.gender_id, d.ethnicity_id, d.grade;
+    """
+
+CREATE_ATTENDANCE_SUMMARY_TABLE = f"""
+    CREATE OR REPLACE TABLE {ATTENDANCE_SUMMARY_TABLE} CLUSTER BY (fiscal_year) AS
+    WITH esd_counts AS (
+        SELECT event_id, session_id, SUM(student_count) AS student_count
+        FROM {DEMOGRAPHIC_SUMMARY_TABLE}
+        GROUP BY event_id, session_id
+    )
+    SELECT
+        s.fiscal_year,
+        s.event_id,
+        s.session_id,
+        s.type_id,
+        COALESCE(esd.student_count, ea.actual_attendee_cnt, ea.reserved_attendee_cnt) AS final_count
+    FROM {FISCAL_YEAR_TABLE} s
+    LEFT JOIN esd_counts esd
+        ON s.event_id = esd.event_id
+       AND s.session_id = esd.session_id
+    LEFT JOIN EVENT_ACTIVITY ea
+        ON s.event_id = ea.event_id
+       AND s.session_id = ea.session_id;
+    """
+
+# table -> statement, in dependency order
+REFRESH_STATEMENTS = {
+    FISCAL_YEAR_TABLE: CREATE_FISCAL_YEAR_TABLE,
+    DEMOGRAPHIC_SUMMARY_TABLE: CREATE_DEMOGRAPHIC_SUMMARY_TABLE,
+    ATTENDANCE_SUMMARY_TABLE: CREATE_ATTENDANCE_SUMMARY_TABLE,
+}
+
+def refresh_fiscal_summary(conn, cache: ReportCache | None = None) -> list[dict]:
+    """
+    Rebuilds the fiscal-year dimension and both summary tables, then clears the
+    dashboard result cache so the next run_reports reads the new numbers.
+
+    Each CREATE OR REPLACE swaps its table in atomically, so dashboards keep reading
+    the previous version until the rebuild of that table finishes.
+
+    Args:
+        conn: Snowflake connection.
+        cache (ReportCache | None): Result cache to clear, the default on-disk cache if omitted.
+
+    Returns:
+        list[dict]: One entry per table with its row count and seconds.
+    """
+    reports = []
+    cur = conn.cursor()
+    try:
+        for table, statement in REFRESH_STATEMENTS.items():
+            start = time.perf_counter()
+            cur.execute(statement)
+            cur.execute(f"SELECT COUNT(*) FROM {table}")
+            row = cur.fetchone()
+            reports.append({
+                "table": table,
+                "rows": row[0] if row else 0,
+                "seconds": time.perf_counter() - start,
+            })
+    finally:
+        cur.close()
+
+    (cache if cache is not None else ReportCache()).clear()
+    return reports
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the fiscal-year dimension and dashboard summary tables.")
+    parser.parse_args()
+
+    with get_connection_manager().connection() as conn:
+        reports = refresh_fiscal_summary(conn)
+
+    for report in reports:
+        print(f"{report['table']:31} {report['rows']:>10,} rows ({report['seconds']:.2f} s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+import heapq
+from collections import Counter
+from difflib import SequenceMatcher
+
+DEFAULT_MAX_CANDIDATES = 8
+
+class FuzzyMatcher:
+    """
+    Approximate matcher over the normalized keys of a column's lookup table, for values
+    that neither exactly nor substring-match any key (typos, dropped words, reordering).
+
+    Keys are indexed by their padded character trigrams. A value is only compared with
+    the keys that share at least one trigram with it: those are ranked by trigram Dice
+    similarity, and the best few are scored with difflib's SequenceMatcher ratio.
+    """
+
+    GRAM_SIZE = 3
+
+    def __init__(self, normalized_lookup: dict[str, object], max_candidates: int = DEFAULT_MAX_CANDIDATES):
+        """
+        Args:
+            normalized_lookup (dict[str, object]): normalized_value -> data_id, as built by build_value_lookup.
+            max_candidates (int): Keys scored with SequenceMatcher per value.
+        """
+        self.keys = list(normalized_lookup.keys())
+        self.values = list(normalized_lookup.values())
+        self.max_candidates = max_candidates
+
+        index = {}
+        self._gram_counts = []
+        for pos, key in enumerate(self.keys):
+            grams = self.grams(key)
+            self._gram_counts.append(len(grams))
+            for gram in grams:
+                index.setdefault(gram, []).append(pos)
+        self._index = index
+
+    @classmethod
+    def grams(cls, text: str) -> set[str]:
+        """Character trigrams of text padded with a space on each side."""
+        padded = f" {text} "
+        return {padded[i:i + cls.GRAM_SIZE] for i in range(len(padded) - cls.GRAM_SIZE + 1)}
+
+    def candidates(self, normalized_value: str) -> list[tuple[float, int]]:
+        """
+        Returns up to max_candidates (dice, key position) pairs, best first, for the
+        keys sharing at least one trigram with normalized_value.
+        """
+        grams = self.grams(normalized_value)
+        shared = Counter()
+        for gram in grams:
+            postings = self._index.get(gram)
+            if postings is not None:
+                shared.update(postings)
+        if not shared:
+            return []
+
+        size = len(grams)
+        gram_counts = self._gram_counts
+        scored = (
+            (2 * count / (size + gram_counts[pos]), -pos)
+            for pos, count in shared.items()
+        )
+        # -pos so that ties go to the earlier key, like the substring matcher
+        return [(dice, -neg_pos) for dice, neg_pos in heapq.nlargest(self.max_candidates, scored)]
+
+    def best_match(self, normalized_value: str) -> tuple[int, float] | None:
+        """
+        Returns (key position, similarity in [0, 1]) of the closest key, or None if no key
+        shares a trigram with the value.
+        """
+        best = None
+        matcher = SequenceMatcher(autojunk=False)
+        matcher.set_seq2(normalized_value)
+        for _, pos in self.candidates(normalized_value):
+            matcher.set_seq1(self.keys[pos])
+            score = matcher.ratio()
+            if best is None or score > best[1] or (score == best[1] and pos < best[0]):
+                best = (pos, score)
+        return best
+
+    def match(self, normalized_value: str, threshold: float):
+        """
+        Returns the data_id of the closest key if its similarity is at least threshold,
+        otherwise None.
+        """
+        best = self.best_match(normalized_value)
+        if best is None or best[1] < threshold:
+            return None
+        return self.values[best[0]]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+def linear_best_match(normalized_lookup: dict[str, object], normalized_value: str) -> tuple[int, float] | None:
+    """
+    Reference implementation scoring every key with SequenceMatcher.
+    Kept for benchmarks and tests.
+    """
+    best = None
+    for pos, key in enumerate(normalized_lookup):
+        score = SequenceMatcher(None, key, normalized_value, autojunk=False).ratio()
+        if best is None or score > best[1]:
+            best = (pos, score)
+    return best
@@ -0,0 +1,110 @@
+import re
+import threading
+
+# match kind -> confidence score
+EXACT_SCORE = 1.0
+SYNONYM_SCORE = 0.9
+COMPACT_SCORE = 0.75
+
+def compact_header(header: str) -> str:
+    """Uppercased header with everything but letters and digits removed ("Student-ID" -> "STUDENTID")."""
+    return re.sub(r"[^0-9A-Z]", "", header.upper())
+
+
+class HeaderMatcher:
+    """
+    Maps a CSV header row onto a fixed set of target columns in one pass.
+
+    A single reverse index maps every uppercased target name and synonym to its target,
+    with a second, punctuation-insensitive index as a lower-confidence fallback. Each CSV
+    header is looked up once and names at most one target, so each header feeds at most
+    one target. The (target, header) candidates are then assigned greedily by score,
+    earlier CSV columns winning ties, and every target gets at most one header; the
+    headers it loses are kept as alternatives.
+    """
+    def __init__(self, targets: list[str], synonyms: dict[str, list[str]]):
+        """
+        Args:
+            targets (list[str]): Target column names, e.g. TSV_HEADERS.
+            synonyms (dict[str, list[str]]): target -> header synonyms, as in column_synonyms.json.
+        """
+        self.targets = list(targets)
+        self._order = {target: i for i, target in enumerate(self.targets)}
+        self.index = {}          # uppercased name -> (target, score, kind)
+        self.compact_index = {}  # compact name -> (target, score, kind)
+
+        for target in self.targets:
+            self._add(target, target, EXACT_SCORE, "exact")
+        for target in self.targets:
+            for synonym in synonyms.get(target, []):
+                self._add(synonym, target, SYNONYM_SCORE, "synonym")
+
+    def _add(self, name: str, target: str, score: float, kind: str) -> None:
+        # first registration wins: exact names before synonyms, targets in order
+        self.index.setdefault(name.upper(), (target, score, kind))
+        compact = compact_header(name)
+        if compact:
+            self.compact_index.setdefault(compact, (target, COMPACT_SCORE, "compact"))
+
+    def lookup(self, header: str) -> tuple[str, float, str] | None:
+        """Returns (target, score, match kind) for one CSV header, or None."""
+        header = header.strip()
+        if not header:
+            return None
+        hit = self.index.get(header.upper())
+        if hit is None:
+            hit = self.compact_index.get(compact_header(header))
+        return hit
+
+    def match(self, csv_headers: list[str], exclude: set[int] = frozenset()) -> dict[str, dict]:
+        """
+        Assigns CSV headers to targets.
+
+        Args:
+            csv_headers (list[str]): Header row of the CSV.
+            exclude (set[int]): CSV positions that are already taken (e.g. mapped by hand).
+
+        Returns:
+            dict[str, dict]: target -> {"index", "csv_column", "score", "match", "alternatives"}.
+            Unmatched targets have index/csv_column None, score 0.0 and match None;
+            alternatives lists the other headers that matched the target but were not used.
+        """
+        candidates = []
+        for col_ind, header in enumerate(csv_headers):
+            if col_ind in exclude:
+                continue
+            hit = self.lookup(header)
+            if hit is not None:
+                target, score, kind = hit
+                candidates.append((-score, col_ind, self._order[target], target, kind))
+        candidates.sort()
+
+        result = {
+            target: {"index": None, "csv_column": None, "score": 0.0, "match": None, "alternatives": []}
+            for target in self.targets
+        }
+        for neg_score, col_ind, _, target, kind in candidates:
+            entry = result[target]
+            if entry["index"] is not None:
+                entry["alternatives"].append(csv_headers[col_ind].strip())
+                continue
+            entry.update(index=col_ind, csv_column=csv_headers[col_ind].strip(), score=-neg_score, match=kind)
+        return result
+
+
+_cache_lock = threading.Lock()
+_cached = {}  # targets tuple -> (synonyms object, HeaderMatcher)
+
+def get_header_matcher(targets: list[str], synonyms: dict[str, list[str]]) -> HeaderMatcher:
+    """
+    Returns a HeaderMatcher for targets, rebuilt only when a different synonyms object is
+    passed in (the mapping registry returns the same object until the file changes).
+    """
+    key = tuple(targets)
+    with _cache_lock:
+        cached = _cached.get(key)
+        if cached is not None and cached[0] is synonyms:
+            return cached[1]
+        matcher = HeaderMatcher(targets, synonyms)
+        _cached[key] = (synonyms, matcher)
+        return matcher
@@ -0,0 +1,193 @@
+import cProfile
+import contextlib
+import datetime
+import json
+import pstats
+import time
+import tracemalloc
+
+DEFAULT_PROFILE_TOP = 30 # functions kept in the profile section of a report
+RUN_REPORT_SUFFIX = ".run_report.json" # written next to an export
+
+class RunReport:
+    """
+    Per-stage timings and row counts for one run (a clean, an export, a batch file).
+
+    Stages are timed with the `stage` context manager, or by wrapping a lazy row
+    iterator with `count`, which charges the time spent producing each row to a stage.
+    Stages that wrap each other (e.g. writing pulls rows from cleaning, which pulls
+    rows from the reader) are made exclusive afterwards with `nest`.
+    """
+    def __init__(self, name: str = "run"):
+        self.name = name
+        self.started_at = datetime.datetime.now().isoformat(timespec="seconds")
+        self._start = time.perf_counter()
+        self.total_seconds = None
+        self.stages = {}  # name -> {"seconds", "rows", "calls"}, in first-use order
+        self.meta = {}    # free-form details, e.g. file names or cache stats
+        self.memory = None
+        self.profile = None
+
+    def _entry(self, name: str) -> dict:
+        entry = self.stages.get(name)
+        if entry is None:
+            entry = self.stages[name] = {"seconds": 0.0, "rows": None, "calls": 0}
+        return entry
+
+    def add(self, name: str, seconds: float, rows: int | None = None) -> None:
+        """Adds time (and rows) to a stage."""
+        entry = self._entry(name)
+        entry["seconds"] += seconds
+        entry["calls"] += 1
+        if rows is not None:
+            entry["rows"] = (entry["rows"] or 0) + rows
+
+    @contextlib.contextmanager
+    def stage(self, name: str, rows: int | None = None):
+        """
+        Times the body as one call of a stage. The yielded dict can be updated with
+        the number of rows once it is known: `with report.stage("clean") as s: s["rows"] = n`.
+        """
+        info = {"rows": rows}
+        start = time.perf_counter()
+        try:
+            yield info
+        finally:
+            self.add(name, time.perf_counter() - start, info["rows"])
+
+    def count(self, rows, name: str):
+        """
+        Wraps a lazy row iterator, charging the time spent producing each row
+        (inclusive of anything it pulls from) and the row count to a stage.
+        """
+        entry = self._entry(name)
+        entry["calls"] += 1
+        entry["rows"] = entry["rows"] or 0
+        return self._counted(iter(rows), entry)
+
+    @staticmethod
+    def _counted(rows, entry: dict):
+        clock = time.perf_counter
+        while True:
+            start = clock()
+            try:
+                row = next(rows)
+            except StopIteration:
+                entry["seconds"] += clock() - start
+                return
+            entry["seconds"] += clock() - start
+            entry["rows"] += 1
+            yield row
+
+    def nest(self, outer: str, inner: str) -> None:
+        """Subtracts an inner stage's time from the outer stage that wrapped it."""
+        if outer in self.stages and inner in self.stages:
+            self.stages[outer]["seconds"] = max(0.0, self.stages[outer]["seconds"] - self.stages[inner]["seconds"])
+
+    def restart(self, keep: list[str]) -> "RunReport":
+        """
+        A fresh report for running later stages again (e.g. cleaning the same file twice),
+        with this report's name and meta and copies of the stages in keep that it has.
+        """
+        report = RunReport(self.name)
+        report.meta = dict(self.meta)
+        for name in keep:
+            if name in self.stages:
+                report.stages[name] = dict(self.stages[name])
+        return report
+
+    def finish(self) -> "RunReport":
+        self.total_seconds = time.perf_counter() - self._start
+        return self
+
+    def to_dict(self) -> dict:
+        """Machine-readable report: stages with seconds, rows and rows/sec, plus memory and profile if recorded."""
+        if self.total_seconds is None:
+            self.finish()
+        stages = []
+        for name, entry in self.stages.items():
+            seconds, rows = entry["seconds"], entry["rows"]
+            stages.append({
+                "stage": name,
+                "seconds": seconds,
+                "rows": rows,
+                "rows_per_sec": rows / seconds if rows and seconds > 0 else None,
+                "calls": entry["calls"],
+            })
+        report = {
+            "name": self.name,
+            "started_at": self.started_at,
+            "total_seconds": self.total_seconds,
+            "stages": stages,
+            "meta": self.meta,
+        }
+        if self.memory is not None:
+            report["memory"] = self.memory
+        if self.profile is not None:
+            report["profile"] = self.profile
+        return report
+
+    def write_json(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, default=str)
+
+    def format_breakdown(self) -> str:
+        """One-line summary, e.g. "read_csv 0.12 s (10,000 rows) · clean 0.40 s (10,000 rows)"."""
+        parts = []
+        for name, entry in self.stages.items():
+            part = f"{name} {entry['seconds']:.2f} s"
+            if entry["rows"]:
+                part += f" ({entry['rows']:,} rows)"
+            parts.append(part)
+        if self.memory is not None:
+            parts.append(f"peak {self.memory['peak_bytes'] / 2**20:.1f} MiB")
+        return " · ".join(parts)
+
+
+def timed_stage(report: RunReport | None, name: str, rows: int | None = None):
+    """report.stage(name), or a no-op context when there is no report."""
+    if report is None:
+        return contextlib.nullcontext({"rows": rows})
+    return report.stage(name, rows)
+
+
+@contextlib.contextmanager
+def profiled(report: RunReport, top: int = DEFAULT_PROFILE_TOP, trace_memory: bool = True, dump_path: str | None = None):
+    """
+    Runs the body under cProfile (and tracemalloc) and stores the hottest functions by
+    cumulative time in report.profile and the peak traced memory in report.memory.
+
+    Args:
+        report (RunReport): Report to attach the results to.
+        top (int): Number of functions to keep.
+        trace_memory (bool): Also track allocations with tracemalloc (slows the run down).
+        dump_path (str | None): Also write the raw stats there, for snakeviz/pstats.
+    """
+    profiler = cProfile.Profile()
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    profiler.enable()
+    try:
+        yield report
+    finally:
+        profiler.disable()
+        if trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            report.memory = {"current_bytes": current, "peak_bytes": peak}
+            if started_tracing:
+                tracemalloc.stop()
+
+        stats = pstats.Stats(profiler)
+        if dump_path is not None:
+            stats.dump_stats(dump_path)
+        entries = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:top]
+        report.profile = [
+            {
+                "function": f"{file}:{line}({function})",
+                "calls": calls,
+                "total_seconds": total,
+                "cumulative_seconds": cumulative,
+            }
+            for (file, line, function), (_, calls, total, cumulative, _) in entries
+        ]
@@ -0,0 +1,118 @@
+import datetime
+import json
+import os
+import threading
+from utils import normalize
+from registry import get_registry, LEARNED_RESOLUTIONS_PATH
+
+class LearnedResolutionStore:
+    """
+    Append-only JSONL store of resolutions decided by an operator, keyed by
+    (column, normalized raw value). ColumnResolver consults it before any matching,
+    so a value fixed once resolves the same way in every later file.
+
+    Each line is one decision; the last line for a key wins and an "id" of null
+    forgets the key. The parsed table is cached in the mapping registry and rebuilt
+    when the file changes.
+    """
+    def __init__(self, path: str = LEARNED_RESOLUTIONS_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _build(self) -> dict[str, dict[str, object]]:
+        table = {}
+        try:
+            f = open(self.path, 'r', encoding='utf-8')
+        except FileNotFoundError:
+            return table
+        with f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                    column, value, data_id = entry["column"], entry["value"], entry["id"]
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    print(f"WARNING: Skipping malformed line {line_number} in {self.path}")
+                    continue
+                if data_id is None:
+                    table.get(column, {}).pop(value, None)
+                else:
+                    table.setdefault(column, {})[value] = data_id
+        return table
+
+    def table(self) -> dict[str, dict[str, object]]:
+        """
+        Returns:
+            dict[str, dict[str, object]]: column -> normalized value -> data_id. Shared, read-only.
+        """
+        return get_registry().derive(("learned_resolutions", os.path.abspath(self.path)), [self.path], self._build)
+
+    def for_column(self, column_name: str) -> dict[str, object]:
+        """Returns normalized value -> data_id for one column (read-only)."""
+        return self.table().get(column_name, {})
+
+    def get(self, column_name: str, raw_value: str):
+        """Returns the learned data_id for a raw value, or None."""
+        return self.for_column(column_name).get(normalize(raw_value))
+
+    def _append(self, entry: dict) -> None:
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def record(self, column_name: str, raw_value: str, data_id, source: str = "manual") -> None:
+        """
+        Stores that raw_value means data_id in column_name.
+
+        Args:
+            column_name (str): Database column, e.g. "ORG_ID".
+            raw_value (str): Value as it appeared in the roster; stored normalized.
+            data_id: Database ID it resolves to.
+            source (str): Who decided it, e.g. "gui".
+        """
+        self._append({
+            "column": column_name,
+            "value": normalize(raw_value),
+            "raw": raw_value,
+            "id": data_id,
+            "source": source,
+            "recorded_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        })
+
+    def forget(self, column_name: str, raw_value: str, source: str = "manual") -> None:
+        """Drops a learned resolution (appends a null entry)."""
+        self.record(column_name, raw_value, None, source)
+
+    def compact(self) -> int:
+        """
+        Rewrites the file with one line per live key, dropping superseded and forgotten
+        entries. Returns the number of lines kept.
+        """
+        with self._lock:
+            table = self._build()
+            lines = [
+                json.dumps({"column": column, "value": value, "id": data_id}, ensure_ascii=False) + "\n"
+                for column, values in table.items()
+                for value, data_id in values.items()
+            ]
+            temp_path = self.path + ".tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.writelines(lines)
+            os.replace(temp_path, self.path)
+        return len(lines)
+
+
+_stores = {}
+
+def get_learned_store(path: str = LEARNED_RESOLUTIONS_PATH) -> LearnedResolutionStore:
+    """Returns the process-wide store for a path."""
+    store = _stores.get(path)
+    if store is None:
+        store = _stores.setdefault(path, LearnedResolutionStore(path))
+    return store
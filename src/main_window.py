@@ -1,11 +1,15 @@
+import os
 from PySide6.QtWidgets import (
-    QMainWindow, QPushButton, QFileDialog, QTableWidget, QTableWidgetItem, 
+    QMainWindow, QPushButton, QFileDialog, QTableView, 
     QVBoxLayout, QHBoxLayout, QWidget, QLabel, QComboBox, QDialog, 
-    QDialogButtonBox, QMessageBox, QSplitter, QGroupBox
+    QDialogButtonBox, QMessageBox, QSplitter, QGroupBox, QProgressBar
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QThreadPool
 from cleaner import *
-import copy
+from workers import PipelineWorker
+from table_model import RosterTableModel, resize_columns_from_sample
+from learned import get_learned_store
+from instrumentation import RunReport, RUN_REPORT_SUFFIX
 
 class ColumnMappingDialog(QDialog):
     """Dialog for manually mapping unmapped columns."""
@@ -68,6 +72,63 @@ class ColumnMappingDialog(QDialog):
         return mappings
 
 
+class ValueReviewDialog(QDialog):
+    """Dialog for resolving values the cleaner could not match; choices are remembered."""
+    LEAVE_AS_IS = "-- Leave as is --"
+    
+    def __init__(self, unmatched_values, parent=None):
+        """
+        Args:
+            unmatched_values (dict[str, list[str]]): column -> raw values left unmatched.
+        """
+        super().__init__(parent)
+        self.setWindowTitle("Review Unmatched Values")
+        self.setModal(True)
+        self.resize(600, 500)
+        
+        layout = QVBoxLayout()
+        instructions = QLabel(
+            "These values did not match anything in the database.\n"
+            "Pick what each one means; your choices are saved and applied to future files:"
+        )
+        instructions.setWordWrap(True)
+        layout.addWidget(instructions)
+        
+        # (column, raw value) -> (combo, canonical name -> id)
+        self.combo_boxes = {}
+        for column_name, values in unmatched_values.items():
+            options = create_mapping(column_name)
+            group = QGroupBox(f"Column: {column_name}")
+            group_layout = QVBoxLayout()
+            for raw_value in values:
+                combo = QComboBox()
+                combo.addItem(self.LEAVE_AS_IS)
+                combo.addItems(sorted(options, key=str.lower))
+                group_layout.addWidget(QLabel(f"'{raw_value}' means:"))
+                group_layout.addWidget(combo)
+                self.combo_boxes[(column_name, raw_value)] = (combo, options)
+            group.setLayout(group_layout)
+            layout.addWidget(group)
+        
+        button_box = QDialogButtonBox(
+            QDialogButtonBox.Ok | QDialogButtonBox.Cancel
+        )
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
+        
+        self.setLayout(layout)
+    
+    def get_resolutions(self) -> list[tuple[str, str, object]]:
+        """Returns (column, raw value, data_id) for every value the user resolved."""
+        resolutions = []
+        for (column_name, raw_value), (combo, options) in self.combo_boxes.items():
+            selected = combo.currentText()
+            if selected != self.LEAVE_AS_IS:
+                resolutions.append((column_name, raw_value, options[selected]))
+        return resolutions
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -79,6 +140,13 @@ class MainWindow(QMainWindow):
         self.raw_data = None
         self.cleaned_data = None
         self.column_mapping = None
+        self.resolution_caches = {}
+        self.pipeline = None
+        self.unmatched_values = {}
+        self.run_report = RunReport("gui")
+        self.active_worker = None
+        self.export_path = None
+        self.thread_pool = QThreadPool.globalInstance()
         
         # Main layout
         main_layout = QVBoxLayout()
@@ -95,12 +163,32 @@ class MainWindow(QMainWindow):
         self.clean_button.setEnabled(False)
         button_layout.addWidget(self.clean_button)
         
-        self.export_button = QPushButton("3. Export to TSV")
+        self.review_button = QPushButton("Review Unmatched")
+        self.review_button.clicked.connect(self.review_unmatched)
+        self.review_button.setEnabled(False)
+        button_layout.addWidget(self.review_button)
+        
+        self.export_button = QPushButton("3. Export")
         self.export_button.clicked.connect(self.export_to_tsv)
         self.export_button.setEnabled(False)
         button_layout.addWidget(self.export_button)
         
         button_layout.addStretch()
+        
+        # CSV reader: the pyarrow parser or csv.reader; pandas reshapes ragged rows, so it's batch-only
+        button_layout.addWidget(QLabel("CSV reader:"))
+        self.reader_combo = QComboBox()
+        self.reader_combo.addItems(DROP_IN_READERS)
+        self.reader_combo.setCurrentText(DEFAULT_ROSTER_READER)
+        button_layout.addWidget(self.reader_combo)
+        
+        # Export format: TSV text or typed Parquet / Arrow IPC
+        button_layout.addWidget(QLabel("Export as:"))
+        self.format_combo = QComboBox()
+        self.format_combo.addItems(EXPORT_FORMATS)
+        self.format_combo.setCurrentText(DEFAULT_EXPORT_FORMAT)
+        button_layout.addWidget(self.format_combo)
+        
         main_layout.addLayout(button_layout)
         
         # Status label
@@ -108,13 +196,25 @@ class MainWindow(QMainWindow):
         self.status_label.setStyleSheet("padding: 10px; background-color: #f0f0f0;")
         main_layout.addWidget(self.status_label)
         
+        # Progress bar for background cleaning/export
+        progress_layout = QHBoxLayout()
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        progress_layout.addWidget(self.progress_bar)
+        
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.cancel_worker)
+        self.cancel_button.setVisible(False)
+        progress_layout.addWidget(self.cancel_button)
+        main_layout.addLayout(progress_layout)
+        
         # Splitter for side-by-side tables
         splitter = QSplitter(Qt.Horizontal)
         
         # Raw data table
         raw_group = QGroupBox("Raw CSV Data")
         raw_layout = QVBoxLayout()
-        self.raw_table = QTableWidget()
+        self.raw_table = QTableView()
         raw_layout.addWidget(self.raw_table)
         raw_group.setLayout(raw_layout)
         splitter.addWidget(raw_group)
@@ -122,7 +222,7 @@ class MainWindow(QMainWindow):
         # Cleaned data table
         cleaned_group = QGroupBox("Cleaned Data (Preview)")
         cleaned_layout = QVBoxLayout()
-        self.cleaned_table = QTableWidget()
+        self.cleaned_table = QTableView()
         cleaned_layout.addWidget(self.cleaned_table)
         cleaned_group.setLayout(cleaned_layout)
         splitter.addWidget(cleaned_group)
@@ -143,7 +243,14 @@ class MainWindow(QMainWindow):
             return
         
         self.csv_file_path = file_path
-        self.raw_data = readCSV(file_path)
+        # one report per loaded file; each clean and export restarts it from the stages before it
+        self.run_report = RunReport(os.path.basename(file_path))
+        reader = self.reader_combo.currentText()
+        self.run_report.meta["reader"] = reader
+        with self.run_report.stage("read_csv") as stage:
+            # columnar and dictionary encoded; cleaning then resolves each distinct value once
+            self.raw_data = read_roster(file_path, reader)
+            stage["rows"] = max(len(self.raw_data or []) - 1, 0)
         
         if not self.raw_data:
             QMessageBox.critical(self, "Error", "Failed to read CSV file!")
@@ -155,8 +262,10 @@ class MainWindow(QMainWindow):
         # Update UI state
         self.status_label.setText(f"✓ Loaded: {file_path} ({len(self.raw_data)-1} rows)")
         self.clean_button.setEnabled(True)
-        self.cleaned_table.clear()
+        self.cleaned_table.setModel(None)
         self.cleaned_data = None
+        self.unmatched_values = {}
+        self.review_button.setEnabled(False)
     
     def clean_csv(self):
         """Clean the CSV data."""
@@ -166,50 +275,29 @@ class MainWindow(QMainWindow):
         
         self.status_label.setText("Cleaning data...")
         
-        # Make a copy to clean
-        self.cleaned_data = copy.deepcopy(self.raw_data)
-        
-        # Columns that need cleaning
-        columns_to_clean = ['GENDER_ID', 'ETHNICITY_ID', 'ORG_ID']
-        
-        failed_columns = []
-        for column_name in columns_to_clean:
-            try:
-                result = clean_column(column_name, self.cleaned_data)
-                if result is None:
-                    # Column not found automatically
-                    failed_columns.append(column_name)
-                else:
-                    self.cleaned_data = result
-            except Exception as e:
-                QMessageBox.warning(
-                    self, 
-                    "Cleaning Error", 
-                    f"Error cleaning {column_name}: {str(e)}"
-                )
+        # one resolution cache per column so each distinct raw value is resolved once
+        self.resolution_caches = {column_name: ResolutionCache() for column_name in COLUMNS_TO_CLEAN}
+        pipeline = CleaningPipeline(COLUMNS_TO_CLEAN, caches=self.resolution_caches)
+        self.pipeline = pipeline
+        
+        csv_headers = self.raw_data[0]
+        # cleaning again (e.g. after a review) replaces the previous clean instead of adding to it
+        self.run_report = self.run_report.restart(["read_csv"])
+        with self.run_report.stage("map_headers"):
+            failed_columns = pipeline.prepare(csv_headers)
         
         # Handle unmapped columns
         if failed_columns:
-            csv_headers = self.raw_data[0]
             dialog = ColumnMappingDialog(failed_columns, csv_headers, self)
             
             if dialog.exec() == QDialog.Accepted:
                 manual_mappings = dialog.get_mappings()
                 
-                # Clean columns with manual mappings
                 for column_name in failed_columns:
                     csv_col = manual_mappings.get(column_name)
                     if csv_col:
-                        # Temporarily modify headers to match
-                        original_header = csv_headers[csv_headers.index(csv_col)]
-                        csv_headers[csv_headers.index(csv_col)] = column_name
-                        
-                        result = clean_column(column_name, self.cleaned_data)
-                        if result:
-                            self.cleaned_data = result
-                        
-                        # Restore original header
-                        csv_headers[csv_headers.index(column_name)] = original_header
+                        pipeline.column_positions[column_name] = csv_headers.index(csv_col)
+                pipeline.prepare(csv_headers)
             else:
                 QMessageBox.information(
                     self,
@@ -217,79 +305,215 @@ class MainWindow(QMainWindow):
                     "Column mapping cancelled. Data partially cleaned."
                 )
         
+        # Column-wise pass over the roster on a worker thread; raw_data stays untouched for the preview
+        raw_data = self.raw_data
+        report = self.run_report
+        worker = PipelineWorker(
+            lambda progress: pipeline.run(raw_data, progress_callback=progress, report=report)
+        )
+        worker.signals.finished.connect(self.on_clean_finished)
+        worker.signals.failed.connect(self.on_clean_failed)
+        worker.signals.cancelled.connect(self.on_clean_cancelled)
+        self.start_worker(worker, len(raw_data) - 1, "Cleaning data...")
+    
+    def on_clean_finished(self, cleaned_data):
+        self.finish_worker()
+        self.cleaned_data = cleaned_data
+        
         # Display cleaned data
         self.display_table(self.cleaned_table, self.cleaned_data)
         
-        self.status_label.setText("✓ Data cleaned successfully!")
+        self.unmatched_values = {
+            column_name: sorted(resolver.unmatched)
+            for column_name, resolver in self.pipeline.resolvers.items()
+            if resolver.unmatched
+        }
+        unmatched_count = sum(len(values) for values in self.unmatched_values.values())
+        self.status_label.setText(
+            f"✓ Data cleaned successfully! {unmatched_count} unmatched values. {self.format_cache_stats()}\n"
+            f"Timings: {self.run_report.format_breakdown()}"
+        )
         self.export_button.setEnabled(True)
+        self.review_button.setEnabled(unmatched_count > 0)
+    
+    def review_unmatched(self):
+        """Let the user resolve unmatched values, remember the choices and clean again."""
+        if not self.unmatched_values:
+            return
+        dialog = ValueReviewDialog(self.unmatched_values, self)
+        if dialog.exec() != QDialog.Accepted:
+            return
+        
+        resolutions = dialog.get_resolutions()
+        if not resolutions:
+            return
+        store = get_learned_store()
+        for column_name, raw_value, data_id in resolutions:
+            store.record(column_name, raw_value, data_id, source="gui")
+        
+        # resolvers snapshot the store when created, so a fresh run applies the new choices
+        self.clean_csv()
+    
+    def on_clean_failed(self, message: str):
+        self.on_worker_failed("Cleaning Error", f"Error cleaning data: {message}")
+    
+    def on_clean_cancelled(self):
+        self.on_worker_cancelled("Cleaning cancelled.")
+    
+    def format_cache_stats(self) -> str:
+        """Summarizes how many lookups the resolution caches skipped."""
+        parts = []
+        for column_name, cache in self.resolution_caches.items():
+            stats = cache.stats()
+            parts.append(
+                f"{column_name}: {stats['misses']} distinct / {stats['hits'] + stats['misses']} rows "
+                f"({stats['hit_rate']:.0%} cached)"
+            )
+        return "Resolution cache: " + "; ".join(parts)
     
     def export_to_tsv(self):
-        """Export cleaned data to TSV file."""
+        """Export cleaned data to a TSV, Parquet or Arrow file, per the format selector."""
         if not self.cleaned_data:
             QMessageBox.warning(self, "Warning", "Please clean the CSV first!")
             return
         
+        export_format = self.format_combo.currentText()
+        suffix = EXPORT_SUFFIXES[export_format]
+        try:
+            resolve_export_format(export_format)
+        except ImportError:
+            QMessageBox.critical(self, "Error", f"Exporting {export_format} files requires pyarrow!")
+            return
+        
         # Get save location
         tsv_path, _ = QFileDialog.getSaveFileName(
-            self, "Save TSV", "", "TSV Files (*.tsv)"
+            self, f"Save {export_format.upper()}", "", f"{export_format.upper()} Files (*{suffix})"
         )
         if not tsv_path:
             return
         
-        if not tsv_path.endswith('.tsv'):
-            tsv_path += '.tsv'
+        tsv_path = export_path(tsv_path, export_format)
         
         try:
-            # Save cleaned data to temporary CSV
-            temp_csv = self.csv_file_path.replace('.csv', '_cleaned_temp.csv')
-            with open(temp_csv, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerows(self.cleaned_data)
-            
-            # Map columns
-            column_mapping = map_csv_to_tsv_columns(temp_csv)
-            
-            if not column_mapping:
-                QMessageBox.critical(self, "Error", "Failed to map columns!")
-                return
-            
-            # Transfer to TSV
-            success = transfer_csv_to_tsv_with_mapping(
-                temp_csv, tsv_path, column_mapping
+            # Map columns straight from the cleaned header row
+            column_mapping = map_headers_to_tsv_columns(self.cleaned_data[0])
+        except ValueError as e:
+            QMessageBox.critical(self, "Error", f"Failed to map columns: {str(e)}")
+            return
+        
+        # Transfer in a single write pass on a worker thread
+        self.export_path = tsv_path
+        cleaned_data = self.cleaned_data
+        report = self.run_report = self.run_report.restart(["read_csv", "map_headers", "clean"])
+        worker = PipelineWorker(
+            lambda progress: transfer_rows_to_tsv_with_mapping(
+                cleaned_data, tsv_path, column_mapping, progress_callback=progress, report=report,
+                export_format=export_format
             )
-            
-            # Clean up temp file
-            if os.path.exists(temp_csv):
-                os.remove(temp_csv)
-            
-            if success:
-                QMessageBox.information(
-                    self,
-                    "Success",
-                    f"Data exported successfully to:\n{tsv_path}"
-                )
-                self.status_label.setText(f"✓ Exported to: {tsv_path}")
-            else:
-                QMessageBox.critical(self, "Error", "Failed to export TSV!")
-                
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Export failed: {str(e)}")
+        )
+        worker.signals.finished.connect(self.on_export_finished)
+        worker.signals.failed.connect(self.on_export_failed)
+        worker.signals.cancelled.connect(self.on_export_cancelled)
+        self.start_worker(worker, len(cleaned_data) - 1, f"Exporting to {export_format.upper()}...")
+    
+    def on_export_finished(self, success: bool):
+        self.finish_worker()
+        tsv_path = self.export_path
+        if success:
+            QMessageBox.information(
+                self,
+                "Success",
+                f"Data exported successfully to:\n{tsv_path}"
+            )
+            # the run report sits next to the export for later comparison
+            self.run_report.write_json(os.path.splitext(tsv_path)[0] + RUN_REPORT_SUFFIX)
+            rejected = ", ".join(
+                f"{column_name}: {count}" for column_name, count in self.run_report.meta.get("rejected", {}).items()
+            )
+            rejected = f"\nNon-integer values exported as empty: {rejected}" if rejected else ""
+            self.status_label.setText(
+                f"✓ Exported to: {tsv_path}\nTimings: {self.run_report.format_breakdown()}{rejected}"
+            )
+        else:
+            self.remove_partial_export()
+            self.status_label.setText("✗ Export failed.")
+            QMessageBox.critical(self, "Error", "Failed to export!")
+    
+    def on_export_failed(self, message: str):
+        self.remove_partial_export()
+        self.on_worker_failed("Error", f"Export failed: {message}")
+    
+    def on_export_cancelled(self):
+        self.remove_partial_export()
+        self.on_worker_cancelled("Export cancelled.")
+    
+    def remove_partial_export(self):
+        """Deletes a half-written export after a failed or cancelled run."""
+        if self.export_path and os.path.exists(self.export_path):
+            os.remove(self.export_path)
+    
+    # BACKGROUND WORKERS
+    
+    def start_worker(self, worker: PipelineWorker, total_rows: int, message: str):
+        """Runs a worker on the thread pool and switches the UI into progress mode."""
+        self.active_worker = worker
+        worker.signals.progress.connect(self.on_worker_progress)
+        
+        self.progress_bar.setRange(0, max(total_rows, 1))
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        self.cancel_button.setEnabled(True)
+        self.cancel_button.setVisible(True)
+        for button in (self.upload_button, self.clean_button, self.export_button, self.review_button):
+            button.setEnabled(False)
+        
+        self.status_label.setText(message)
+        self.thread_pool.start(worker)
+    
+    def finish_worker(self):
+        """Restores the UI once the active worker is done, whatever the outcome."""
+        self.active_worker = None
+        self.progress_bar.setVisible(False)
+        self.cancel_button.setVisible(False)
+        self.upload_button.setEnabled(True)
+        self.clean_button.setEnabled(self.raw_data is not None)
+        self.export_button.setEnabled(self.cleaned_data is not None)
+        self.review_button.setEnabled(self.cleaned_data is not None and bool(self.unmatched_values))
+    
+    def on_worker_progress(self, rows_processed: int, rows_per_sec: float):
+        self.progress_bar.setValue(rows_processed)
+        self.status_label.setText(
+            f"Processed {rows_processed:,} / {self.progress_bar.maximum():,} rows ({rows_per_sec:,.0f} rows/sec)"
+        )
+    
+    def on_worker_failed(self, title: str, message: str):
+        self.finish_worker()
+        self.status_label.setText(f"✗ {message}")
+        QMessageBox.warning(self, title, message)
+    
+    def on_worker_cancelled(self, message: str):
+        self.finish_worker()
+        self.status_label.setText(message)
+    
+    def cancel_worker(self):
+        if self.active_worker is not None:
+            self.active_worker.cancel()
+            self.cancel_button.setEnabled(False)
+            self.status_label.setText("Cancelling...")
+    
+    def closeEvent(self, event):
+        # stop any running worker before the window goes away
+        self.cancel_worker()
+        self.thread_pool.waitForDone()
+        super().closeEvent(event)
     
     def display_table(self, table, data):
-        """Display data in a table widget."""
+        """Display data in a table view. Cells are created lazily by the model."""
         if not data:
             return
         
-        headers = data[0]
-        rows = data[1:]
-        
-        table.clear()
-        table.setColumnCount(len(headers))
-        table.setHorizontalHeaderLabels(headers)
-        table.setRowCount(len(rows))
-        
-        for row_ind, row in enumerate(rows):
-            for col_ind, val in enumerate(row):
-                table.setItem(row_ind, col_ind, QTableWidgetItem(str(val)))
-        
-        table.resizeColumnsToContents()
\ No newline at end of file
+        old_model = table.model()
+        table.setModel(RosterTableModel(data, table))
+        if old_model is not None:
+            old_model.deleteLater()
+        resize_columns_from_sample(table)
@@ -0,0 +1,180 @@
+from collections import deque
+
+class ValueMatcher:
+    """
+    Prebuilt matcher over the normalized keys of a column's lookup table.
+
+    Reproduces the substring fallback in clean_column, which walks every key in
+    insertion order and returns the first one where `key in value or value in key`,
+    without scanning every key for every row:
+
+    - `key in value` is answered by an Aho-Corasick automaton built over the keys,
+      so one pass over the value finds every key that occurs inside it.
+    - `value in key` is answered by a trigram inverted index over the keys; only
+      keys sharing every trigram of the value are verified with `in`. Values shorter
+      than a trigram use a precomputed table of short substrings.
+
+    Both searches return key positions, and the smallest position wins, which is the
+    same "first match" the linear loop would have returned.
+    
+    Empty keys (e.g. the "" synonym of NULL) are left to exact matching: as substrings
+    they would match every value and hide every unknown organization.
+    """
+
+    GRAM_SIZE = 3
+
+    def __init__(self, normalized_lookup: dict[str, object]):
+        """
+        Args:
+            normalized_lookup (dict[str, object]): normalized_value -> data_id, in the
+            same order clean_column builds it.
+        """
+        self.keys = list(normalized_lookup.keys())
+        self.values = list(normalized_lookup.values())
+
+        self._build_automaton()
+        self._build_gram_index()
+
+    # BUILD
+
+    def _build_automaton(self) -> None:
+        # goto[state] maps char -> next state, out[state] is the lowest key position
+        # that ends at this state (following failure links), or None
+        goto = [{}]
+        out = [None]
+
+        for pos, key in enumerate(self.keys):
+            if not key:
+                continue
+            state = 0
+            for char in key:
+                nxt = goto[state].get(char)
+                if nxt is None:
+                    goto.append({})
+                    out.append(None)
+                    nxt = len(goto) - 1
+                    goto[state][char] = nxt
+                state = nxt
+            if out[state] is None:
+                out[state] = pos
+
+        # breadth-first pass to fill failure links and merge outputs
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and char not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(char, 0) if goto[f].get(char, 0) != nxt else 0
+                inherited = out[fail[nxt]]
+                if inherited is not None and (out[nxt] is None or inherited < out[nxt]):
+                    out[nxt] = inherited
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+    def _build_gram_index(self) -> None:
+        n = self.GRAM_SIZE
+        grams = {}
+        short = {}
+
+        for pos, key in enumerate(self.keys):
+            for i in range(len(key) - n + 1):
+                grams.setdefault(key[i:i + n], set()).add(pos)
+            # every substring shorter than a gram, mapped to the first key holding it
+            for size in range(1, n):
+                for i in range(len(key) - size + 1):
+                    short.setdefault(key[i:i + size], pos)
+
+        self._grams = {gram: sorted(positions) for gram, positions in grams.items()}
+        self._short = short
+
+    # SEARCH
+
+    def _first_key_in_value(self, value: str) -> int | None:
+        """Lowest key position where key is a substring of value."""
+        goto, fail, out = self._goto, self._fail, self._out
+        best = None
+        state = 0
+        for char in value:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            pos = out[state]
+            if pos is not None and (best is None or pos < best):
+                best = pos
+                if best == 0:
+                    break
+        return best
+
+    def _first_value_in_key(self, value: str) -> int | None:
+        """Lowest key position where value is a substring of key."""
+        if not value:
+            return next((pos for pos, key in enumerate(self.keys) if key), None)
+
+        n = self.GRAM_SIZE
+        if len(value) < n:
+            return self._short.get(value)
+
+        # intersect postings of the value's trigrams, rarest first
+        postings = []
+        for i in range(len(value) - n + 1):
+            positions = self._grams.get(value[i:i + n])
+            if positions is None:
+                return None
+            postings.append(positions)
+        postings.sort(key=len)
+
+        candidates = postings[0]
+        for other in postings[1:]:
+            other_set = set(other)
+            candidates = [pos for pos in candidates if pos in other_set]
+            if not candidates:
+                return None
+
+        for pos in candidates:  # already in ascending order
+            if value in self.keys[pos]:
+                return pos
+        return None
+
+    def find_position(self, normalized_value: str) -> int | None:
+        """
+        Returns the position of the first key that matches normalized_value by
+        substring in either direction, or None if nothing matches.
+        """
+        contained = self._first_key_in_value(normalized_value)
+        if contained == 0:
+            return 0
+        containing = self._first_value_in_key(normalized_value)
+
+        if contained is None:
+            return containing
+        if containing is None:
+            return contained
+        return min(contained, containing)
+
+    def match(self, normalized_value: str):
+        """
+        Returns the data_id of the first matching key, or None if nothing matches.
+        """
+        pos = self.find_position(normalized_value)
+        return None if pos is None else self.values[pos]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+def linear_match(normalized_lookup: dict[str, object], normalized_value: str):
+    """
+    Reference implementation of the original per-row substring scan.
+    Kept for benchmarks and equivalence tests. Unlike ValueMatcher it still lets an
+    empty key match every value, so the two agree on lookups without empty keys.
+    """
+    for key, value in normalized_lookup.items():
+        if key in normalized_value or normalized_value in key:
+            return value
+    return None
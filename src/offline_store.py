@@ -0,0 +1,367 @@
+"""
+Offline analytics store for the dashboard: an embedded SQLite file with the same raw
+tables as Snowflake, the fiscal_summary.py tables rebuilt locally, and portable
+versions of the chart queries. Charts render from it without a network connection.
+
+Populate it from exported TSVs, a Snowflake snapshot, or deterministic sample data:
+    python src/offline_store.py snapshot
+    python src/offline_store.py load data/batch_output/*.tsv
+    python src/offline_store.py sample --seed 0
+"""
+import argparse
+import csv
+import datetime
+import os
+import random
+import sqlite3
+import time
+import pandas as pd
+from cleaner import TSV_HEADERS
+
+OFFLINE_DB_PATH = 'data/offline/steamsync.db'
+INSERT_CHUNK_SIZE = 10_000 # rows per executemany / fetchmany
+
+# table -> columns, matching the Snowflake tables the dashboard reads
+RAW_TABLES = {
+    "EVENT_SESSION": ["EVENT_ID", "SESSION_ID", "TYPE_ID", "SESSION_START_DATE"],
+    "EVENT_ACTIVITY": ["EVENT_ID", "SESSION_ID", "ACTUAL_ATTENDEE_CNT", "RESERVED_ATTENDEE_CNT"],
+    "EVENT_STUDENT_DEMOGRAPHIC": TSV_HEADERS,
+}
+TEXT_COLUMNS = {"SESSION_START_DATE", "STUDENT_CODE", "POSTAL_CODE", "STUDENT_FIRST_NAME", "STUDENT_LAST_NAME"}
+
+# SQLite versions of the fiscal_summary.py tables (no IFF/MONTH/YEAR, no lateral aliases)
+OFFLINE_SUMMARY_STATEMENTS = {
+    "SESSION_FISCAL_YEAR": """
+        CREATE TABLE SESSION_FISCAL_YEAR AS
+        SELECT *, FISCAL_START_YEAR || '-' || (FISCAL_START_YEAR + 1) AS FISCAL_YEAR
+        FROM (
+            SELECT
+                EVENT_ID,
+                SESSION_ID,
+                TYPE_ID,
+                SESSION_START_DATE,
+                CASE WHEN CAST(strftime('%m', SESSION_START_DATE) AS INTEGER) >= 7
+                    THEN CAST(strftime('%Y', SESSION_START_DATE) AS INTEGER)
+                    ELSE CAST(strftime('%Y', SESSION_START_DATE) AS INTEGER) - 1
+                END AS FISCAL_START_YEAR
+            FROM EVENT_SESSION
+        );
+        """,
+    "FY_SESSION_DEMOGRAPHIC_SUMMARY": """
+        CREATE TABLE FY_SESSION_DEMOGRAPHIC_SUMMARY AS
+        SELECT
+            s.FISCAL_YEAR,
+            s.EVENT_ID,
+            s.SESSION_ID,
+            s.TYPE_ID,
+            d.GENDER_ID,
+            d.ETHNICITY_ID,
+            d.GRADE,
+            COUNT(*) AS STUDENT_COUNT
+        FROM EVENT_STUDENT_DEMOGRAPHIC d
+        JOIN SESSION_FISCAL_YEAR s
+            ON d.EVENT_ID = s.EVENT_ID
+           AND d.SESSION_ID = s.SESSION_ID
+        GROUP BY s.FISCAL_YEAR, s.EVENT_ID, s.SESSION_ID, s.TYPE_ID, d.GENDER_ID, d.ETHNICITY_ID, d.GRADE;
+        """,
+    "FY_SESSION_ATTENDANCE": """
+        CREATE TABLE FY_SESSION_ATTENDANCE AS
+        WITH esd_counts AS (
+            SELECT EVENT_ID, SESSION_ID, SUM(STUDENT_COUNT) AS STUDENT_COUNT
+            FROM FY_SESSION_DEMOGRAPHIC_SUMMARY
+            GROUP BY EVENT_ID, SESSION_ID
+        )
+        SELECT
+            s.FISCAL_YEAR,
+            s.EVENT_ID,
+            s.SESSION_ID,
+            s.TYPE_ID,
+            COALESCE(esd.STUDENT_COUNT, ea.ACTUAL_ATTENDEE_CNT, ea.RESERVED_ATTENDEE_CNT) AS FINAL_COUNT
+        FROM SESSION_FISCAL_YEAR s
+        LEFT JOIN esd_counts esd
+            ON s.EVENT_ID = esd.EVENT_ID
+           AND s.SESSION_ID = esd.SESSION_ID
+        LEFT JOIN EVENT_ACTIVITY ea
+            ON s.EVENT_ID = ea.EVENT_ID
+           AND s.SESSION_ID = ea.SESSION_ID;
+        """,
+}
+
+# SQLite versions of report_queries.REPORT_QUERIES, same (upper-case) result columns
+OFFLINE_REPORT_QUERIES = {
+    "students_per_fiscal_year": """
+        SELECT FISCAL_YEAR, SUM(FINAL_COUNT) AS TOTAL_STUDENTS
+        FROM FY_SESSION_ATTENDANCE
+        GROUP BY FISCAL_YEAR
+        ORDER BY FISCAL_YEAR;
+        """,
+    "ethnicity_percentages": """
+        WITH ethnicity_counts AS (
+            SELECT FISCAL_YEAR, ETHNICITY_ID, SUM(STUDENT_COUNT) AS STUDENT_COUNT
+            FROM FY_SESSION_DEMOGRAPHIC_SUMMARY
+            WHERE ETHNICITY_ID IS NOT NULL
+              AND FISCAL_YEAR IS NOT NULL
+            GROUP BY FISCAL_YEAR, ETHNICITY_ID
+        )
+        SELECT
+            FISCAL_YEAR,
+            CASE ETHNICITY_ID
+                WHEN 1 THEN 'American Indian or Alaska Native'
+                WHEN 2 THEN 'Asian'
+                WHEN 3 THEN 'Black or African American'
+                WHEN 4 THEN 'Hispanic or Latino'
+                WHEN 5 THEN 'White'
+                WHEN 6 THEN 'Native Hawaiian and Other Pacific Islander'
+                WHEN 7 THEN 'Multiracial'
+                WHEN 8 THEN 'Other Race'
+                ELSE 'Unknown'
+            END AS ETHNICITY,
+            ROUND(STUDENT_COUNT * 100.0 / SUM(STUDENT_COUNT) OVER (PARTITION BY FISCAL_YEAR), 2) AS PCT_OF_YEAR
+        FROM ethnicity_counts
+        ORDER BY FISCAL_YEAR, ETHNICITY;
+        """,
+    "gender_percentages": """
+        SELECT
+            FISCAL_YEAR,
+            ROUND(SUM(CASE WHEN GENDER_ID = 1 THEN STUDENT_COUNT ELSE 0 END) * 100.0
+                / NULLIF(SUM(CASE WHEN GENDER_ID IS NOT NULL THEN STUDENT_COUNT ELSE 0 END), 0), 2) AS PCT_MALE,
+            ROUND(SUM(CASE WHEN GENDER_ID = 2 THEN STUDENT_COUNT ELSE 0 END) * 100.0
+                / NULLIF(SUM(CASE WHEN GENDER_ID IS NOT NULL THEN STUDENT_COUNT ELSE 0 END), 0), 2) AS PCT_FEMALE,
+            ROUND(SUM(CASE WHEN GENDER_ID = 3 THEN STUDENT_COUNT ELSE 0 END) * 100.0
+                / NULLIF(SUM(CASE WHEN GENDER_ID IS NOT NULL THEN STUDENT_COUNT ELSE 0 END), 0), 2) AS PCT_OTHER
+        FROM FY_SESSION_DEMOGRAPHIC_SUMMARY
+        GROUP BY FISCAL_YEAR
+        ORDER BY FISCAL_YEAR;
+        """,
+    "grade_percentages": """
+        WITH grade_counts AS (
+            SELECT
+                FISCAL_YEAR,
+                CASE
+                    WHEN GRADE = 0 THEN 'K'
+                    WHEN GRADE = -1 THEN 'TK'
+                    ELSE CAST(GRADE AS TEXT)
+                END AS GRADE_LEVEL,
+                SUM(STUDENT_COUNT) AS STUDENT_COUNT
+            FROM FY_SESSION_DEMOGRAPHIC_SUMMARY
+            WHERE GRADE IS NOT NULL
+            GROUP BY FISCAL_YEAR, GRADE_LEVEL
+        )
+        SELECT
+            FISCAL_YEAR,
+            GRADE_LEVEL,
+            STUDENT_COUNT,
+            SUM(STUDENT_COUNT) OVER (PARTITION BY FISCAL_YEAR) AS FISCAL_TOTAL,
+            ROUND(STUDENT_COUNT * 100.0 / NULLIF(SUM(STUDENT_COUNT) OVER (PARTITION BY FISCAL_YEAR), 0), 2) AS PCT
+        FROM grade_counts
+        ORDER BY FISCAL_YEAR,
+                 CASE
+                    WHEN GRADE_LEVEL = 'TK' THEN 0
+                    WHEN GRADE_LEVEL = 'K'  THEN 1
+                    ELSE CAST(GRADE_LEVEL AS INTEGER)
+                 END;
+        """,
+    "event_type": """
+        SELECT
+            FISCAL_YEAR,
+            SUM(FINAL_COUNT) AS TOTAL_STUDENTS,
+            SUM(CASE WHEN TYPE_ID = 1 THEN FINAL_COUNT ELSE 0 END) AS CLASS,
+            SUM(CASE WHEN TYPE_ID = 2 THEN FINAL_COUNT ELSE 0 END) AS FIELD_TRIP,
+            SUM(CASE WHEN TYPE_ID = 3 THEN FINAL_COUNT ELSE 0 END) AS WORKSHOP,
+            SUM(CASE WHEN TYPE_ID = 4 THEN FINAL_COUNT ELSE 0 END) AS FUNDRAISER,
+            SUM(CASE WHEN TYPE_ID = 5 THEN FINAL_COUNT ELSE 0 END) AS CAMP,
+            SUM(CASE WHEN TYPE_ID = 6 THEN FINAL_COUNT ELSE 0 END) AS FUN_ACTIVITY
+        FROM FY_SESSION_ATTENDANCE
+        GROUP BY FISCAL_YEAR
+        ORDER BY FISCAL_YEAR;
+        """,
+}
+
+def connect_offline(db_path: str = OFFLINE_DB_PATH) -> sqlite3.Connection:
+    """
+    Opens (creating if needed) the offline store and makes sure the raw tables exist.
+    """
+    if db_path != ":memory:":
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    for table, columns in RAW_TABLES.items():
+        column_defs = ", ".join(
+            f"{column} {'TEXT' if column in TEXT_COLUMNS else 'INTEGER'}" for column in columns
+        )
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({column_defs})")
+    conn.commit()
+    return conn
+
+def insert_rows(conn: sqlite3.Connection, table: str, columns: list[str], rows) -> int:
+    """Inserts an iterable of row tuples in chunks. Returns the number of rows inserted."""
+    statement = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+    count = 0
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= INSERT_CHUNK_SIZE:
+            conn.executemany(statement, chunk)
+            count += len(chunk)
+            chunk = []
+    if chunk:
+        conn.executemany(statement, chunk)
+        count += len(chunk)
+    return count
+
+def load_tsv(conn: sqlite3.Connection, tsv_file_path: str, table: str = "EVENT_STUDENT_DEMOGRAPHIC") -> int:
+    """
+    Appends an exported TSV (header row = database column names) to a raw table.
+    Columns the table doesn't have are ignored and empty fields become NULL.
+
+    Returns:
+        int: Rows loaded.
+    """
+    with open(tsv_file_path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f, delimiter='\t')
+        headers = next(reader, None)
+        if headers is None:
+            return 0
+        positions = [(i, header) for i, header in enumerate(headers) if header in RAW_TABLES[table]]
+        columns = [header for _, header in positions]
+        rows = (
+            tuple(row[i] if i < len(row) and row[i] != "" else None for i, _ in positions)
+            for row in reader
+        )
+        with conn:
+            return insert_rows(conn, table, columns, rows)
+
+def snapshot_from_snowflake(snowflake_conn, conn: sqlite3.Connection) -> dict[str, int]:
+    """
+    Replaces the local raw tables with a copy of the Snowflake ones.
+
+    Returns:
+        dict[str, int]: table -> rows copied.
+    """
+    def local_value(value):
+        return value.isoformat() if isinstance(value, (datetime.date, datetime.datetime)) else value
+
+    def fetch(cur):
+        while True:
+            batch = cur.fetchmany(INSERT_CHUNK_SIZE)
+            if not batch:
+                return
+            for row in batch:
+                yield tuple(local_value(value) for value in row)
+
+    counts = {}
+    cur = snowflake_conn.cursor()
+    try:
+        for table, columns in RAW_TABLES.items():
+            cur.execute(f"SELECT {', '.join(columns)} FROM {table}")
+            with conn:
+                conn.execute(f"DELETE FROM {table}")
+                counts[table] = insert_rows(conn, table, columns, fetch(cur))
+    finally:
+        cur.close()
+    return counts
+
+def populate_sample_data(conn: sqlite3.Connection, seed: int = 0, sessions: int = 60, students_per_session: int = 25) -> dict[str, int]:
+    """
+    Replaces the raw tables with deterministic synthetic data (same seed, same rows),
+    for demos without Snowflake access and as a fixture for reporting tests.
+
+    Returns:
+        dict[str, int]: table -> rows written.
+    """
+    rng = random.Random(seed)
+    session_rows, activity_rows, student_rows = [], [], []
+    first_day = datetime.date(2021, 7, 1)
+
+    for session_id in range(1, sessions + 1):
+        event_id = (session_id - 1) // 3 + 1
+        start = first_day + datetime.timedelta(days=rng.randrange(4 * 365))
+        session_rows.append((event_id, session_id, rng.randint(1, 6), start.isoformat()))
+
+        attendees = rng.randint(students_per_session // 2, students_per_session)
+        activity_rows.append((event_id, session_id, attendees, students_per_session))
+        # every fourth session only has attendee counts, no roster
+        if session_id % 4 == 0:
+            continue
+        for n in range(attendees):
+            student_rows.append((
+                event_id, session_id, rng.randint(8, 18), rng.choice([-1, 0, *range(1, 13), None]),
+                rng.randint(1, 495), rng.choice([1, 2, 3, None]), rng.choice([*range(1, 9), None]),
+                f"S{session_id:04d}{n:03d}", f"9{rng.randint(1000, 1999)}", rng.choice([0, 1]),
+                f"First{n}", f"Last{n}",
+            ))
+
+    counts = {}
+    with conn:
+        for table, rows in zip(RAW_TABLES, (session_rows, activity_rows, student_rows)):
+            conn.execute(f"DELETE FROM {table}")
+            counts[table] = insert_rows(conn, table, RAW_TABLES[table], rows)
+    return counts
+
+def refresh_offline_summary(conn: sqlite3.Connection) -> list[dict]:
+    """
+    Rebuilds the local fiscal-year dimension and summary tables from the raw tables.
+
+    Returns:
+        list[dict]: One entry per table with its row count and seconds.
+    """
+    reports = []
+    with conn:
+        for table, statement in OFFLINE_SUMMARY_STATEMENTS.items():
+            start = time.perf_counter()
+            conn.execute(f"DROP TABLE IF EXISTS {table}")
+            conn.execute(statement)
+            rows = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            reports.append({"table": table, "rows": rows, "seconds": time.perf_counter() - start})
+    return reports
+
+def run_offline_reports(db_path: str = OFFLINE_DB_PATH, queries: dict[str, str] = OFFLINE_REPORT_QUERIES) -> dict[str, pd.DataFrame]:
+    """
+    Runs the dashboard queries against the offline store.
+
+    Returns:
+        dict[str, pd.DataFrame]: report name -> result, like reports.run_reports.
+
+    Raises:
+        FileNotFoundError: If the store hasn't been created yet.
+    """
+    if db_path != ":memory:" and not os.path.exists(db_path):
+        raise FileNotFoundError(f"No offline store at '{db_path}' (create one with src/offline_store.py)")
+    conn = sqlite3.connect(db_path)
+    try:
+        return {name: pd.read_sql(query, conn) for name, query in queries.items()}
+    finally:
+        conn.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the offline SQLite store used for dashboards without Snowflake.")
+    parser.add_argument("--db", default=OFFLINE_DB_PATH, help=f"Store path (default: {OFFLINE_DB_PATH})")
+    commands = parser.add_subparsers(dest="command", required=True)
+    load_parser = commands.add_parser("load", help="Append exported TSVs to EVENT_STUDENT_DEMOGRAPHIC")
+    load_parser.add_argument("tsv_files", nargs="+")
+    commands.add_parser("snapshot", help="Copy the raw tables from Snowflake")
+    sample_parser = commands.add_parser("sample", help="Fill the store with deterministic sample data")
+    sample_parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    conn = connect_offline(args.db)
+    try:
+        if args.command == "load":
+            for tsv_file_path in args.tsv_files:
+                print(f"✓ {tsv_file_path}: {load_tsv(conn, tsv_file_path):,} rows")
+        elif args.command == "snapshot":
+            from connection import get_connection_manager
+            with get_connection_manager().connection() as snowflake_conn:
+                counts = snapshot_from_snowflake(snowflake_conn, conn)
+            for table, rows in counts.items():
+                print(f"✓ {table}: {rows:,} rows")
+        else:
+            for table, rows in populate_sample_data(conn, args.seed).items():
+                print(f"✓ {table}: {rows:,} rows")
+
+        for report in refresh_offline_summary(conn):
+            print(f"{report['table']:31} {report['rows']:>10,} rows ({report['seconds']:.2f} s)")
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    main()
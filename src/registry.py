@@ -0,0 +1,106 @@
+import json
+import os
+import threading
+
+KEY_IDS_PATH = 'mappings/key_ids.json'
+COLUMN_SYNONYMS_PATH = 'mappings/column_synonyms.json'
+VALUE_SYNONYMS_PATH = 'mappings/value_synonyms.json'
+LEARNED_RESOLUTIONS_PATH = 'mappings/learned_resolutions.jsonl'
+
+class MappingRegistry:
+    """
+    Process-wide cache of the mapping JSON files.
+    
+    Each file is parsed once and re-parsed only when its modification time or size
+    changes. Values derived from the files (uppercase synonym sets, value lookups)
+    are cached alongside and rebuilt whenever one of their source files changes.
+    Cached objects are shared: callers must treat them as read-only.
+    """
+    def __init__(self):
+        self._files = {}    # abs path -> (signature, parsed json)
+        self._derived = {}  # key -> (signature of source files, value)
+        self._lock = threading.RLock()
+        self.loads = 0
+    
+    @staticmethod
+    def _file_signature(path: str) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def load(self, json_file_path: str):
+        """
+        Returns the parsed contents of a JSON file, re-reading it only if it changed.
+        
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            json.JSONDecodeError: If the file is not valid JSON.
+        """
+        path = os.path.abspath(json_file_path)
+        with self._lock:
+            signature = self._file_signature(path)
+            if signature is None:
+                self._files.pop(path, None)
+                raise FileNotFoundError(f"Mapping file '{json_file_path}' not found!")
+            
+            cached = self._files.get(path)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+            
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._files[path] = (signature, data)
+            self.loads += 1
+            return data
+    
+    def derive(self, key, source_paths: list[str], builder):
+        """
+        Returns a value computed from mapping files, rebuilding it only when one of
+        the source files changed (or appeared/disappeared) since the last build.
+        
+        Args:
+            key: Hashable cache key, e.g. ("value_lookup", "ORG_ID").
+            source_paths (list[str]): Files the value depends on.
+            builder (Callable[[], Any]): Computes the value.
+        """
+        with self._lock:
+            signature = tuple(self._file_signature(os.path.abspath(p)) for p in source_paths)
+            cached = self._derived.get(key)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+            
+            value = builder()
+            self._derived[key] = (signature, value)
+            return value
+    
+    def column_synonym_sets(self, json_file_path: str = COLUMN_SYNONYMS_PATH) -> dict[str, frozenset[str]]:
+        """
+        Returns:
+            dict[str, frozenset[str]]: TSV column -> uppercased synonyms, precomputed once per file version.
+        """
+        def build():
+            synonyms = self.load(json_file_path)
+            return {
+                target: frozenset(syn.upper() for syn in column_synonyms)
+                for target, column_synonyms in synonyms.items()
+            }
+        return self.derive(("column_synonym_sets", os.path.abspath(json_file_path)), [json_file_path], build)
+    
+    def invalidate(self, json_file_path: str | None = None) -> None:
+        """Drops one file (or everything) from the cache."""
+        with self._lock:
+            if json_file_path is None:
+                self._files.clear()
+                self._derived.clear()
+            else:
+                self._files.pop(os.path.abspath(json_file_path), None)
+                self._derived.clear()
+
+
+_registry = MappingRegistry()
+
+def get_registry() -> MappingRegistry:
+    """Returns the process-wide mapping registry."""
+    return _registry
@@ -0,0 +1,126 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import pandas as pd
+
+REPORT_PACK_DIR = 'reports'
+REPORT_FORMATS = ("png", "svg", "pdf")
+MANIFEST_FILE_NAME = "manifest.json"
+
+def init_render_worker() -> None:
+    """
+    Process pool initializer: selects the non-interactive Agg backend before pyplot
+    is imported, so charts render without a display.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+
+def render_chart(chart_name: str, df: pd.DataFrame, output_dir: str, formats: tuple[str, ...] = REPORT_FORMATS) -> dict:
+    """
+    Renders one chart from its query result and saves it once per format.
+    The figure is drawn once, written to every format and then closed.
+
+    Returns:
+        dict: Chart name, written files, seconds and an error message (None on success).
+    """
+    from data_visuals import CHARTS
+
+    plot, _, kwargs = CHARTS[chart_name]
+    output_paths = [os.path.join(output_dir, f"{chart_name}.{fmt}") for fmt in formats]
+    result = {"chart": chart_name, "files": output_paths, "seconds": 0.0, "error": None}
+    start = time.perf_counter()
+    try:
+        # the plot functions print their DataFrame; keep worker output to the summary line
+        with contextlib.redirect_stdout(io.StringIO()):
+            plot(None, None, df=df, output_paths=output_paths, **kwargs)
+    except Exception as e:
+        result["files"] = []
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+def build_report_pack(
+    results: dict[str, pd.DataFrame],
+    output_dir: str = REPORT_PACK_DIR,
+    formats: tuple[str, ...] = REPORT_FORMATS,
+    workers: int | None = None,
+    charts: list[str] | None = None
+) -> dict:
+    """
+    Renders every chart headlessly in a process pool and writes a manifest.
+
+    Args:
+        results (dict[str, pd.DataFrame]): report name -> query result, as returned by run_reports.
+        output_dir (str): Directory for the chart files and manifest.json.
+        formats (tuple[str, ...]): File formats to write, e.g. ("png", "pdf").
+        workers (int | None): Worker processes (defaults to one per chart, capped at the CPU count).
+        charts (list[str] | None): Chart names to render, all of CHARTS if omitted.
+
+    Returns:
+        dict: Manifest with per-chart results and the wall time.
+    """
+    # imported here so the parent process doesn't pick an interactive backend
+    init_render_worker()
+    from data_visuals import CHARTS
+
+    charts = list(CHARTS) if charts is None else charts
+    os.makedirs(output_dir, exist_ok=True)
+    workers = workers or min(len(charts), os.cpu_count() or 1)
+    start = time.perf_counter()
+
+    rendered = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_render_worker) as pool:
+        futures = {
+            pool.submit(render_chart, chart_name, results[CHARTS[chart_name][1]], output_dir, formats): chart_name
+            for chart_name in charts
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            rendered.append(result)
+            status = "✓" if result["error"] is None else "✗"
+            detail = ", ".join(os.path.basename(path) for path in result["files"]) or result["error"]
+            print(f"  {status} {result['chart']}: {detail} ({result['seconds']:.2f} s)")
+
+    rendered.sort(key=lambda result: charts.index(result["chart"]))
+    manifest = {
+        "workers": workers,
+        "formats": list(formats),
+        "failed": sum(1 for result in rendered if result["error"] is not None),
+        "wall_time": time.perf_counter() - start,
+        "charts": rendered,
+    }
+    with open(os.path.join(output_dir, MANIFEST_FILE_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+def main():
+    from reports import ReportCache, run_reports
+    from offline_store import OFFLINE_DB_PATH, run_offline_reports
+
+    parser = argparse.ArgumentParser(description="Render every dashboard chart to files without a display.")
+    parser.add_argument("-o", "--output-dir", default=REPORT_PACK_DIR, help="Where the charts and manifest are written")
+    parser.add_argument("-f", "--formats", nargs="+", default=list(REPORT_FORMATS), choices=REPORT_FORMATS,
+                        help="File formats to write (default: png svg pdf)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Worker processes (default: one per chart)")
+    parser.add_argument("--refresh", action="store_true", help="Ignore cached query results and re-run the queries")
+    parser.add_argument("--offline", nargs="?", const=OFFLINE_DB_PATH, default=None, metavar="DB",
+                        help=f"Read the local SQLite store instead of Snowflake (default: {OFFLINE_DB_PATH})")
+    args = parser.parse_args()
+
+    if args.offline:
+        results = run_offline_reports(args.offline)
+    else:
+        results = run_reports(cache=ReportCache(), refresh=args.refresh)
+    manifest = build_report_pack(results, args.output_dir, tuple(args.formats), args.workers)
+
+    print("\n" + "=" * 60)
+    print(f"Charts: {len(manifest['charts'])} ({manifest['failed']} failed) in {manifest['wall_time']:.2f} s")
+    print(f"Manifest: {os.path.join(args.output_dir, MANIFEST_FILE_NAME)}")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
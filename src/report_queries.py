@@ -0,0 +1,340 @@
+"""
+SQL for the fiscal-year dashboard in data_visuals.py.
+Each query returns one DataFrame consumed by the matching plot_* function.
+
+REPORT_QUERIES read the precomputed tables maintained by fiscal_summary.py.
+LEGACY_REPORT_QUERIES compute the same results from the raw tables; they are kept
+for benchmarks/bench_fiscal_summary.py and for databases without the summary tables.
+"""
+
+STUDENTS_PER_FISCAL_YEAR_QUERY = """
+            WITH esd_counts AS (
+        SELECT 
+            event_id,
+            session_id,
+            COUNT(*) AS student_count
+        FROM EVENT_STUDENT_DEMOGRAPHIC
+        GROUP BY event_id, session_id
+    ),
+    ea_counts AS (
+        SELECT
+            event_id,
+            session_id,
+            COALESCE(actual_attendee_cnt, reserved_attendee_cnt) AS activity_count
+        FROM EVENT_ACTIVITY
+    ),
+    combined AS (
+        SELECT
+            e.session_start_date,
+            COALESCE(esd.student_count, ea.activity_count) AS final_count
+        FROM EVENT_SESSION e
+        LEFT JOIN esd_counts esd
+            ON e.event_id = esd.event_id
+        AND e.session_id = esd.session_id
+        LEFT JOIN ea_counts ea
+            ON e.event_id = ea.event_id
+        AND e.session_id = ea.session_id
+    )
+    SELECT 
+        CASE 
+            WHEN MONTH(session_start_date) >= 7 
+                THEN TO_VARCHAR(YEAR(session_start_date)) || '-' || TO_VARCHAR(YEAR(session_start_date) + 1)
+            ELSE TO_VARCHAR(YEAR(session_start_date) - 1) || '-' || TO_VARCHAR(YEAR(session_start_date))
+        END AS fiscal_year,
+        SUM(final_count) AS total_students
+    FROM combined
+    GROUP BY fiscal_year
+    ORDER BY fiscal_year;
+    """
+
+ETHNICITY_PERCENTAGES_QUERY = """
+        WITH esd_with_fy AS (
+        SELECT 
+            CASE 
+                WHEN MONTH(s.session_start_date) >= 7 
+                    THEN TO_VARCHAR(YEAR(s.session_start_date)) || '-' || TO_VARCHAR(YEAR(s.session_start_date) + 1)
+                ELSE TO_VARCHAR(YEAR(s.session_start_date) - 1) || '-' || TO_VARCHAR(YEAR(s.session_start_date))
+            END AS fiscal_year,
+            esd.ethnicity_id
+        FROM EVENT_STUDENT_DEMOGRAPHIC esd
+        JOIN EVENT_SESSION s
+            ON esd.event_id = s.event_id
+        AND esd.session_id = s.session_id
+        WHERE esd.ethnicity_id IS NOT NULL
+    ),
+    ethnicity_counts AS (
+        SELECT 
+            fiscal_year,
+            ethnicity_id,
+            COUNT(*) AS student_count
+        FROM esd_with_fy
+        GROUP BY fiscal_year, ethnicity_id
+    ),
+    total_per_year AS (
+        SELECT 
+            fiscal_year,
+            SUM(student_count) AS total_students
+        FROM ethnicity_counts
+        GROUP BY fiscal_year
+    )
+    SELECT 
+        ec.fiscal_year,
+        CASE ec.ethnicity_id
+            WHEN 1 THEN 'American Indian or Alaska Native'
+            WHEN 2 THEN 'Asian'
+            WHEN 3 THEN 'Black or African American'
+            WHEN 4 THEN 'Hispanic or Latino'
+            WHEN 5 THEN 'White'
+            WHEN 6 THEN 'Native Hawaiian and Other Pacific Islander'
+            WHEN 7 THEN 'Multiracial'
+            WHEN 8 THEN 'Other Race'
+            ELSE 'Unknown'
+        END AS ethnicity,
+        ROUND((ec.student_count / t.total_students) * 100, 2) AS pct_of_year
+    FROM ethnicity_counts ec
+    JOIN total_per_year t
+        ON ec.fiscal_year = t.fiscal_year
+    ORDER BY ec.fiscal_year, ethnicity;
+    """
+
+GENDER_PERCENTAGES_QUERY = """
+            SELECT
+            CONCAT(
+                CASE WHEN MONTH(SES.session_start_date) >= 7 
+                    THEN YEAR(SES.session_start_date)
+                    ELSE YEAR(SES.session_start_date) - 1
+                END,
+                '-',
+                CASE WHEN MONTH(SES.session_start_date) >= 7
+                    THEN YEAR(SES.session_start_date) + 1
+                    ELSE YEAR(SES.session_start_date)
+                END
+            ) AS fiscal_year,
+            ROUND(SUM(CASE WHEN DEM.gender_id = 1 THEN 1 ELSE 0 END) * 100.0 / COUNT(DEM.gender_id), 2) AS pct_male,
+            ROUND(SUM(CASE WHEN DEM.gender_id = 2 THEN 1 ELSE 0 END) * 100.0 / COUNT(DEM.gender_id), 2) AS pct_female,
+            ROUND(SUM(CASE WHEN DEM.gender_id = 3 THEN 1 ELSE 0 END) * 100.0 / COUNT(DEM.gender_id), 2) AS pct_other
+        FROM
+            EVENT_STUDENT_DEMOGRAPHIC AS DEM
+        JOIN
+            EVENT_SESSION AS SES
+            ON DEM.session_id = SES.session_id
+        GROUP BY
+            CONCAT(
+                CASE WHEN MONTH(SES.session_start_date) >= 7 
+                    THEN YEAR(SES.session_start_date)
+                    ELSE YEAR(SES.session_start_date) - 1
+                END,
+                '-',
+                CASE WHEN MONTH(SES.session_start_date) >= 7
+                    THEN YEAR(SES.session_start_date) + 1
+                    ELSE YEAR(SES.session_start_date)
+                END
+            )
+        ORDER BY
+            fiscal_year;
+    """
+
+GRADE_PERCENTAGES_QUERY = """
+        WITH student_sessions AS (
+    SELECT
+        CASE 
+            WHEN MONTH(s.session_start_date) >= 7 
+            THEN TO_VARCHAR(YEAR(s.session_start_date)) || '-' || TO_VARCHAR(YEAR(s.session_start_date) + 1)
+            ELSE TO_VARCHAR(YEAR(s.session_start_date) - 1) || '-' || TO_VARCHAR(YEAR(s.session_start_date))
+        END AS fiscal_year,
+        CASE 
+            WHEN d.grade = 0 THEN 'K'
+            WHEN d.grade = -1 THEN 'TK'
+            ELSE TO_VARCHAR(d.grade)
+        END AS grade_level
+    FROM EVENT_STUDENT_DEMOGRAPHIC d
+    JOIN EVENT_SESSION s
+      ON d.event_id = s.event_id
+     AND d.session_id = s.session_id   -- <- important: join on both keys
+    WHERE d.grade IS NOT NULL
+)
+SELECT
+    fiscal_year,
+    grade_level,
+    COUNT(*) AS student_count,
+    SUM(COUNT(*)) OVER (PARTITION BY fiscal_year) AS fiscal_total,
+    ROUND(
+        COUNT(*) * 100.0 / NULLIF(SUM(COUNT(*)) OVER (PARTITION BY fiscal_year), 0),
+        2
+    ) AS pct
+FROM student_sessions
+GROUP BY fiscal_year, grade_level
+ORDER BY fiscal_year,
+         CASE 
+            WHEN grade_level = 'TK' THEN 0
+            WHEN grade_level = 'K'  THEN 1
+            ELSE TO_NUMBER(grade_level)
+         END;
+
+    """
+
+EVENT_TYPE_QUERY = """
+        WITH esd_counts AS (
+    SELECT 
+        event_id,
+        session_id,
+        COUNT(*) AS student_count
+    FROM EVENT_STUDENT_DEMOGRAPHIC
+    GROUP BY event_id, session_id
+),
+ea_counts AS (
+    SELECT
+        event_id,
+        session_id,
+        COALESCE(actual_attendee_cnt, reserved_attendee_cnt) AS activity_count
+    FROM EVENT_ACTIVITY
+),
+combined AS (
+    SELECT
+        e.session_start_date,
+        e.type_id,
+        COALESCE(esd.student_count, ea.activity_count) AS final_count
+    FROM EVENT_SESSION e
+    LEFT JOIN esd_counts esd
+        ON e.event_id = esd.event_id
+       AND e.session_id = esd.session_id
+    LEFT JOIN ea_counts ea
+        ON e.event_id = ea.event_id
+       AND e.session_id = ea.session_id
+),
+fiscal AS (
+    SELECT 
+        CASE 
+            WHEN MONTH(session_start_date) >= 7 
+                THEN TO_VARCHAR(YEAR(session_start_date)) || '-' || TO_VARCHAR(YEAR(session_start_date) + 1)
+            ELSE TO_VARCHAR(YEAR(session_start_date) - 1) || '-' || TO_VARCHAR(YEAR(session_start_date))
+        END AS fiscal_year,
+        type_id,
+        final_count
+    FROM combined
+)
+SELECT 
+    fiscal_year,
+    SUM(final_count) AS total_students,
+    SUM(CASE WHEN type_id = 1 THEN final_count ELSE 0 END) AS class,
+    SUM(CASE WHEN type_id = 2 THEN final_count ELSE 0 END) AS field_trip,
+    SUM(CASE WHEN type_id = 3 THEN final_count ELSE 0 END) AS workshop,
+    SUM(CASE WHEN type_id = 4 THEN final_count ELSE 0 END) AS fundraiser,
+    SUM(CASE WHEN type_id = 5 THEN final_count ELSE 0 END) AS camp,
+    SUM(CASE WHEN type_id = 6 THEN final_count ELSE 0 END) AS fun_activity
+FROM fiscal
+GROUP BY fiscal_year
+ORDER BY fiscal_year;
+    """
+
+# queries over the fiscal_summary.py tables, same columns as the legacy queries
+
+STUDENTS_PER_FISCAL_YEAR_SUMMARY_QUERY = """
+    SELECT
+        fiscal_year,
+        SUM(final_count) AS total_students
+    FROM FY_SESSION_ATTENDANCE
+    GROUP BY fiscal_year
+    ORDER BY fiscal_year;
+    """
+
+ETHNICITY_PERCENTAGES_SUMMARY_QUERY = """
+    WITH ethnicity_counts AS (
+        SELECT
+            fiscal_year,
+            ethnicity_id,
+            SUM(student_count) AS student_count
+        FROM FY_SESSION_DEMOGRAPHIC_SUMMARY
+        WHERE ethnicity_id IS NOT NULL
+          AND fiscal_year IS NOT NULL
+        GROUP BY fiscal_year, ethnicity_id
+    )
+    SELECT
+        fiscal_year,
+        CASE ethnicity_id
+            WHEN 1 THEN 'American Indian or Alaska Native'
+            WHEN 2 THEN 'Asian'
+            WHEN 3 THEN 'Black or African American'
+            WHEN 4 THEN 'Hispanic or Latino'
+            WHEN 5 THEN 'White'
+            WHEN 6 THEN 'Native Hawaiian and Other Pacific Islander'
+            WHEN 7 THEN 'Multiracial'
+            WHEN 8 THEN 'Other Race'
+            ELSE 'Unknown'
+        END AS ethnicity,
+        ROUND((student_count / SUM(student_count) OVER (PARTITION BY fiscal_year)) * 100, 2) AS pct_of_year
+    FROM ethnicity_counts
+    ORDER BY fiscal_year, ethnicity;
+    """
+
+GENDER_PERCENTAGES_SUMMARY_QUERY = """
+    SELECT
+        fiscal_year,
+        ROUND(SUM(IFF(gender_id = 1, student_count, 0)) * 100.0 / NULLIF(SUM(IFF(gender_id IS NOT NULL, student_count, 0)), 0), 2) AS pct_male,
+        ROUND(SUM(IFF(gender_id = 2, student_count, 0)) * 100.0 / NULLIF(SUM(IFF(gender_id IS NOT NULL, student_count, 0)), 0), 2) AS pct_female,
+        ROUND(SUM(IFF(gender_id = 3, student_count, 0)) * 100.0 / NULLIF(SUM(IFF(gender_id IS NOT NULL, student_count, 0)), 0), 2) AS pct_other
+    FROM FY_SESSION_DEMOGRAPHIC_SUMMARY
+    GROUP BY fiscal_year
+    ORDER BY fiscal_year;
+    """
+
+GRADE_PERCENTAGES_SUMMARY_QUERY = """
+    WITH grade_counts AS (
+        SELECT
+            fiscal_year,
+            CASE
+                WHEN grade = 0 THEN 'K'
+                WHEN grade = -1 THEN 'TK'
+                ELSE TO_VARCHAR(grade)
+            END AS grade_level,
+            SUM(student_count) AS student_count
+        FROM FY_SESSION_DEMOGRAPHIC_SUMMARY
+        WHERE grade IS NOT NULL
+        GROUP BY fiscal_year, grade_level
+    )
+    SELECT
+        fiscal_year,
+        grade_level,
+        student_count,
+        SUM(student_count) OVER (PARTITION BY fiscal_year) AS fiscal_total,
+        ROUND(student_count * 100.0 / NULLIF(fiscal_total, 0), 2) AS pct
+    FROM grade_counts
+    ORDER BY fiscal_year,
+             CASE
+                WHEN grade_level = 'TK' THEN 0
+                WHEN grade_level = 'K'  THEN 1
+                ELSE TO_NUMBER(grade_level)
+             END;
+    """
+
+EVENT_TYPE_SUMMARY_QUERY = """
+    SELECT
+        fiscal_year,
+        SUM(final_count) AS total_students,
+        SUM(IFF(type_id = 1, final_count, 0)) AS class,
+        SUM(IFF(type_id = 2, final_count, 0)) AS field_trip,
+        SUM(IFF(type_id = 3, final_count, 0)) AS workshop,
+        SUM(IFF(type_id = 4, final_count, 0)) AS fundraiser,
+        SUM(IFF(type_id = 5, final_count, 0)) AS camp,
+        SUM(IFF(type_id = 6, final_count, 0)) AS fun_activity
+    FROM FY_SESSION_ATTENDANCE
+    GROUP BY fiscal_year
+    ORDER BY fiscal_year;
+    """
+
+# report name -> query, in dashboard order
+REPORT_QUERIES = {
+    "students_per_fiscal_year": STUDENTS_PER_FISCAL_YEAR_SUMMARY_QUERY,
+    "ethnicity_percentages": ETHNICITY_PERCENTAGES_SUMMARY_QUERY,
+    "gender_percentages": GENDER_PERCENTAGES_SUMMARY_QUERY,
+    "grade_percentages": GRADE_PERCENTAGES_SUMMARY_QUERY,
+    "event_type": EVENT_TYPE_SUMMARY_QUERY,
+}
+
+LEGACY_REPORT_QUERIES = {
+    "students_per_fiscal_year": STUDENTS_PER_FISCAL_YEAR_QUERY,
+    "ethnicity_percentages": ETHNICITY_PERCENTAGES_QUERY,
+    "gender_percentages": GENDER_PERCENTAGES_QUERY,
+    "grade_percentages": GRADE_PERCENTAGES_QUERY,
+    "event_type": EVENT_TYPE_QUERY,
+}
@@ -0,0 +1,130 @@
+import hashlib
+import os
+import time
+import pandas as pd
+from connection import get_connection_manager
+from report_queries import REPORT_QUERIES
+
+REPORT_CACHE_DIR = '.cache/reports'
+REPORT_CACHE_TTL = 6 * 60 * 60 # seconds a cached result stays fresh
+POLL_INTERVAL = 0.25 # seconds between async status checks
+
+def query_key(query: str) -> str:
+    """Cache key for a query: sha256 of its whitespace-normalized text."""
+    return hashlib.sha256(" ".join(query.split()).encode("utf-8")).hexdigest()
+
+
+class ReportCache:
+    """
+    On-disk cache of query results as Parquet files, keyed by query hash.
+    Entries older than the TTL are treated as missing.
+    """
+    def __init__(self, cache_dir: str = REPORT_CACHE_DIR, ttl: float = REPORT_CACHE_TTL):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+    
+    def path_for(self, query: str) -> str:
+        return os.path.join(self.cache_dir, f"{query_key(query)}.parquet")
+    
+    def get(self, query: str) -> pd.DataFrame | None:
+        path = self.path_for(query)
+        try:
+            age = time.time() - os.path.getmtime(path)
+        except FileNotFoundError:
+            return None
+        if age > self.ttl:
+            return None
+        return pd.read_parquet(path)
+    
+    def put(self, query: str, df: pd.DataFrame) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.path_for(query)
+        temp_path = path + ".tmp"
+        df.to_parquet(temp_path, index=False)
+        os.replace(temp_path, path)
+    
+    def clear(self) -> None:
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".parquet"):
+                os.remove(os.path.join(self.cache_dir, name))
+
+
+def fetch_async(conn, queries: dict[str, str]) -> dict[str, pd.DataFrame]:
+    """
+    Submits every query with execute_async so the warehouse runs them concurrently,
+    then collects each result through Arrow with fetch_pandas_all.
+    
+    Args:
+        conn: Snowflake connection.
+        queries (dict[str, str]): report name -> SQL.
+        
+    Returns:
+        dict[str, pd.DataFrame]: report name -> result.
+    
+    Raises:
+        ProgrammingError: If a query fails.
+    """
+    cur = conn.cursor()
+    try:
+        query_ids = {}
+        for name, query in queries.items():
+            cur.execute_async(query)
+            query_ids[name] = cur.sfqid
+        
+        results = {}
+        for name, query_id in query_ids.items():
+            while conn.is_still_running(conn.get_query_status_throw_if_error(query_id)):
+                time.sleep(POLL_INTERVAL)
+            cur.get_results_from_sfqid(query_id)
+            results[name] = cur.fetch_pandas_all()
+        return results
+    finally:
+        cur.close()
+
+
+def run_reports(
+    queries: dict[str, str] = REPORT_QUERIES,
+    cache: ReportCache | None = None,
+    refresh: bool = False,
+    conn=None
+) -> dict[str, pd.DataFrame]:
+    """
+    Returns the result of every report query, reading fresh results from the Parquet
+    cache and running only the missing ones (concurrently) against Snowflake.
+    
+    Args:
+        queries (dict[str, str]): report name -> SQL, REPORT_QUERIES by default.
+        cache (ReportCache | None): Result cache, the default on-disk cache if omitted.
+        refresh (bool): Ignore cached results and re-run every query.
+        conn: Snowflake connection; a pooled session is borrowed if omitted.
+        
+    Returns:
+        dict[str, pd.DataFrame]: report name -> result, in the order of `queries`.
+    """
+    cache = cache if cache is not None else ReportCache()
+    results = {}
+    missing = {}
+    for name, query in queries.items():
+        df = None if refresh else cache.get(query)
+        if df is None:
+            missing[name] = query
+        else:
+            results[name] = df
+    
+    if missing:
+        start = time.perf_counter()
+        if conn is None:
+            with get_connection_manager().connection() as pooled_conn:
+                fetched = fetch_async(pooled_conn, missing)
+        else:
+            fetched = fetch_async(conn, missing)
+        print(f"Ran {len(missing)} report queries in {time.perf_counter() - start:.2f} s")
+        
+        for name, df in fetched.items():
+            cache.put(missing[name], df)
+            results[name] = df
+    
+    print(f"Reports: {len(queries) - len(missing)} from cache, {len(missing)} from Snowflake")
+    return {name: results[name] for name in queries}
@@ -0,0 +1,268 @@
+import json
+from collections import OrderedDict
+from utils import *
+from matcher import ValueMatcher
+from fuzzy import FuzzyMatcher
+from learned import LearnedResolutionStore, get_learned_store
+from registry import get_registry, KEY_IDS_PATH, VALUE_SYNONYMS_PATH
+
+DEFAULT_CACHE_SIZE = 4096
+UNMATCHED_PREVIEW = 10 # unmatched values listed per column when reporting them
+# columns with a fuzzy fallback -> minimum similarity (SequenceMatcher ratio) to accept a match
+FUZZY_THRESHOLDS = {"ORG_ID": 0.85}
+
+class ResolutionCache:
+    """
+    Bounded LRU cache of raw value -> resolved value for a single column.
+
+    Rosters repeat the same few hundred School/Ethnicity/Gender strings across every
+    row, so each distinct raw value only needs to be normalized and matched once.
+    """
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        if maxsize <= 0:
+            raise ValueError("Cache size must be positive!")
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, raw_value: str):
+        """Returns the cached entry for raw_value, or None on a miss."""
+        entry = self._entries.get(raw_value)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(raw_value)
+        self.hits += 1
+        return entry
+    
+    def put(self, raw_value: str, entry) -> None:
+        self._entries[raw_value] = entry
+        self._entries.move_to_end(raw_value)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+            
+    def record_hits(self, count: int) -> None:
+        """Counts lookups that were answered without consulting the cache (e.g. repeated categories)."""
+        self.hits += count
+            
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+    
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+    
+    def stats(self) -> dict[str, int | float]:
+        """
+        Returns:
+            dict[str, int | float]: hits, misses, evictions, size, maxsize and hit_rate.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hit_rate": self.hit_rate,
+        }
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+
+def build_value_lookup(column_name: str) -> dict[str, str]:
+    """
+    Builds the normalized lookup table used to clean a column.
+
+    Args:
+        column_name (str): The name of the column to clean (e.g., "GENDER_ID", "ETHNICITY_ID", "ORG_ID")
+
+    Returns:
+        dict[str, str]: normalized_value -> data_id, covering canonical values and their synonyms.
+    """
+    # get mappings from key_ids.json
+    mappings = create_mapping(column_name)
+    
+    # load value synonyms
+    try:
+        value_synonyms = load_value_synonyms()
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        print(f"WARNING: Could not load value synonyms: {e}. Using only exact matching.")
+        value_synonyms = {}
+        
+    # build normalized lookup table: normalized_value -> data_id
+    # this includes both canonical values and their synonyms
+    normalized_lookup = {}
+    
+    for original_key, data_id in mappings.items():
+        # add the canonical form from database
+        normalized_lookup[normalize(original_key)] = data_id
+        
+        # add synonyms if they exist for this column and value
+        if column_name in value_synonyms and original_key in value_synonyms[column_name]:
+            for synonym in value_synonyms[column_name][original_key]:
+                normalized_lookup[normalize(synonym)] = data_id
+                
+    return normalized_lookup
+
+
+def load_value_matcher(column_name: str) -> tuple[dict[str, str], ValueMatcher]:
+    """
+    Returns the lookup table and ValueMatcher for a column, built once per version of
+    key_ids.json / value_synonyms.json and shared through the mapping registry.
+    """
+    def build():
+        lookup = build_value_lookup(column_name)
+        return lookup, ValueMatcher(lookup)
+    return get_registry().derive(("value_matcher", column_name), [KEY_IDS_PATH, VALUE_SYNONYMS_PATH], build)
+
+
+def load_fuzzy_matcher(column_name: str) -> FuzzyMatcher:
+    """
+    Returns the FuzzyMatcher for a column, shared through the mapping registry like
+    load_value_matcher.
+    """
+    def build():
+        lookup, _ = load_value_matcher(column_name)
+        return FuzzyMatcher(lookup)
+    return get_registry().derive(("fuzzy_matcher", column_name), [KEY_IDS_PATH, VALUE_SYNONYMS_PATH], build)
+
+
+class ColumnResolver:
+    """
+    Resolves raw values of one column to database IDs: a resolution learned from an
+    operator, then exact match on the normalized value, then substring match, then
+    (for columns in FUZZY_THRESHOLDS) the closest key above a similarity threshold,
+    otherwise the raw value is kept.
+    Results are memoized per raw value in a ResolutionCache.
+    """
+    def __init__(
+        self,
+        column_name: str,
+        cache: ResolutionCache | None = None,
+        fuzzy: bool = True,
+        fuzzy_threshold: float | None = None,
+        learned_store: LearnedResolutionStore | None = None
+    ):
+        """
+        Args:
+            column_name (str): Database column, e.g. "ORG_ID".
+            cache (ResolutionCache | None): Memo of raw value -> result; a fresh cache if omitted.
+            fuzzy (bool): Enable the fuzzy fallback for columns that have a threshold.
+            fuzzy_threshold (float | None): Overrides the column's FUZZY_THRESHOLDS entry.
+            learned_store (LearnedResolutionStore | None): Operator decisions to apply first;
+            the default store in mappings/ if omitted.
+        """
+        self.column_name = column_name
+        self.lookup, self.matcher = load_value_matcher(column_name)
+        self.cache = cache if cache is not None else ResolutionCache()
+        self.unmatched = set()
+        
+        # snapshot for this run; decisions recorded later apply from the next resolver on
+        self.learned_store = learned_store if learned_store is not None else get_learned_store()
+        self.learned = self.learned_store.for_column(column_name)
+        self.learned_hits = 0
+        
+        self.fuzzy_threshold = fuzzy_threshold if fuzzy_threshold is not None else FUZZY_THRESHOLDS.get(column_name)
+        if not fuzzy:
+            self.fuzzy_threshold = None
+        self.fuzzy = load_fuzzy_matcher(column_name) if self.fuzzy_threshold is not None else None
+        # raw value -> (closest key, its data_id, similarity, accepted) for every fuzzy lookup
+        self.fuzzy_decisions = {}
+    
+    def resolve_uncached(self, raw_value: str, normalized_value: str | None = None) -> tuple[str, bool]:
+        """
+        Args:
+            raw_value (str): Value as it appears in the CSV
+            normalized_value (str | None): normalize(raw_value), if the caller already computed it
+            
+        Returns:
+            tuple[str, bool]: (cleaned value as a string, whether a match was found)
+        """
+        if normalized_value is None:
+            normalized_value = normalize(raw_value)
+        
+        # 0) a resolution an operator already decided
+        data_id = self.learned.get(normalized_value)
+        if data_id is not None:
+            self.learned_hits += 1
+            return str(data_id), True
+        
+        # 1) check for exact match on normalized value (includes all synonyms)
+        data_id = self.lookup.get(normalized_value)
+        
+        # 2) substring match on normalized keys (first key in lookup order wins)
+        # this handles cases like "Hispanic" matching "Hispanic or Latino"
+        if data_id is None:
+            data_id = self.matcher.match(normalized_value)
+        
+        # 3) closest key by trigram candidates + similarity score, if above the threshold
+        if data_id is None and self.fuzzy is not None:
+            data_id = self.resolve_fuzzy(raw_value, normalized_value)
+            
+        if data_id is None:
+            return raw_value, False
+        return str(data_id), True # Convert to string for CSV consistency
+    
+    def resolve_fuzzy(self, raw_value: str, normalized_value: str):
+        """
+        Looks up the closest key and records the decision in fuzzy_decisions.
+        
+        Returns:
+            The data_id if the similarity reaches fuzzy_threshold, otherwise None.
+        """
+        best = self.fuzzy.best_match(normalized_value)
+        if best is None:
+            self.fuzzy_decisions[raw_value] = (None, None, 0.0, False)
+            return None
+        pos, score = best
+        accepted = score >= self.fuzzy_threshold
+        self.fuzzy_decisions[raw_value] = (self.fuzzy.keys[pos], self.fuzzy.values[pos], score, accepted)
+        return self.fuzzy.values[pos] if accepted else None
+    
+    def fuzzy_report(self) -> dict[str, list[dict]]:
+        """
+        Returns:
+            dict[str, list[dict]]: "accepted" and "rejected" fuzzy lookups, each with the raw
+            value, the closest key, its id and the similarity, best score first.
+        """
+        report = {"accepted": [], "rejected": []}
+        for raw_value, (key, data_id, score, accepted) in self.fuzzy_decisions.items():
+            report["accepted" if accepted else "rejected"].append(
+                {"value": raw_value, "match": key, "id": data_id, "score": round(score, 3)}
+            )
+        for entries in report.values():
+            entries.sort(key=lambda entry: -entry["score"])
+        return report
+    
+    def resolve(self, raw_value: str, normalized_value: str | None = None) -> str:
+        entry = self.cache.get(raw_value)
+        if entry is None:
+            if raw_value in self.unmatched:
+                # evicted from the cache: no need to search the lookups again
+                entry = (raw_value, False)
+            else:
+                entry = self.resolve_uncached(raw_value, normalized_value)
+                if not entry[1]:
+                    #FIXME keep raw value if org name doesnt exist in database!
+                    self.unmatched.add(raw_value)
+            self.cache.put(raw_value, entry)
+        return entry[0]
+    
+    def format_unmatched(self, limit: int = UNMATCHED_PREVIEW) -> str | None:
+        """
+        Returns:
+            str | None: One line listing the values kept as they are (the first `limit`
+            of them), or None if every value matched.
+        """
+        if not self.unmatched:
+            return None
+        values = sorted(self.unmatched)
+        preview = ", ".join(f"'{value}'" for value in values[:limit])
+        more = f" (+{len(values) - limit} more)" if len(values) > limit else ""
+        return f"No match found for {len(values)} {self.column_name} values. Keeping original values: {preview}{more}"
@@ -0,0 +1,381 @@
+import sys
+from array import array
+from itertools import accumulate, islice
+from csv_readers import PYARROW_READER, PYTHON_READER, iter_rows, gc_paused, resolve_reader, read_table_pyarrow
+
+DICTIONARY_LIMIT = 0.5 # a column with more distinct values than this share of its rows is packed instead
+PROBE_ROWS = 10_000 # rows read before deciding how each column is stored
+PACK_CHUNK = 8_192 # values per packed string block
+ROW_CHUNK = 8_192 # rows decoded at a time when iterating
+MAP_CHUNK = 1_024 # values mapped between progress callbacks (resolving a value can be slow)
+DEFAULT_ROSTER_READER = PYARROW_READER # reuses Arrow's dictionary encoding, fastest at every size
+
+_CODE_LIMITS = {"B": 1 << 8, "H": 1 << 16, "I": 1 << 32}
+_WIDER_CODES = {"B": "H", "H": "I"}
+
+class DictionaryColumn:
+    """
+    A column stored as integer codes into a table of its distinct values. Codes start
+    as bytes and are widened when the table outgrows them, so Gender or Ethnicity costs
+    one byte per row and every repeated string is kept once.
+    """
+    __slots__ = ("values", "codes", "_index")
+
+    def __init__(self, values: list | None = None, codes: array | None = None):
+        self.values = list(values) if values is not None else []
+        self.codes = codes if codes is not None else array("B")
+        self._index = {value: code for code, value in enumerate(self.values)}
+
+    def extend(self, values) -> None:
+        index = self._index
+        # new distinct values (in order of appearance) get the next codes
+        for value in dict.fromkeys(values):
+            if value not in index:
+                index[value] = len(self.values)
+                self.values.append(value)
+        while len(self.values) > _CODE_LIMITS[self.codes.typecode]:
+            self.codes = array(_WIDER_CODES[self.codes.typecode], self.codes)
+        self.codes.extend(map(index.__getitem__, values))
+
+    def append(self, value) -> None:
+        self.extend((value,))
+
+    def freeze(self) -> None:
+        """Drops the value -> code index once the column is complete."""
+        self._index = None
+
+    def map_values(self, func, progress_callback=None) -> "DictionaryColumn":
+        """
+        Returns a column with func applied to each distinct value once. The codes are
+        shared, so mapping a million-row column costs as much as its dictionary.
+        progress_callback(done, total) is called with the values mapped so far every MAP_CHUNK values.
+        """
+        values = []
+        total = len(self.values)
+        for start in range(0, total, MAP_CHUNK):
+            values.extend([func(value) for value in self.values[start:start + MAP_CHUNK]])
+            if progress_callback is not None:
+                progress_callback(len(values), total)
+        mapped = DictionaryColumn.__new__(DictionaryColumn)
+        mapped.values = values
+        mapped.codes = self.codes
+        mapped._index = None
+        return mapped
+
+    def decode(self, start: int, stop: int) -> list:
+        return list(map(self.values.__getitem__, self.codes[start:stop]))
+
+    def __getitem__(self, i: int):
+        return self.values[self.codes[i]]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def nbytes(self) -> int:
+        """Approximate memory of the codes, the value table and its strings."""
+        return (
+            sys.getsizeof(self.codes) + sys.getsizeof(self.values)
+            + sum(sys.getsizeof(value) for value in self.values)
+        )
+
+
+class PackedColumn:
+    """
+    A column of mostly distinct strings (names, student codes) stored as blocks of
+    concatenated text with end offsets, instead of one string object per cell.
+    """
+    __slots__ = ("blocks", "ends", "_pending", "_size")
+
+    def __init__(self, values=()):
+        self.blocks = []
+        self.ends = []
+        self._pending = []
+        self._size = 0
+        for value in values:
+            self.append(value)
+
+    def extend(self, values) -> None:
+        self._pending.extend(values)
+        self._size += len(values)
+        while len(self._pending) >= PACK_CHUNK:
+            self._pack(self._pending[:PACK_CHUNK])
+            del self._pending[:PACK_CHUNK]
+
+    def append(self, value: str) -> None:
+        self.extend((value,))
+
+    def _pack(self, values: list[str]) -> None:
+        self.blocks.append("".join(values))
+        self.ends.append(array("I", accumulate(map(len, values))))
+
+    def freeze(self) -> None:
+        if self._pending:
+            self._pack(self._pending)
+            self._pending = []
+
+    def map_values(self, func, progress_callback=None) -> DictionaryColumn:
+        """
+        Applies func to every cell; the results (e.g. database IDs) are dictionary encoded.
+        progress_callback(done, total) is called with the cells mapped so far every MAP_CHUNK cells.
+        """
+        mapped = DictionaryColumn()
+        total = len(self)
+        for start in range(0, total, MAP_CHUNK):
+            mapped.extend([func(value) for value in self.decode(start, start + MAP_CHUNK)])
+            if progress_callback is not None:
+                progress_callback(len(mapped), total)
+        mapped.freeze()
+        return mapped
+
+    def decode(self, start: int, stop: int) -> list[str]:
+        stop = min(stop, len(self))
+        decoded = []
+        while start < stop:
+            block_number, offset = divmod(start, PACK_CHUNK)
+            if block_number == len(self.blocks):
+                decoded.extend(self._pending[offset:offset + stop - start])
+                break
+            block, ends = self.blocks[block_number], self.ends[block_number]
+            count = min(len(ends) - offset, stop - start)
+            starts = ends[offset - 1] if offset else 0
+            for end in ends[offset:offset + count]:
+                decoded.append(block[starts:end])
+                starts = end
+            start += count
+        return decoded
+
+    def __getitem__(self, i: int) -> str:
+        return self.decode(i, i + 1)[0]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def nbytes(self) -> int:
+        return (
+            sum(sys.getsizeof(block) for block in self.blocks)
+            + sum(sys.getsizeof(ends) for ends in self.ends)
+            + sum(sys.getsizeof(value) for value in self._pending)
+        )
+
+
+class Roster:
+    """
+    Column-wise roster with dictionary-encoded columns.
+
+    Behaves like the list[list[str]] it replaces: roster[0] is the header row, roster[i]
+    the i-th row as a fresh list, len() counts the header and iteration yields the header
+    and then every row, so code written for row lists keeps working. Cleaning works on
+    columns instead (see map_column): each distinct value is resolved once and the codes
+    are reused, and repeated values are never stored per row.
+
+    Rows of different lengths are kept as they are; shorter rows are padded internally
+    and trimmed again when read.
+    """
+    def __init__(self, headers: list[str] | None, columns: list, lengths: array | None = None):
+        self.headers = headers
+        self.columns = columns
+        self.lengths = lengths # per-row lengths, only for ragged rosters
+
+    @classmethod
+    def from_rows(cls, rows) -> "Roster":
+        """
+        Builds a roster from rows with the header first (a list or any row iterator,
+        so a CSV can be encoded without ever holding it as lists).
+        """
+        rows = iter(rows)
+        headers = next(rows, None)
+        if headers is None:
+            return cls(None, [])
+        headers = list(headers)
+        width = len(headers)
+        columns = [DictionaryColumn() for _ in range(width)]
+        lengths = None
+        num_rows = 0
+        probed = False
+
+        # rows are transposed a chunk at a time and appended column by column
+        for chunk in iter(lambda: list(islice(rows, ROW_CHUNK)), []):
+            if lengths is not None or set(map(len, chunk)) != {width}:
+                if lengths is None:
+                    lengths = array("I", [width]) * num_rows
+                lengths.extend(len(row) for row in chunk)
+                chunk_width = max(width, max(map(len, chunk)))
+                # new trailing columns are empty for the rows read so far
+                for _ in range(chunk_width - width):
+                    column = DictionaryColumn()
+                    column.extend([""] * num_rows)
+                    columns.append(column)
+                width = chunk_width
+                chunk = [list(row) + [""] * (width - len(row)) for row in chunk]
+            for column, values in zip(columns, zip(*chunk)):
+                column.extend(values)
+            num_rows += len(chunk)
+            if not probed and num_rows >= PROBE_ROWS:
+                columns = [_choose_storage(column, num_rows) for column in columns]
+                probed = True
+
+        if num_rows >= PROBE_ROWS:
+            columns = [_choose_storage(column, num_rows) for column in columns]
+        for column in columns:
+            column.freeze()
+        return cls(headers, columns, lengths)
+
+    @classmethod
+    def from_arrow(cls, table) -> "Roster":
+        """
+        Builds a roster from an Arrow table of string columns whose first row is the header
+        row (see csv_readers.read_table_pyarrow), reusing Arrow's dictionary encoding.
+        """
+        import numpy as np
+
+        headers = [column[0].as_py() for column in table.columns]
+        num_rows = table.num_rows - 1
+        columns = []
+        for column in table.columns:
+            data = column.slice(1).combine_chunks()
+            encoded = data.dictionary_encode()
+            if num_rows >= PROBE_ROWS and len(encoded.dictionary) > DICTIONARY_LIMIT * num_rows:
+                packed = PackedColumn()
+                for start in range(0, num_rows, PACK_CHUNK):
+                    packed.extend(data.slice(start, PACK_CHUNK).to_pylist())
+                packed.freeze()
+                columns.append(packed)
+                continue
+            values = encoded.dictionary.to_pylist()
+            typecode = next(code for code, limit in _CODE_LIMITS.items() if len(values) <= limit)
+            codes = array(typecode)
+            codes.frombytes(encoded.indices.to_numpy().astype(np.dtype(typecode)).tobytes())
+            dictionary = DictionaryColumn(values, codes)
+            dictionary.freeze()
+            columns.append(dictionary)
+        return cls(headers, columns)
+
+    @property
+    def num_rows(self) -> int:
+        """Number of data rows (without the header)."""
+        return len(self.columns[0]) if self.columns else 0
+
+    @property
+    def width(self) -> int:
+        return len(self.columns)
+
+    def __len__(self) -> int:
+        return 0 if self.headers is None else self.num_rows + 1
+
+    def __bool__(self) -> bool:
+        return self.headers is not None
+
+    def _row(self, i: int) -> list:
+        row = [column[i] for column in self.columns]
+        return row if self.lengths is None else row[:self.lengths[i]]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Roster index out of range")
+        return list(self.headers) if index == 0 else self._row(index - 1)
+
+    def iter_rows(self, start: int = 0):
+        """Yields the data rows from start on as fresh lists, decoding ROW_CHUNK rows at a time."""
+        total = self.num_rows
+        for chunk_start in range(start, total, ROW_CHUNK):
+            chunk_stop = min(chunk_start + ROW_CHUNK, total)
+            decoded = [column.decode(chunk_start, chunk_stop) for column in self.columns]
+            rows = map(list, zip(*decoded))
+            if self.lengths is None:
+                yield from rows
+            else:
+                for row, length in zip(rows, self.lengths[chunk_start:chunk_stop]):
+                    yield row[:length]
+
+    def __iter__(self):
+        if self.headers is None:
+            return
+        yield list(self.headers)
+        yield from self.iter_rows()
+
+    def column(self, pos: int) -> list:
+        """All values of one column."""
+        return self.columns[pos].decode(0, self.num_rows)
+
+    def map_column(self, pos: int, func, in_place: bool = False, progress_callback=None) -> "Roster":
+        """
+        Applies func to every value of one column, once per distinct value for
+        dictionary-encoded columns.
+
+        Args:
+            pos (int): Column position.
+            func (Callable): Maps a raw value to its new value, e.g. a resolver.
+            in_place (bool): Replace the column in this roster instead of returning a new one.
+            progress_callback (Callable[[int, int], None] | None): Called with (values mapped,
+            values to map) as the column is mapped. An exception raised from it stops the
+            mapping and leaves the column unchanged.
+
+        Returns:
+            Roster: The updated roster. A new roster shares its other columns with this one.
+        """
+        roster = self if in_place else Roster(self.headers, list(self.columns), self.lengths)
+        roster.columns[pos] = self.columns[pos].map_values(func, progress_callback)
+        return roster
+
+    def to_rows(self) -> list[list]:
+        """The roster as a list of row lists, header first."""
+        return list(self)
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the roster, for comparing with row lists."""
+        size = sum(column.nbytes() for column in self.columns) + sys.getsizeof(self.columns)
+        if self.headers is not None:
+            size += sys.getsizeof(self.headers) + sum(sys.getsizeof(header) for header in self.headers)
+        if self.lengths is not None:
+            size += sys.getsizeof(self.lengths)
+        return size
+
+
+def _choose_storage(column, num_rows: int):
+    """Packs dictionary columns whose values are mostly distinct (names, IDs)."""
+    if isinstance(column, DictionaryColumn) and len(column.values) > DICTIONARY_LIMIT * num_rows:
+        return PackedColumn(column.decode(0, len(column)))
+    return column
+
+
+def rows_nbytes(rows: list[list]) -> int:
+    """Approximate memory held by a list of row lists, counting each string object once."""
+    seen = set()
+    size = sys.getsizeof(rows)
+    for row in rows:
+        size += sys.getsizeof(row)
+        for value in row:
+            if id(value) not in seen:
+                seen.add(id(value))
+                size += sys.getsizeof(value)
+    return size
+
+
+def read_roster(csv_file_path: str, reader: str = DEFAULT_ROSTER_READER) -> Roster | None:
+    """
+    Reads a CSV file straight into a Roster, one row at a time, so the row lists are
+    never all held at once. Blank rows are skipped and everything stays a string.
+
+    Args:
+        csv_file_path (str): Path to CSV file.
+        reader (str): CSV reader, see csv_readers.
+
+    Returns:
+        Roster | None: The roster (empty for an empty file), or None if the file could not be read.
+    """
+    try:
+        with gc_paused():
+            if resolve_reader(reader) == PYARROW_READER:
+                table = read_table_pyarrow(csv_file_path)
+                if table is not None:
+                    return Roster.from_arrow(table)
+                reader = PYTHON_READER # empty or ragged
+            return Roster.from_rows(iter_rows(csv_file_path, reader))
+    except FileNotFoundError:
+        print(f"Error: File '{csv_file_path}' not found!")
+    except Exception as e:
+        print(f"An error has occurred: {e}")
@@ -0,0 +1,203 @@
+import argparse
+import gzip
+import os
+import shutil
+import time
+import pandas as pd
+from snowflake.connector.pandas_tools import write_pandas
+from connection import get_connection_manager
+
+TARGET_TABLE = "EVENT_STUDENT_DEMOGRAPHIC"
+GZIP_CHUNK_SIZE = 1024 * 1024 # bytes copied per read while compressing
+
+# TSV written by write_tsv_rows: tab separated, header row, '"' quoting, empty string = NULL
+TSV_FILE_FORMAT = (
+    "TYPE = CSV FIELD_DELIMITER = '\\t' SKIP_HEADER = 1 "
+    "FIELD_OPTIONALLY_ENCLOSED_BY = '\"' EMPTY_FIELD_AS_NULL = TRUE COMPRESSION = GZIP"
+)
+# Parquet written by columnar_export: typed columns, matched to the table by name
+PARQUET_FILE_FORMAT = "TYPE = PARQUET"
+
+def gzip_file(src_path: str, dest_path: str | None = None, chunk_size: int = GZIP_CHUNK_SIZE) -> str:
+    """
+    Compresses a file with gzip in fixed-size chunks, so memory stays bounded.
+    
+    Args:
+        src_path (str): File to compress.
+        dest_path (str | None): Output path, defaults to src_path + '.gz'.
+        
+    Returns:
+        str: Path to the compressed file.
+    """
+    dest_path = dest_path or src_path + ".gz"
+    with open(src_path, "rb") as src, gzip.open(dest_path, "wb") as dest:
+        shutil.copyfileobj(src, dest, chunk_size)
+    return dest_path
+
+def build_put_statement(local_path: str, table: str = TARGET_TABLE) -> str:
+    # the file is already compressed (gzip or Parquet), so Snowflake must not compress it again
+    path = os.path.abspath(local_path).replace("\\", "/")
+    return f"PUT 'file://{path}' @%{table} AUTO_COMPRESS = FALSE OVERWRITE = TRUE"
+
+def build_copy_statement(staged_file_name: str, table: str = TARGET_TABLE, file_format: str = TSV_FILE_FORMAT) -> str:
+    match_by_name = "MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE " if file_format == PARQUET_FILE_FORMAT else ""
+    return (
+        f"COPY INTO {table} FROM @%{table} "
+        f"FILES = ('{staged_file_name}') "
+        f"FILE_FORMAT = ({file_format}) {match_by_name}"
+        f"PURGE = TRUE ON_ERROR = 'ABORT_STATEMENT'"
+    )
+
+def rows_loaded_from_copy(copy_results: list[tuple]) -> int:
+    """
+    Sums rows_loaded from a COPY INTO result set.
+    Each result row is (file, status, rows_parsed, rows_loaded, ...).
+    """
+    total = 0
+    for result in copy_results:
+        if len(result) > 3 and isinstance(result[3], int):
+            total += result[3]
+    return total
+
+def upload_tsv_via_stage(conn, tsv_file_path: str, table: str = TARGET_TABLE, keep_gzip: bool = False) -> dict:
+    """
+    Loads a cleaned TSV into Snowflake: gzip it locally, PUT it to the table stage
+    and run COPY INTO. The two statements share a cursor but are still two round
+    trips to Snowflake.
+    
+    Args:
+        conn: Snowflake connection (see connection.make_connection).
+        tsv_file_path (str): TSV written by the export path (headers in the first row).
+        table (str): Target table, EVENT_STUDENT_DEMOGRAPHIC by default.
+        keep_gzip (bool): Keep the local .gz file after uploading.
+        
+    Returns:
+        dict: rows_loaded, the COPY results and timings (seconds) for compress, put and copy.
+        
+    Raises:
+        FileNotFoundError: If the TSV file doesn't exist.
+        RuntimeError: If COPY INTO reports a failed file.
+    """
+    if not os.path.exists(tsv_file_path):
+        raise FileNotFoundError(f"TSV file '{tsv_file_path}' does not exist!")
+    
+    timings = {}
+    start = time.perf_counter()
+    gz_path = gzip_file(tsv_file_path)
+    timings["compress"] = time.perf_counter() - start
+    
+    try:
+        copy_results = put_and_copy(conn, gz_path, table, TSV_FILE_FORMAT, timings)
+    finally:
+        if not keep_gzip and os.path.exists(gz_path):
+            os.remove(gz_path)
+    
+    return {
+        "method": "stage",
+        "rows_loaded": rows_loaded_from_copy(copy_results),
+        "copy_results": copy_results,
+        "timings": timings,
+    }
+
+def put_and_copy(conn, local_path: str, table: str, file_format: str, timings: dict) -> list[tuple]:
+    """
+    PUTs a local file to the table stage, then runs COPY INTO on it as a second
+    statement on the same cursor, adding "put" and "copy" seconds to timings.
+    
+    Returns:
+        list[tuple]: The COPY INTO results.
+        
+    Raises:
+        RuntimeError: If COPY INTO reports a failed file.
+    """
+    cur = conn.cursor()
+    try:
+        start = time.perf_counter()
+        cur.execute(build_put_statement(local_path, table))
+        cur.fetchall()
+        timings["put"] = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        cur.execute(build_copy_statement(os.path.basename(local_path), table, file_format))
+        copy_results = cur.fetchall()
+        timings["copy"] = time.perf_counter() - start
+    finally:
+        cur.close()
+    
+    failed = [result for result in copy_results if len(result) > 1 and str(result[1]).upper() not in ("LOADED", "PARTIALLY_LOADED")]
+    if failed:
+        raise RuntimeError(f"COPY INTO {table} failed: {failed}")
+    return copy_results
+
+def upload_parquet_via_stage(conn, parquet_file_path: str, table: str = TARGET_TABLE) -> dict:
+    """
+    Loads a Parquet export (see columnar_export) into Snowflake: PUT it to the table
+    stage as it is, Parquet being compressed already, and COPY INTO by column name.
+    
+    Returns:
+        dict: rows_loaded, the COPY results and timings (seconds) for put and copy.
+        
+    Raises:
+        FileNotFoundError: If the Parquet file doesn't exist.
+        RuntimeError: If COPY INTO reports a failed file.
+    """
+    if not os.path.exists(parquet_file_path):
+        raise FileNotFoundError(f"Parquet file '{parquet_file_path}' does not exist!")
+    
+    timings = {}
+    copy_results = put_and_copy(conn, parquet_file_path, table, PARQUET_FILE_FORMAT, timings)
+    return {
+        "method": "stage_parquet",
+        "rows_loaded": rows_loaded_from_copy(copy_results),
+        "copy_results": copy_results,
+        "timings": timings,
+    }
+
+def upload_tsv_via_write_pandas(conn, tsv_file_path: str, table: str = TARGET_TABLE, chunk_size: int = 100_000) -> dict:
+    """
+    Alternative loader: reads the TSV in chunks and uploads each chunk with
+    snowflake.connector.pandas_tools.write_pandas (Parquet under the hood).
+    
+    Returns:
+        dict: rows_loaded, number of chunks and timings (seconds) for read and write.
+    """
+    timings = {"read": 0.0, "write": 0.0}
+    rows_loaded = 0
+    chunks = 0
+    
+    start = time.perf_counter()
+    reader = pd.read_csv(tsv_file_path, sep="\t", dtype=str, keep_default_na=False, chunksize=chunk_size)
+    for chunk in reader:
+        timings["read"] += time.perf_counter() - start
+        
+        start = time.perf_counter()
+        success, _, nrows, _ = write_pandas(conn, chunk.replace("", None), table, compression="snappy")
+        timings["write"] += time.perf_counter() - start
+        if not success:
+            raise RuntimeError(f"write_pandas failed on chunk {chunks + 1}")
+        rows_loaded += nrows
+        chunks += 1
+        start = time.perf_counter()
+    
+    return {"method": "write_pandas", "rows_loaded": rows_loaded, "chunks": chunks, "timings": timings}
+
+def main():
+    parser = argparse.ArgumentParser(description=f"Load a cleaned TSV or Parquet export into {TARGET_TABLE}.")
+    parser.add_argument("tsv_file", help="Cleaned TSV (or .parquet) produced by the export step")
+    parser.add_argument("--method", choices=["stage", "write_pandas"], default="stage")
+    args = parser.parse_args()
+    
+    with get_connection_manager().connection() as conn:
+        if args.tsv_file.endswith(".parquet"):
+            report = upload_parquet_via_stage(conn, args.tsv_file)
+        elif args.method == "stage":
+            report = upload_tsv_via_stage(conn, args.tsv_file)
+        else:
+            report = upload_tsv_via_write_pandas(conn, args.tsv_file)
+    
+    print(f"✓ Loaded {report['rows_loaded']} rows into {TARGET_TABLE} ({report['method']})")
+    for phase, seconds in report["timings"].items():
+        print(f"  {phase:10} {seconds:.2f} s")
+
+if __name__ == "__main__":
+    main()
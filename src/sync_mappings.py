@@ -1,13 +1,26 @@
+import argparse
 import json
+import os
+import tempfile
+import time
 from connection import *
+from registry import KEY_IDS_PATH
 import pandas as pd
 
-def export_mappings(conn, file_path='mappings/key_ids.json'): # TODO add error handling
+SYNC_STATE_PATH = 'mappings/sync_state.json'
+
+# key_ids.json section -> (table, name column, id column)
+SYNC_TABLES = {
+    "ethnicity_id": ("ETHNICITY", "ETHNICITY_NAME", "ETHNICITY_ID"),
+    "gender_id": ("GENDER", "GENDER_TAG", "GENDER_ID"),
+    "org_id": ("ORGANIZATION", "ORG_NAME", "ORG_ID"),
+}
+
+def export_mappings(conn, file_path=KEY_IDS_PATH): # TODO add error handling
     mappings = {}
     query_map = {
-        "ethnicity_id": "SELECT ETHNICITY_NAME, ETHNICITY_ID FROM ETHNICITY;",
-        "gender_id": "SELECT GENDER_TAG, GENDER_ID FROM GENDER;",
-        "org_id": "SELECT ORG_NAME, ORG_ID FROM ORGANIZATION;"
+        key: f"SELECT {name_col}, {id_col} FROM {table};"
+        for key, (table, name_col, id_col) in SYNC_TABLES.items()
     }
     cur = conn.cursor()
 
@@ -19,14 +32,146 @@ def export_mappings(conn, file_path='mappings/key_ids.json'): # TODO add error h
         mappings[key] = {}
         for name, id in rows:
             mappings[key][name] = id
-    
+
     # save mappings to json
-    with open(file_path, "w") as f:
-        json.dump(mappings, f, indent=2)
+    write_json_atomic(file_path, mappings)
+
+def write_json_atomic(file_path: str, data) -> None:
+    """
+    Writes JSON to a temp file next to file_path and swaps it in with os.replace,
+    so readers never see a half-written file.
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_", suffix=".json")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def load_json_or_empty(file_path: str) -> dict:
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def table_fingerprint(cur, table: str, name_col: str, id_col: str, max_id=None) -> dict:
+    """
+    Returns max id, row count and HASH_AGG of (name, id) for a table, optionally
+    restricted to ids <= max_id. Comparing fingerprints tells whether rows changed
+    without fetching them.
+    """
+    query = f"SELECT MAX({id_col}), COUNT(*), HASH_AGG({name_col}, {id_col}) FROM {table}"
+    if max_id is None:
+        cur.execute(query)
+    else:
+        cur.execute(query + f" WHERE {id_col} <= %(max_id)s", {"max_id": max_id})
+    max_value, count, hash_value = cur.fetchone()
+    return {"max_id": max_value, "count": count, "hash": None if hash_value is None else str(hash_value)}
+
+def diff_mappings(old: dict, new: dict) -> dict[str, int]:
+    return {
+        "added": sum(1 for name in new if name not in old),
+        "removed": sum(1 for name in old if name not in new),
+        "changed": sum(1 for name in new if name in old and old[name] != new[name]),
+    }
+
+def sync_table(cur, key: str, current: dict, state: dict | None, full: bool) -> tuple[dict, dict, dict]:
+    """
+    Syncs one key_ids.json section.
+
+    Returns:
+        tuple[dict, dict, dict]: (new mapping, new table state, report entry)
+    """
+    table, name_col, id_col = SYNC_TABLES[key]
+    start = time.perf_counter()
+    fingerprint = table_fingerprint(cur, table, name_col, id_col)
+
+    if not full and state and current and fingerprint == state:
+        mode, mapping = "unchanged", current
+    else:
+        mode = "full"
+        # append-only change: rows up to the old high-water mark still hash the same
+        if not full and state and current and state.get("max_id") is not None:
+            previous = table_fingerprint(cur, table, name_col, id_col, state["max_id"])
+            if previous["count"] == state["count"] and previous["hash"] == state["hash"]:
+                mode = "incremental"
+
+        if mode == "incremental":
+            cur.execute(
+                f"SELECT {name_col}, {id_col} FROM {table} WHERE {id_col} > %(max_id)s ORDER BY {id_col}",
+                {"max_id": state["max_id"]}
+            )
+            mapping = dict(current)
+            for name, id in cur.fetchall():
+                mapping[name] = id
+        else:
+            cur.execute(f"SELECT {name_col}, {id_col} FROM {table} ORDER BY {id_col}")
+            mapping = {name: id for name, id in cur.fetchall()}
+
+    report = {"table": table, "mode": mode, **diff_mappings(current, mapping), "seconds": time.perf_counter() - start}
+    return mapping, fingerprint, report
+
+def sync_mappings(
+    conn,
+    file_path: str = KEY_IDS_PATH,
+    state_path: str = SYNC_STATE_PATH,
+    full: bool = False
+) -> list[dict]:
+    """
+    Incrementally syncs key_ids.json from Snowflake.
+
+    For each table a fingerprint (max id, row count, HASH_AGG) is compared with the one
+    stored at the last sync. Unchanged tables are skipped; if only rows above the old
+    high-water mark were added, just those rows are fetched and merged; otherwise
+    (renames, deletes) the table is fetched in full. key_ids.json and the state file
+    are replaced atomically.
+
+    Args:
+        conn: Snowflake connection.
+        file_path (str): key_ids.json to update.
+        state_path (str): Where the per-table fingerprints are stored.
+        full (bool): Ignore the stored state and fetch every table.
+
+    Returns:
+        list[dict]: One report per table with mode, added/removed/changed counts and seconds.
+    """
+    mappings = load_json_or_empty(file_path)
+    state = {} if full else load_json_or_empty(state_path)
+    new_state = {}
+    reports = []
+
+    cur = conn.cursor()
+    try:
+        for key in SYNC_TABLES:
+            mapping, new_state[key], report = sync_table(cur, key, mappings.get(key, {}), state.get(key), full)
+            mappings[key] = mapping
+            reports.append(report)
+    finally:
+        cur.close()
+
+    if any(report["mode"] != "unchanged" for report in reports) or not os.path.exists(file_path):
+        write_json_atomic(file_path, mappings)
+    write_json_atomic(state_path, new_state)
+    return reports
 
 def main():
-    conn = make_connection(find_env_variables())
-    export_mappings(conn)
+    parser = argparse.ArgumentParser(description="Sync mappings/key_ids.json from Snowflake.")
+    parser.add_argument("--full", action="store_true", help="Re-fetch every table instead of syncing incrementally")
+    args = parser.parse_args()
+
+    with get_connection_manager().connection() as conn:
+        reports = sync_mappings(conn, full=args.full)
+
+    for report in reports:
+        print(
+            f"{report['table']:13} {report['mode']:11} +{report['added']} -{report['removed']} "
+            f"~{report['changed']} ({report['seconds']:.2f} s)"
+        )
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
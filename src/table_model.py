@@ -0,0 +1,69 @@
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+COLUMN_SAMPLE_SIZE = 200 # rows inspected when sizing columns
+COLUMN_PADDING = 24
+MAX_COLUMN_WIDTH = 400
+
+class RosterTableModel(QAbstractTableModel):
+    """
+    Read-only table model over the existing list of rows (headers in the first row).
+    
+    Nothing is copied: the view asks for cells as they scroll into view, so a
+    500k-row roster costs no more to display than a 50-row one.
+    """
+    def __init__(self, rows: list[list[str]], parent=None):
+        super().__init__(parent)
+        self.headers = rows[0] if rows else []
+        self.rows = rows
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid() or not self.rows:
+            return 0
+        return len(self.rows) - 1
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.headers)
+    
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.ToolTipRole):
+            return None
+        row = self.rows[index.row() + 1]
+        col = index.column()
+        # rows shorter than the header show empty cells
+        return str(row[col]) if col < len(row) else ""
+    
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.headers[section] if section < len(self.headers) else None
+        return str(section + 1)
+    
+    def sample_rows(self, sample_size: int = COLUMN_SAMPLE_SIZE) -> list[list[str]]:
+        """Returns up to sample_size data rows spread evenly across the table."""
+        total = self.rowCount()
+        if total <= sample_size:
+            return self.rows[1:]
+        step = total / sample_size
+        return [self.rows[1 + int(i * step)] for i in range(sample_size)]
+
+
+def resize_columns_from_sample(view, sample_size: int = COLUMN_SAMPLE_SIZE) -> None:
+    """
+    Sizes each column of a QTableView from its header and a sample of rows,
+    instead of resizeColumnsToContents() which measures every cell.
+    """
+    model = view.model()
+    if model is None:
+        return
+    metrics = view.fontMetrics()
+    sample = model.sample_rows(sample_size)
+    
+    for col, header in enumerate(model.headers):
+        width = metrics.horizontalAdvance(str(header))
+        for row in sample:
+            if col < len(row):
+                width = max(width, metrics.horizontalAdvance(str(row[col])))
+        view.setColumnWidth(col, min(width + COLUMN_PADDING, MAX_COLUMN_WIDTH))
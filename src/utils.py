@@ -1,9 +1,8 @@
 import json
+from registry import get_registry, KEY_IDS_PATH, COLUMN_SYNONYMS_PATH, VALUE_SYNONYMS_PATH
 
 def create_mapping(json_column_name: str) -> dict:
-    mappings = {}
-    with open('mappings/key_ids.json', 'r') as f:
-        data = json.load(f)
+    data = get_registry().load(KEY_IDS_PATH)
         
     jsonData = data[json_column_name.lower()]
     
@@ -14,13 +13,26 @@ def create_mapping(json_column_name: str) -> dict:
     
     return mappings
         
-def load_column_synonyms(json_file_path: str = 'mappings/column_synonyms.json') -> dict[str, list[str]]:
-    with open(json_file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+def load_column_synonyms(json_file_path: str = COLUMN_SYNONYMS_PATH) -> dict[str, list[str]]:
+    return get_registry().load(json_file_path)
+
+def load_column_synonym_sets(json_file_path: str = COLUMN_SYNONYMS_PATH) -> dict[str, frozenset[str]]:
+    """
+    Loads column synonyms as precomputed uppercase sets for header matching.
+    
+    Args:
+        json_file_path (str): Path to the column_synonyms.json file
+        
+    Returns:
+        dict[str, frozenset[str]]: TSV column name -> uppercased synonyms.
+        E.g., {'POSTAL_CODE': frozenset({'ZIP', 'ZIP CODE', ...}), ...}
+    """
+    return get_registry().column_synonym_sets(json_file_path)
         
-def load_value_synonyms(json_file_path: str = 'mappings/value_synonyms.json') -> dict[str, dict[str, list[str]]]:
+def load_value_synonyms(json_file_path: str = VALUE_SYNONYMS_PATH) -> dict[str, dict[str, list[str]]]:
     """
-    Loads value synonym mappings from JSON file.
+    Loads value synonym mappings from JSON file. The file is parsed once per process
+    and re-read only when it changes on disk.
     
     Args:
         json_file_path (str): Path to the value_synonyms.json file
@@ -29,8 +41,7 @@ def load_value_synonyms(json_file_path: str = 'mappings/value_synonyms.json') ->
         dict[str, dict[str, list[str]]]: Nested dictionary mapping column names to their value synonyms.
         E.g., {'GENDER_ID': {'Male': ['M', 'Man', ...], 'Female': ['F', 'Woman', ...]}, ...}
     """
-    with open(json_file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return get_registry().load(json_file_path)
 
 def normalize(val: str) -> str:
     val = val.lower().strip()
@@ -42,4 +53,4 @@ def main():
     #print(create_mapping('organization'))
     pass
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+
+def normalize_series(values: pd.Series | pd.Index) -> pd.Series | pd.Index:
+    """
+    Vectorized equivalent of utils.normalize for a Series or Index of strings.
+    """
+    return (
+        values.str.lower()
+        .str.strip()
+        .str.replace("and/or", "or", regex=False)
+        .str.replace("-", " ", regex=False)
+        .str.split()
+        .str.join(" ")  # collapse extra spaces
+    )
+
+def is_rectangular(raw_rows: list[list[str]]) -> bool:
+    width = len(raw_rows[0])
+    return all(len(row) == width for row in raw_rows)
+
+def clean_frame(df: pd.DataFrame, targets: list[tuple[int, object]]) -> pd.DataFrame:
+    """
+    Resolves the target columns of a roster DataFrame in place.
+    
+    Each column is converted to a categorical, only its categories (the distinct raw
+    values) are normalized and resolved, and the codes are mapped back with a single take.
+    
+    Args:
+        df (pd.DataFrame): Data rows, one column per CSV column (positional labels).
+        targets (list[tuple[int, ColumnResolver]]): CSV position and resolver for each column to clean.
+        
+    Returns:
+        pd.DataFrame: The same frame, with target columns replaced by database IDs.
+    """
+    for col_pos, resolver in targets:
+        categorical = df[col_pos].astype("category")
+        categories = categorical.cat.categories
+        if len(categories) == 0:
+            continue
+        normalized = normalize_series(categories.astype(str))
+        
+        resolve = resolver.resolve
+        resolved = np.array(
+            [resolve(raw, norm) for raw, norm in zip(categories, normalized)],
+            dtype=object
+        )
+        # every row beyond the first occurrence of a category is effectively a cache hit
+        resolver.cache.record_hits(len(df) - len(categories))
+        
+        df[col_pos] = resolved.take(categorical.cat.codes.to_numpy())
+    return df
+
+def clean_rows_vectorized(raw_rows: list[list[str]], targets: list[tuple[int, object]]) -> list[list[str]]:
+    """
+    Columnar cleaning backend. Produces the same rows as CleaningPipeline's row engine.
+    
+    Args:
+        raw_rows (list[list[str]]): The CSV data with headers in the first row. Rows must all
+        have the header's length; callers fall back to the row engine otherwise.
+        targets (list[tuple[int, ColumnResolver]]): CSV position and resolver for each column to clean.
+        
+    Returns:
+        list[list[str]]: Header row followed by cleaned rows.
+    """
+    if len(raw_rows) < 2:
+        return [raw_rows[0]] if raw_rows else []
+    df = pd.DataFrame(raw_rows[1:], dtype=object)
+    clean_frame(df, targets)
+    return [raw_rows[0]] + df.to_numpy(dtype=object).tolist()
@@ -0,0 +1,54 @@
+import threading
+import time
+import traceback
+from PySide6.QtCore import QObject, QRunnable, Signal
+from cleaner import OperationCancelled
+
+class WorkerSignals(QObject):
+    """Signals emitted by a PipelineWorker. They are delivered on the GUI thread."""
+    progress = Signal(int, float)  # rows processed, rows per second
+    finished = Signal(object)      # task result
+    failed = Signal(str)           # error message
+    cancelled = Signal()
+
+
+class PipelineWorker(QRunnable):
+    """
+    Runs a cleaning or export task on a QThreadPool thread so the window stays responsive.
+    
+    The task is a callable taking a progress callback, e.g.
+        lambda progress: pipeline.run(rows, progress_callback=progress)
+    The callback reports rows processed and raises OperationCancelled once cancel() was called.
+    """
+    def __init__(self, task):
+        super().__init__()
+        self.task = task
+        self.signals = WorkerSignals()
+        self._cancel_event = threading.Event()
+        self._start_time = None
+    
+    def cancel(self) -> None:
+        self._cancel_event.set()
+    
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+    
+    def report_progress(self, rows_processed: int) -> None:
+        if self._cancel_event.is_set():
+            raise OperationCancelled("Cancelled by user")
+        elapsed = time.perf_counter() - self._start_time
+        rate = rows_processed / elapsed if elapsed > 0 else 0.0
+        self.signals.progress.emit(rows_processed, rate)
+    
+    def run(self):
+        self._start_time = time.perf_counter()
+        try:
+            result = self.task(self.report_progress)
+        except OperationCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            print(traceback.format_exc())
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
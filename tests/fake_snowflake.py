@@ -0,0 +1,68 @@
+class FakeCursor:
+    """Records executed statements and replays canned results, like a Snowflake cursor."""
+    def __init__(self, connection):
+        self.connection = connection
+        self._results = []
+        self.closed = False
+        self.sfqid = None
+    
+    def execute(self, query, params=None):
+        self.connection.executed.append(query)
+        self._results = self.connection.respond(query)
+        return self
+    
+    def execute_async(self, query, params=None):
+        self.connection.executed.append(query)
+        self.sfqid = f"query-{len(self.connection.executed)}"
+        self.connection.async_results[self.sfqid] = self.connection.respond(query)
+        return {"queryId": self.sfqid}
+    
+    def get_results_from_sfqid(self, query_id):
+        self._results = self.connection.async_results[query_id]
+    
+    def fetch_pandas_all(self):
+        # responses for async queries are DataFrames
+        return self._results
+    
+    def fetchall(self):
+        return list(self._results)
+    
+    def fetchone(self):
+        return self._results[0] if self._results else None
+    
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    """
+    Local stand-in for a snowflake.connector connection.
+    
+    responses maps a statement prefix (e.g. "COPY INTO") to the rows it should return.
+    """
+    def __init__(self, responses: dict[str, list[tuple]] | None = None):
+        self.responses = responses or {}
+        self.executed = []
+        self.async_results = {}
+        self.closed = False
+    
+    def respond(self, query: str) -> list[tuple]:
+        for prefix, rows in self.responses.items():
+            if query.strip().upper().startswith(prefix.upper()):
+                return rows
+        return []
+    
+    def get_query_status_throw_if_error(self, query_id):
+        return "SUCCESS"
+    
+    def is_still_running(self, status) -> bool:
+        return False
+    
+    def cursor(self):
+        return FakeCursor(self)
+    
+    def is_closed(self) -> bool:
+        return self.closed
+    
+    def close(self):
+        self.closed = True
@@ -0,0 +1,75 @@
+import json
+import os
+import pytest
+from src.batch import find_roster_files, output_names, process_roster, run_batch, SUMMARY_FILE_NAME
+
+RAW_CSV = "First Name,Last Name,Gender,Ethnicity,School\n" \
+          "Ana,Lopez,F,Hispanic,Pomona High School\n" \
+          "Ben,Smith,m,Black,Zzyzx Qqq\n"
+
+class TestBatch:
+    
+    # 1) directories expand to their CSV files
+    def test_find_roster_files(self, tmp_path):
+        (tmp_path / "a.csv").write_text(RAW_CSV, encoding="utf-8")
+        (tmp_path / "b.txt").write_text("x", encoding="utf-8")
+        assert find_roster_files(str(tmp_path)) == [str(tmp_path / "a.csv")]
+        
+    # 2) one roster is cleaned and summarized
+    def test_process_roster(self, tmp_path):
+        csv_path = tmp_path / "a.csv"
+        csv_path.write_text(RAW_CSV, encoding="utf-8")
+        
+        result = process_roster(str(csv_path), str(tmp_path))
+        assert result["error"] is None
+        assert result["rows"] == 2
+        assert (tmp_path / "a.tsv").exists()
+        assert "total" in result["timings"]
+        
+    # 3) failures are recorded, not raised
+    def test_process_roster_error(self, tmp_path):
+        csv_path = tmp_path / "empty.csv"
+        csv_path.write_text("", encoding="utf-8")
+        
+        result = process_roster(str(csv_path), str(tmp_path))
+        assert result["error"] is not None
+        
+    # 4) batch writes a summary file
+    def test_run_batch_summary(self, tmp_path):
+        csv_path = tmp_path / "a.csv"
+        csv_path.write_text(RAW_CSV, encoding="utf-8")
+        out_dir = tmp_path / "out"
+        
+        summary = run_batch([str(csv_path)], str(out_dir), workers=1)
+        assert summary["total_rows"] == 2
+        assert json.loads((out_dir / SUMMARY_FILE_NAME).read_text())["files"] == 1
+        
+    # 5) rosters sharing a file name get distinct outputs; a file listed twice is refused
+    def test_duplicate_names(self, tmp_path):
+        for school in ("north", "south"):
+            (tmp_path / school).mkdir()
+            (tmp_path / school / "roster.csv").write_text(RAW_CSV, encoding="utf-8")
+        (tmp_path / "other.csv").write_text(RAW_CSV, encoding="utf-8")
+        csv_files = [str(tmp_path / "north" / "roster.csv"), str(tmp_path / "south" / "roster.csv"), str(tmp_path / "other.csv")]
+        
+        assert list(output_names(csv_files).values()) == ["north__roster", "south__roster", "other"]
+        summary = run_batch(csv_files, str(tmp_path / "out"), workers=1)
+        outputs = sorted(result["output"] for result in summary["results"])
+        assert len(set(outputs)) == 3 and all(os.path.exists(output) for output in outputs)
+        with pytest.raises(ValueError):
+            run_batch([csv_files[2], csv_files[2]], str(tmp_path / "out"), workers=1)
+        
+    # 6) a roster that fails part way leaves no output file
+    def test_failed_roster_cleanup(self, tmp_path, monkeypatch):
+        import src.batch as batch
+        csv_path = tmp_path / "a.csv"
+        csv_path.write_text(RAW_CSV, encoding="utf-8")
+        def failing_stream(csv_file_path, tsv_file_path, *args, **kwargs):
+            with open(tsv_file_path, "w", encoding="utf-8") as f:
+                f.write("EVENT_ID\n")
+            raise IOError("disk full")
+        monkeypatch.setattr(batch, "stream_csv_to_tsv", failing_stream)
+        
+        result = process_roster(str(csv_path), str(tmp_path))
+        assert "disk full" in result["error"]
+        assert not (tmp_path / "a.tsv").exists()
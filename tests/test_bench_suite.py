@@ -0,0 +1,46 @@
+import os
+import sys
+
+BENCHMARKS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks")
+if BENCHMARKS_DIR not in sys.path:
+    sys.path.insert(0, BENCHMARKS_DIR)
+
+from synthetic import generate_realistic_roster, REALISTIC_COLUMNS
+from bench_suite import compare_to_baseline
+from src.cleaner import map_headers_with_report
+
+BASELINE = {"10000": {"clean_table": {"rows_per_sec": 100_000, "peak_bytes": 10 * 2**20}}}
+
+def result(rows_per_sec, peak_bytes):
+    return {"10000": {"clean_table": {"rows_per_sec": rows_per_sec, "peak_bytes": peak_bytes}}}
+
+class TestRealisticRoster:
+
+    # 1) same seed, same roster; every generated header maps to its column
+    def test_headers_map(self):
+        rows = generate_realistic_roster(50, seed=1)
+        assert rows == generate_realistic_roster(50, seed=1)
+        assert len(rows) == 51
+        assert all(len(row) == len(rows[0]) for row in rows)
+
+        mapping, _ = map_headers_with_report(rows[0])
+        assert all(mapping[column] is not None for column in REALISTIC_COLUMNS)
+
+
+class TestCompareToBaseline:
+
+    # 1) within tolerance is not a regression
+    def test_within_tolerance(self):
+        assert compare_to_baseline(result(80_000, 11 * 2**20), BASELINE) == []
+
+    # 2) slower throughput and higher peak memory are both reported
+    def test_regressions(self):
+        regressions = compare_to_baseline(result(50_000, 20 * 2**20), BASELINE)
+        assert len(regressions) == 2
+        assert "clean_table" in regressions[0] and "-50%" in regressions[0]
+        assert "peak" in regressions[1]
+
+    # 3) sizes without a baseline and skipped memory runs are ignored
+    def test_missing_entries(self):
+        assert compare_to_baseline({"100000": {"clean_table": {"rows_per_sec": 1, "peak_bytes": 1}}}, BASELINE) == []
+        assert compare_to_baseline(result(90_000, None), BASELINE) == []
@@ -0,0 +1,102 @@
+import contextlib
+import io
+import pytest
+import pyarrow as pa
+from src.cleaner import (
+    TSV_HEADERS, Roster, build_tsv_projection, map_headers_to_tsv_columns, transfer_rows_to_tsv_with_mapping,
+    stream_csv_to_tsv, write_export_rows
+)
+from src.columnar_export import (
+    EXPORT_FORMATS, PARQUET_FORMAT, ARROW_FORMAT, read_export_table, export_path, resolve_export_format
+)
+from src.instrumentation import RunReport
+from src.batch import process_roster
+
+ROWS = [
+    ["Event", "Session", "Age", "Grade", "First Name", "Org_Id", "Postal Code"],
+    ["7", "70", " 12 ", "6", "Ana", "1204", "02139"],
+    ["7", "70", "", "K", "Ben", "Unknown Academy", ""],
+]
+COLUMN_MAPPING = {tsv_col: None for tsv_col in TSV_HEADERS} | {
+    "EVENT_ID": "Event", "SESSION_ID": "Session", "AGE": "Age", "GRADE": "Grade",
+    "STUDENT_FIRST_NAME": "First Name", "ORG_ID": "Org_Id", "POSTAL_CODE": "Postal Code",
+}
+RAW_CSV = "First Name,Last Name,Gender,Ethnicity,School\n" \
+          "Ana,Lopez,F,Hispanic,Pomona High School\n" \
+          "Ben,Smith,m,Black,Zzyzx Qqq\n"
+
+class TestColumnarExport:
+
+    # 1) the 12 TSV columns are written with integer types; blanks and non-integers become nulls
+    @pytest.mark.parametrize("export_format", [PARQUET_FORMAT, ARROW_FORMAT])
+    def test_typed_schema(self, tmp_path, export_format, capsys):
+        path = str(tmp_path / f"roster.{export_format}")
+        projection = build_tsv_projection(ROWS[0], COLUMN_MAPPING)
+
+        assert write_export_rows(ROWS[1:], path, projection, export_format) == (2, {"GRADE": 1, "ORG_ID": 1})
+        table = read_export_table(path)
+        assert table.column_names == TSV_HEADERS
+        assert table.schema.field("AGE").type == pa.int16()
+        assert table.schema.field("ORG_ID").type == pa.int64()
+        assert table.schema.field("POSTAL_CODE").type == pa.string()
+        assert table.column("AGE").to_pylist() == [12, None]
+        assert table.column("GRADE").to_pylist() == [6, None]
+        assert table.column("ORG_ID").to_pylist() == [1204, None]
+        assert table.column("POSTAL_CODE").to_pylist() == ["02139", None]
+        assert table.column("GENDER_ID").null_count == 2
+        out = capsys.readouterr().out
+        assert "1 GRADE values" in out and "1 ORG_ID values" in out
+
+    # 2) short rows are padded like the TSV export, across several batches
+    def test_ragged_rows(self, tmp_path):
+        path = str(tmp_path / "roster.parquet")
+        rows = [ROWS[1], ["8", "80"]] * 3
+        projection = build_tsv_projection(ROWS[0], COLUMN_MAPPING)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert write_export_rows(rows, path, projection, PARQUET_FORMAT, chunk_size=4) == (6, {})
+        table = read_export_table(path)
+        assert table.column("EVENT_ID").to_pylist() == [7, 8] * 3
+        assert table.column("STUDENT_FIRST_NAME").to_pylist() == ["Ana", None] * 3
+
+    # 3) a cleaned roster exports to every format, recorded as a write_<format> stage
+    @pytest.mark.parametrize("export_format", EXPORT_FORMATS)
+    def test_transfer_roster(self, tmp_path, export_format):
+        path = export_path(str(tmp_path / "roster.tsv"), export_format)
+        report = RunReport("test")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert transfer_rows_to_tsv_with_mapping(
+                Roster.from_rows(ROWS), path, map_headers_to_tsv_columns(ROWS[0]), report=report,
+                export_format=export_format
+            )
+        assert path.endswith(f".{export_format}")
+        assert report.to_dict()["stages"][0]["stage"] == f"write_{export_format}"
+
+    # 4) streaming and batch mode write Parquet too
+    def test_stream_and_batch(self, tmp_path):
+        csv_path = tmp_path / "a.csv"
+        csv_path.write_text(RAW_CSV, encoding="utf-8")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert stream_csv_to_tsv(str(csv_path), str(tmp_path / "s.parquet"), export_format=PARQUET_FORMAT) == 2
+        assert read_export_table(str(tmp_path / "s.parquet")).num_rows == 2
+
+        result = process_roster(str(csv_path), str(tmp_path), export_format=PARQUET_FORMAT)
+        assert result["error"] is None and result["output"].endswith("a.parquet")
+        table = read_export_table(result["output"])
+        assert table.column("GENDER_ID").type == pa.int64()
+        # the unknown school is kept as its name, which can't be stored in ORG_ID
+        assert result["rejected"] == {"ORG_ID": 1}
+        assert table.column("ORG_ID").null_count == 1
+        
+        tsv_result = process_roster(str(csv_path), str(tmp_path))
+        assert tsv_result["rejected"] == {}
+
+    # 5) format names and file extensions
+    def test_formats(self):
+        assert export_path("out/roster.tsv", PARQUET_FORMAT) == "out/roster.parquet"
+        assert export_path("out/roster", ARROW_FORMAT) == "out/roster.arrow"
+        assert export_path("out/roster.v2", PARQUET_FORMAT) == "out/roster.v2.parquet"
+        with pytest.raises(ValueError):
+            resolve_export_format("xlsx")
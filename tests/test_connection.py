@@ -0,0 +1,63 @@
+from src.connection import ConnectionManager
+from tests.fake_snowflake import FakeConnection
+
+def fake_connect(opened):
+    def connect(env_variables, **connect_options):
+        conn = FakeConnection()
+        conn.options = connect_options
+        opened.append(conn)
+        return conn
+    return connect
+
+class TestConnectionManager:
+    
+    # 1) sessions are reused across context blocks
+    def test_reuses_sessions(self):
+        opened = []
+        manager = ConnectionManager(env_variables=["u"], connect=fake_connect(opened))
+        
+        with manager.connection() as first:
+            pass
+        with manager.connection() as second:
+            pass
+        
+        assert first is second
+        assert len(opened) == 1
+        assert opened[0].options["client_session_keep_alive"] is True
+        
+    # 2) closed sessions are replaced
+    def test_drops_closed_sessions(self):
+        opened = []
+        manager = ConnectionManager(env_variables=["u"], connect=fake_connect(opened))
+        
+        with manager.connection() as conn:
+            pass
+        conn.close()
+        with manager.connection() as replacement:
+            pass
+        
+        assert replacement is not conn
+        assert len(opened) == 2
+        
+    # 3) idle sessions are pinged before reuse
+    def test_health_check_ping(self):
+        opened = []
+        manager = ConnectionManager(env_variables=["u"], connect=fake_connect(opened), health_check_interval=0)
+        
+        with manager.connection():
+            pass
+        with manager.connection() as conn:
+            pass
+        
+        assert conn.executed == ["SELECT 1"]
+        
+    # 4) pool size bounds idle sessions and exiting the manager closes them
+    def test_pool_size_and_close(self):
+        opened = []
+        with ConnectionManager(env_variables=["u"], pool_size=1, connect=fake_connect(opened)) as manager:
+            first = manager.acquire()
+            second = manager.acquire()
+            manager.release(first)
+            manager.release(second)
+            assert second.closed
+        assert first.closed
@@ -0,0 +1,103 @@
+import pytest
+from src import csv_readers
+from src.csv_readers import read_rows, iter_rows, CSV_READERS, DROP_IN_READERS, PYTHON_READER, PYARROW_READER, PANDAS_READER
+from src.cleaner import readCSV, stream_csv_to_tsv
+
+# leading zeros, "NA"/"null" text, an empty cell, a quoted newline and a blank line
+TRICKY_CSV = "\ufeffFirst Name,Grade,Notes\n" \
+             "Ana,007,\"two\nlines\"\n" \
+             "\n" \
+             "Ben,NA,null\n" \
+             "Cy,,\n"
+
+RAGGED_CSV = "a,b,c\n1,2,3\n4,5\n6,7,8,9\n"
+# a short row, a blank line, a whitespace-only line and a quoted newline
+SHORT_ROWS_CSV = "a,b,c\n1,2,3\n\n4,5\n  \n\"x\ny\",7,8\n"
+
+@pytest.fixture
+def tricky_csv(tmp_path):
+    path = tmp_path / "tricky.csv"
+    path.write_text(TRICKY_CSV, encoding="utf-8")
+    return str(path)
+
+class TestCSVReaders:
+    
+    # 1) every reader produces the same rows: text only, blank rows skipped, BOM dropped
+    @pytest.mark.parametrize("reader", CSV_READERS)
+    def test_same_rows(self, tricky_csv, reader):
+        expected = [
+            ["First Name", "Grade", "Notes"],
+            ["Ana", "007", "two\nlines"],
+            ["Ben", "NA", "null"],
+            ["Cy", "", ""],
+        ]
+        assert read_rows(tricky_csv, reader) == expected
+        assert list(iter_rows(tricky_csv, reader)) == expected
+        
+    # 2) pyarrow falls back to csv.reader for ragged rows, also in the middle of a stream
+    def test_pyarrow_ragged_fallback(self, tmp_path, monkeypatch):
+        path = tmp_path / "ragged.csv"
+        rows = "".join(f"{i},{i},{i}\n" for i in range(2000))
+        path.write_text(RAGGED_CSV.replace("1,2,3\n", "1,2,3\n" + rows), encoding="utf-8")
+        expected = read_rows(str(path), PYTHON_READER)
+        assert expected[-2] == ["4", "5"]
+        
+        assert read_rows(str(path), PYARROW_READER) == expected
+        monkeypatch.setattr(csv_readers, "READ_BLOCK_SIZE", 64)
+        assert list(iter_rows(str(path), PYARROW_READER)) == expected
+        
+    # 3) pandas falls back on rows longer than the header
+    def test_pandas_long_row_fallback(self, tmp_path):
+        path = tmp_path / "ragged.csv"
+        path.write_text(RAGGED_CSV, encoding="utf-8")
+        assert read_rows(str(path), PANDAS_READER) == read_rows(str(path), PYTHON_READER)
+        
+    # 4) a streamed pandas fallback resumes after whitespace-only lines without repeating or losing rows
+    @pytest.mark.parametrize("blank", ["   ", '"   "'])
+    def test_pandas_stream_fallback_after_blank_line(self, tmp_path, blank):
+        path = tmp_path / "ragged.csv"
+        path.write_text(f"a,b\n1,2\n{blank}\n3,4\n5,6\n7,8\n9,10,11\n12,13\n", encoding="utf-8")
+        expected = read_rows(str(path), PYTHON_READER)
+        
+        streamed = list(csv_readers.iter_rows_pandas(str(path), chunk_rows=2))
+        assert [row for row in streamed if row[0].strip()] == [row for row in expected if row[0].strip()]
+        assert streamed[-3:] == expected[-3:]
+        
+    # 5) the drop-in readers keep short and whitespace-only rows like csv.reader; pandas pads and skips them
+    @pytest.mark.parametrize("reader", CSV_READERS)
+    def test_short_rows_parity(self, tmp_path, reader):
+        path = tmp_path / "short.csv"
+        path.write_text(SHORT_ROWS_CSV, encoding="utf-8")
+        expected = [["a", "b", "c"], ["1", "2", "3"], ["4", "5"], ["  "], ["x\ny", "7", "8"]]
+        if reader not in DROP_IN_READERS:
+            expected = [["a", "b", "c"], ["1", "2", "3"], ["4", "5", ""], ["x\ny", "7", "8"]]
+        
+        assert read_rows(str(path), reader) == expected
+        assert list(iter_rows(str(path), reader)) == expected
+        
+    # 6) empty files, unknown readers and missing files
+    def test_edge_cases(self, tmp_path, capsys):
+        empty = tmp_path / "empty.csv"
+        empty.write_text("", encoding="utf-8")
+        for reader in CSV_READERS:
+            assert read_rows(str(empty), reader) == []
+        with pytest.raises(ValueError):
+            read_rows(str(empty), "excel")
+        assert readCSV(str(tmp_path / "missing.csv"), PYARROW_READER) is None
+        assert "not found" in capsys.readouterr().out
+        
+    # 7) streaming to TSV gives the same file with every reader
+    def test_stream_readers_match(self, tmp_path):
+        csv_path = tmp_path / "roster.csv"
+        csv_path.write_text(
+            "First Name,Last Name,Gender,Ethnicity,School\n"
+            "Ana,Lopez,F,Hispanic,Pomona High School\n"
+            "Ben,Smith,m,Black,Unknown Academy\n",
+            encoding="utf-8"
+        )
+        outputs = []
+        for reader in CSV_READERS:
+            tsv_path = tmp_path / f"{reader}.tsv"
+            assert stream_csv_to_tsv(str(csv_path), str(tsv_path), reader=reader) == 2
+            outputs.append(tsv_path.read_text(encoding="utf-8"))
+        assert outputs[0] == outputs[1] == outputs[2]
@@ -0,0 +1,31 @@
+import pandas as pd
+from src.fiscal_summary import refresh_fiscal_summary, REFRESH_STATEMENTS
+from src.report_queries import REPORT_QUERIES, LEGACY_REPORT_QUERIES
+from src.reports import ReportCache
+from tests.fake_snowflake import FakeConnection
+
+class TestFiscalSummary:
+    
+    # 1) tables are rebuilt in dependency order and counted
+    def test_refresh_order(self, tmp_path):
+        conn = FakeConnection({"SELECT COUNT(*)": [(42,)]})
+        reports = refresh_fiscal_summary(conn, ReportCache(str(tmp_path)))
+        
+        assert [report["table"] for report in reports] == list(REFRESH_STATEMENTS)
+        assert all(report["rows"] == 42 for report in reports)
+        creates = [query for query in conn.executed if "CREATE OR REPLACE" in query]
+        assert creates == list(REFRESH_STATEMENTS.values())
+        
+    # 2) a refresh drops cached dashboard results
+    def test_refresh_clears_report_cache(self, tmp_path):
+        cache = ReportCache(str(tmp_path))
+        cache.put("SELECT 1", pd.DataFrame({"A": [1]}))
+        refresh_fiscal_summary(FakeConnection(), cache)
+        assert cache.get("SELECT 1") is None
+        
+    # 3) dashboard queries read the summary tables, not the raw ones
+    def test_report_queries_use_summary(self):
+        assert REPORT_QUERIES.keys() == LEGACY_REPORT_QUERIES.keys()
+        for query in REPORT_QUERIES.values():
+            assert "EVENT_STUDENT_DEMOGRAPHIC" not in query
+            assert "MONTH(" not in query
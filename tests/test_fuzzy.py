@@ -0,0 +1,58 @@
+from src.fuzzy import FuzzyMatcher, linear_best_match
+from src.resolution import ColumnResolver
+from src.utils import normalize
+
+LOOKUP = {
+    "rosa parks elementary school": 10,
+    "george washington carver middle school": 16,
+    "crete academy": 17,
+    "": 382,
+}
+
+class TestFuzzyMatcher:
+    
+    # 1) typos resolve to the closest key
+    def test_typo(self):
+        matcher = FuzzyMatcher(LOOKUP)
+        pos, score = matcher.best_match("rosa prks elementary schol")
+        assert matcher.keys[pos] == "rosa parks elementary school"
+        assert score > 0.9
+        assert matcher.match("crete acadmey", threshold=0.85) == 17
+        
+    # 2) dissimilar values fall below the threshold or have no candidates
+    def test_threshold(self):
+        matcher = FuzzyMatcher(LOOKUP)
+        assert matcher.match("cedar summit institute", threshold=0.85) is None
+        assert matcher.best_match("zzzz") is None
+        
+    # 3) the index finds the same best key as scoring every key
+    def test_matches_linear_scan(self):
+        matcher = FuzzyMatcher(LOOKUP)
+        for value in ["rosa parks elem", "george w carver middle", "crete acad", "rosa parks"]:
+            assert matcher.best_match(value) == linear_best_match(LOOKUP, value)
+
+
+class TestFuzzyResolution:
+    
+    # 4) unknown orgs are kept raw instead of matching the empty NULL synonym
+    def test_unknown_org_kept(self):
+        resolver = ColumnResolver("ORG_ID")
+        assert resolver.resolve_uncached("Zzyzx Qqq") == ("Zzyzx Qqq", False)
+        assert resolver.resolve_uncached("") == ("382", True)
+        
+    # 5) accepted and rejected lookups are reported
+    def test_fuzzy_report(self):
+        resolver = ColumnResolver("ORG_ID")
+        assert resolver.resolve_uncached("Kirkland Acadmy for Excelence")[1]
+        resolver.resolve_uncached("Zzyzx Qqq")
+        
+        report = resolver.fuzzy_report()
+        assert [entry["value"] for entry in report["accepted"]] == ["Kirkland Acadmy for Excelence"]
+        assert report["accepted"][0]["match"] == normalize("Kirkland Academy for Excellence")
+        assert [entry["value"] for entry in report["rejected"]] == ["Zzyzx Qqq"]
+        
+    # 6) fuzzy matching can be turned off
+    def test_disabled(self):
+        resolver = ColumnResolver("ORG_ID", fuzzy=False)
+        assert resolver.resolve_uncached("Kirkland Acadmy for Excelence") == ("Kirkland Acadmy for Excelence", False)
+        assert resolver.fuzzy_decisions == {}
@@ -0,0 +1,52 @@
+from src.header_mapping import HeaderMatcher
+from src.cleaner import map_headers_with_report, TSV_HEADERS
+
+SYNONYMS = {
+    "GENDER_ID": ["gender", "sex"],
+    "STUDENT_CODE": ["student id"],
+    "POSTAL_CODE": ["zip"],
+}
+
+class TestHeaderMatcher:
+    
+    # 1) exact names beat synonyms, the runner-up is reported
+    def test_exact_beats_synonym(self):
+        matcher = HeaderMatcher(["GENDER_ID", "POSTAL_CODE"], SYNONYMS)
+        result = matcher.match(["Sex", "gender_id", "Zip"])
+        
+        assert result["GENDER_ID"]["csv_column"] == "gender_id"
+        assert result["GENDER_ID"]["score"] == 1.0
+        assert result["GENDER_ID"]["alternatives"] == ["Sex"]
+        assert result["POSTAL_CODE"]["match"] == "synonym"
+        
+    # 2) among equal scores the first CSV column wins
+    def test_first_column_wins_ties(self):
+        matcher = HeaderMatcher(["GENDER_ID"], SYNONYMS)
+        result = matcher.match(["Gender", "Sex"])
+        assert result["GENDER_ID"]["index"] == 0
+        
+    # 3) punctuation and spacing differences match with lower confidence
+    def test_compact_match(self):
+        matcher = HeaderMatcher(["STUDENT_CODE", "GENDER_ID"], SYNONYMS)
+        result = matcher.match(["Student-ID", "Gender Id"])
+        assert result["STUDENT_CODE"]["csv_column"] == "Student-ID"
+        assert result["STUDENT_CODE"]["match"] == "compact"
+        assert result["GENDER_ID"]["score"] == 0.75
+        
+    # 4) excluded (hand-mapped) columns are skipped
+    def test_exclude(self):
+        matcher = HeaderMatcher(["GENDER_ID"], SYNONYMS)
+        assert matcher.match(["Gender", "Sex"], exclude={0})["GENDER_ID"]["csv_column"] == "Sex"
+
+
+class TestMapHeadersWithReport:
+    
+    # 5) every TSV column is in the mapping and the report
+    def test_report_covers_all_columns(self):
+        mapping, report = map_headers_with_report(["event id", "First Name", "zip code", "Unrelated"])
+        
+        assert list(mapping) == TSV_HEADERS
+        assert mapping["EVENT_ID"] == "event id"
+        assert mapping["STUDENT_FIRST_NAME"] == "First Name"
+        assert report["POSTAL_CODE"]["score"] == 0.9
+        assert report["AGE"] == {"csv_column": None, "score": 0.0, "match": None, "alternatives": []}
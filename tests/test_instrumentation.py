@@ -0,0 +1,125 @@
+import json
+from src.instrumentation import RunReport, timed_stage, profiled
+from src.cleaner import stream_csv_to_tsv
+from src.batch import run_batch
+
+RAW_CSV = "First Name,Last Name,Gender,Age,Grade,Ethnicity,School\n" \
+          "Ana,Lopez,F,12,7,Hispanic,Pomona High School\n" \
+          "Ben,Smith,m,13,8,Black,Unknown Academy\n"
+
+class TestRunReport:
+
+    # 1) stages keep first-use order and accumulate calls and rows
+    def test_stage_accumulates(self):
+        report = RunReport("test")
+        with report.stage("read_csv", rows=10):
+            pass
+        with report.stage("clean") as stage:
+            stage["rows"] = 4
+        with report.stage("read_csv", rows=5):
+            pass
+
+        stages = report.to_dict()["stages"]
+        assert [entry["stage"] for entry in stages] == ["read_csv", "clean"]
+        assert stages[0]["rows"] == 15
+        assert stages[0]["calls"] == 2
+        assert stages[1]["rows"] == 4
+
+    # 2) count() charges rows to a stage as they are consumed, registered up front
+    def test_count(self):
+        report = RunReport()
+        rows = report.count(iter(range(3)), "read_csv")
+        with report.stage("write_tsv"):
+            assert list(rows) == [0, 1, 2]
+
+        assert list(report.stages) == ["read_csv", "write_tsv"]
+        assert report.stages["read_csv"]["rows"] == 3
+
+    # 3) nest() makes the outer stage exclusive of the inner one
+    def test_nest(self):
+        report = RunReport()
+        report.add("write_tsv", 1.0)
+        report.add("clean", 0.25)
+        report.nest("write_tsv", "clean")
+        report.nest("write_tsv", "missing")
+        assert report.stages["write_tsv"]["seconds"] == 0.75
+
+    # 4) the JSON report round-trips
+    def test_write_json(self, tmp_path):
+        report = RunReport("roster")
+        report.add("clean", 0.5, rows=100)
+        report.meta["backend"] = "thread"
+        path = tmp_path / "report.json"
+        report.write_json(str(path))
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["name"] == "roster"
+        assert data["stages"][0]["rows_per_sec"] == 200
+        assert data["meta"] == {"backend": "thread"}
+
+    # 5) without a report, timed_stage is a no-op
+    def test_timed_stage_without_report(self):
+        with timed_stage(None, "clean", rows=3) as stage:
+            assert stage["rows"] == 3
+
+    # 6) profiled() records the hottest functions and peak memory
+    def test_profiled(self, tmp_path):
+        report = RunReport()
+        dump_path = tmp_path / "run.prof"
+        with profiled(report, top=5, dump_path=str(dump_path)):
+            [str(i) for i in range(10000)]
+
+        assert 0 < len(report.profile) <= 5
+        assert report.memory["peak_bytes"] > 0
+        assert dump_path.exists()
+        assert "peak" in report.format_breakdown()
+
+    
+    # 7) restart() keeps the chosen stages and meta and drops the rest
+    def test_restart(self):
+        report = RunReport("roster")
+        report.add("read_csv", 0.5, rows=10)
+        report.add("clean", 1.0, rows=10)
+        report.meta["reader"] = "python"
+
+        again = report.restart(["read_csv", "map_headers"])
+        with again.stage("clean", rows=10):
+            pass
+
+        assert again.name == "roster" and again.meta == {"reader": "python"}
+        assert list(again.stages) == ["read_csv", "clean"]
+        assert again.stages["read_csv"] == report.stages["read_csv"]
+        assert again.stages["clean"]["calls"] == 1
+        again.add("read_csv", 0.5)
+        assert report.stages["read_csv"]["calls"] == 1
+
+
+class TestPipelineStages:
+
+    # 1) streaming records every stage with row counts
+    def test_stream_report(self, tmp_path):
+        csv_path = tmp_path / "roster.csv"
+        csv_path.write_text(RAW_CSV, encoding="utf-8")
+        report = RunReport()
+
+        written = stream_csv_to_tsv(str(csv_path), str(tmp_path / "roster.tsv"), report=report)
+
+        stages = report.stages
+        assert written == 2
+        assert ["map_headers", "prepare", "read_csv", "clean", "write_tsv"] == list(stages)
+        assert stages["read_csv"]["rows"] == 2
+        assert stages["clean"]["rows"] == 2
+        assert stages["write_tsv"]["rows"] == 2
+
+    # 2) batch summaries carry per-file and merged stages, plus a profile when asked
+    def test_batch_profile(self, tmp_path):
+        csv_path = tmp_path / "roster.csv"
+        csv_path.write_text(RAW_CSV, encoding="utf-8")
+
+        summary = run_batch([str(csv_path)], str(tmp_path / "out"), profile=True)
+
+        assert summary["workers"] == 1
+        assert summary["results"][0]["stages"]
+        assert {entry["stage"] for entry in summary["stages"]} >= {"read_csv", "clean", "write_tsv"}
+        assert summary["profile"]
+        assert summary["memory"]["peak_bytes"] > 0
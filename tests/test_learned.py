@@ -0,0 +1,47 @@
+from src.learned import LearnedResolutionStore
+from src.resolution import ColumnResolver
+
+class TestLearnedResolutionStore:
+    
+    # 1) decisions are keyed by normalized value and the last one wins
+    def test_record_and_get(self, tmp_path):
+        store = LearnedResolutionStore(str(tmp_path / "learned.jsonl"))
+        assert store.get("ORG_ID", "Pomona HS") is None
+        
+        store.record("ORG_ID", "Pomona HS", 58)
+        assert store.get("ORG_ID", "  pomona   hs ") == 58
+        store.record("ORG_ID", "pomona hs", 60)
+        assert store.get("ORG_ID", "Pomona HS") == 60
+        assert store.get("GENDER_ID", "Pomona HS") is None
+        
+    # 2) forgetting a value and compacting the log
+    def test_forget_and_compact(self, tmp_path):
+        path = tmp_path / "learned.jsonl"
+        store = LearnedResolutionStore(str(path))
+        store.record("ORG_ID", "Pomona HS", 58)
+        store.record("ORG_ID", "Pomona HS", 60)
+        store.record("ORG_ID", "Crete", 17)
+        store.forget("ORG_ID", "Crete")
+        
+        assert store.get("ORG_ID", "Crete") is None
+        assert store.compact() == 1
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 1
+        assert store.get("ORG_ID", "Pomona HS") == 60
+        
+    # 3) malformed lines are skipped
+    def test_malformed_lines(self, tmp_path):
+        path = tmp_path / "learned.jsonl"
+        path.write_text('{"column": "ORG_ID", "value": "crete", "id": 17}\nnot json\n{"column": "ORG_ID"}\n', encoding="utf-8")
+        assert LearnedResolutionStore(str(path)).for_column("ORG_ID") == {"crete": 17}
+        
+    # 4) the resolver applies learned values before any matching
+    def test_resolver_consults_store_first(self, tmp_path):
+        store = LearnedResolutionStore(str(tmp_path / "learned.jsonl"))
+        store.record("ORG_ID", "Zzyzx Qqq", 58)
+        store.record("GENDER_ID", "M", 2)
+        
+        org = ColumnResolver("ORG_ID", learned_store=store)
+        assert org.resolve_uncached("zzyzx qqq") == ("58", True)
+        assert org.learned_hits == 1
+        # overrides the synonym table as well
+        assert ColumnResolver("GENDER_ID", learned_store=store).resolve_uncached("M") == ("2", True)
@@ -0,0 +1,60 @@
+import random
+from src.matcher import ValueMatcher, linear_match
+
+LOOKUP = {
+    "male": 1,
+    "female": 2,
+    "other or np": 3,
+    "hispanic or latino": 4,
+    "latino": 4,
+    "pomona high school": 10,
+    "pomona": 11,
+    "ab": 12,
+}
+
+class TestValueMatcher:
+    
+    # 1) key contained in value
+    def test_key_in_value(self):
+        matcher = ValueMatcher(LOOKUP)
+        assert matcher.match("pomona high school annex") == linear_match(LOOKUP, "pomona high school annex")
+        
+    # 2) value contained in key
+    def test_value_in_key(self):
+        matcher = ValueMatcher(LOOKUP)
+        assert matcher.match("hispanic") == 4
+        
+    # 3) first key in lookup order wins ("male" is a substring of "female")
+    def test_first_match_semantics(self):
+        matcher = ValueMatcher(LOOKUP)
+        assert matcher.match("female") == linear_match(LOOKUP, "female") == 1
+        
+    # 4) short and empty values
+    def test_short_values(self):
+        matcher = ValueMatcher(LOOKUP)
+        for value in ["", "a", "b", "ma", "zz"]:
+            assert matcher.match(value) == linear_match(LOOKUP, value)
+    
+    # 5) no match
+    def test_no_match(self):
+        matcher = ValueMatcher(LOOKUP)
+        assert matcher.match("xyz academy") is None
+        
+    # 6) randomized equivalence with the linear scan
+    def test_matches_linear_scan(self):
+        rng = random.Random(0)
+        alphabet = "abilmnoprst "
+        lookup = {"".join(rng.choice(alphabet) for _ in range(rng.randint(1, 8))): i for i in range(200)}
+        matcher = ValueMatcher(lookup)
+        for _ in range(2000):
+            value = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+            assert matcher.match(value) == linear_match(lookup, value), value
+    
+    # 7) an empty key (the "" synonym of NULL) only matches exactly, unlike the original scan
+    def test_empty_key(self):
+        lookup = {"": 382} | LOOKUP
+        matcher = ValueMatcher(lookup)
+        assert linear_match(lookup, "xyz academy") == 382
+        assert matcher.match("xyz academy") is None
+        assert matcher.match("pomona high school annex") == linear_match(LOOKUP, "pomona high school annex")
+        assert matcher.match("") == 1
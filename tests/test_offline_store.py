@@ -0,0 +1,76 @@
+import pandas as pd
+import pytest
+from src.offline_store import (
+    connect_offline, load_tsv, populate_sample_data, refresh_offline_summary, run_offline_reports, RAW_TABLES
+)
+
+@pytest.fixture
+def store(tmp_path):
+    """Deterministic fixture database: sample data with the summary tables built."""
+    db_path = str(tmp_path / "store.db")
+    conn = connect_offline(db_path)
+    populate_sample_data(conn, seed=7)
+    refresh_offline_summary(conn)
+    yield db_path, conn
+    conn.close()
+
+class TestOfflineStore:
+    
+    # 1) the same seed gives the same database
+    def test_sample_data_is_deterministic(self, tmp_path):
+        first = connect_offline(str(tmp_path / "a.db"))
+        second = connect_offline(str(tmp_path / "b.db"))
+        assert populate_sample_data(first, seed=3) == populate_sample_data(second, seed=3)
+        query = "SELECT * FROM EVENT_STUDENT_DEMOGRAPHIC ORDER BY STUDENT_CODE"
+        assert first.execute(query).fetchall() == second.execute(query).fetchall()
+        
+    # 2) every dashboard report runs and has the columns the plots expect
+    def test_reports_have_dashboard_columns(self, store):
+        db_path, _ = store
+        results = run_offline_reports(db_path)
+        
+        assert list(results["students_per_fiscal_year"].columns) == ["FISCAL_YEAR", "TOTAL_STUDENTS"]
+        assert list(results["ethnicity_percentages"].columns) == ["FISCAL_YEAR", "ETHNICITY", "PCT_OF_YEAR"]
+        assert list(results["gender_percentages"].columns) == ["FISCAL_YEAR", "PCT_MALE", "PCT_FEMALE", "PCT_OTHER"]
+        assert {"FISCAL_YEAR", "GRADE_LEVEL", "STUDENT_COUNT"} <= set(results["grade_percentages"].columns)
+        assert "FUN_ACTIVITY" in results["event_type"].columns
+        
+    # 3) totals match a straightforward pandas computation over the raw tables
+    def test_totals_match_raw_tables(self, store):
+        db_path, conn = store
+        sessions = pd.read_sql("SELECT * FROM EVENT_SESSION", conn)
+        activity = pd.read_sql("SELECT * FROM EVENT_ACTIVITY", conn)
+        students = pd.read_sql("SELECT EVENT_ID, SESSION_ID FROM EVENT_STUDENT_DEMOGRAPHIC", conn)
+        
+        start = pd.to_datetime(sessions["SESSION_START_DATE"])
+        first_year = start.dt.year - (start.dt.month < 7)
+        sessions["FISCAL_YEAR"] = first_year.astype(str) + "-" + (first_year + 1).astype(str)
+        counts = students.groupby(["EVENT_ID", "SESSION_ID"]).size().rename("N").reset_index()
+        merged = sessions.merge(counts, how="left").merge(activity, how="left")
+        merged["FINAL"] = merged["N"].fillna(merged["ACTUAL_ATTENDEE_CNT"])
+        expected = merged.groupby("FISCAL_YEAR")["FINAL"].sum().astype(int).to_dict()
+        
+        result = run_offline_reports(db_path)["students_per_fiscal_year"]
+        assert dict(zip(result["FISCAL_YEAR"], result["TOTAL_STUDENTS"])) == expected
+        
+        gender = run_offline_reports(db_path)["gender_percentages"]
+        sums = gender[["PCT_MALE", "PCT_FEMALE", "PCT_OTHER"]].sum(axis=1)
+        assert all(abs(total - 100) < 0.05 for total in sums)
+        
+    # 4) exported TSVs are appended by header name, blanks as NULL
+    def test_load_tsv(self, tmp_path):
+        conn = connect_offline(str(tmp_path / "store.db"))
+        tsv_path = tmp_path / "roster.tsv"
+        headers = RAW_TABLES["EVENT_STUDENT_DEMOGRAPHIC"]
+        tsv_path.write_text(
+            "\t".join(headers) + "\n" + "\t".join(["1", "2", "10", "5", "382", "1", "", "S1", "91766", "0", "Ana", "Lopez"]) + "\n",
+            encoding="utf-8"
+        )
+        assert load_tsv(conn, str(tsv_path)) == 1
+        row = conn.execute("SELECT EVENT_ID, GRADE, ETHNICITY_ID, STUDENT_FIRST_NAME FROM EVENT_STUDENT_DEMOGRAPHIC").fetchone()
+        assert row == (1, 5, None, "Ana")
+        
+    # 5) a missing store is a clear error
+    def test_missing_store(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            run_offline_reports(str(tmp_path / "missing.db"))
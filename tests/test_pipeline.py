@@ -0,0 +1,61 @@
+import copy
+import pytest
+from src.cleaner import CleaningPipeline, Roster, clean_column, clean_table, COLUMNS_TO_CLEAN
+from src.instrumentation import RunReport
+
+ROWS = [
+    ["First Name", "Gender", "Ethnicity", "School"],
+    ["Ana", "F", "Hispanic", "Pomona High School"],
+    ["Ben", "m", "Black", "Unknown Academy"],
+    ["Cy", "Non-binary", "Asian", "Pomona High School"],
+]
+
+class TestCleanTable:
+    
+    # 1) single pass matches chained clean_column calls
+    def test_matches_chained_clean_column(self):
+        chained = copy.deepcopy(ROWS)
+        for column_name in COLUMNS_TO_CLEAN:
+            chained = clean_column(column_name, chained)
+        
+        assert clean_table(ROWS) == chained
+        
+    # 2) input rows are not modified by default
+    def test_does_not_mutate_input(self):
+        original = copy.deepcopy(ROWS)
+        clean_table(ROWS)
+        assert ROWS == original
+        
+    # 3) in-place mode updates the given rows
+    def test_in_place(self):
+        rows = copy.deepcopy(ROWS)
+        result = clean_table(rows, in_place=True)
+        assert result is rows
+        assert rows[1][1] == "2"
+    
+    # 4) missing columns are reported by prepare
+    def test_missing_columns_reported(self):
+        pipeline = CleaningPipeline()
+        missing = pipeline.prepare(["First Name", "Gender"])
+        assert missing == ["ETHNICITY_ID", "ORG_ID"]
+        
+    # 5) pandas backend produces the same rows as the row engine
+    def test_pandas_backend_matches_rows(self):
+        assert clean_table(ROWS, backend="pandas") == clean_table(ROWS, backend="rows")
+        
+    # 6) unknown backend
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown cleaning backend"):
+            clean_table(ROWS, backend="spark")
+    
+    # 7) the report names the engine that ran: a Roster and a ragged list ignore the pandas backend
+    def test_reported_engine(self, capsys):
+        ragged = copy.deepcopy(ROWS) + [ROWS[1] + ["extra"]]
+        engines = []
+        for raw_rows in (copy.deepcopy(ROWS), ragged, Roster.from_rows(ROWS)):
+            pipeline = CleaningPipeline()
+            pipeline.prepare(ROWS[0])
+            report = RunReport()
+            pipeline.run(raw_rows, backend="pandas", report=report)
+            engines.append(report.meta["backend"])
+        assert engines == ["pandas", "rows", "roster"]
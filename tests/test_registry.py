@@ -0,0 +1,50 @@
+import json
+import os
+from src.registry import MappingRegistry
+
+class TestMappingRegistry:
+    
+    # 1) files are parsed once
+    def test_loads_once(self, tmp_path):
+        path = tmp_path / "synonyms.json"
+        path.write_text(json.dumps({"AGE": ["age"]}), encoding="utf-8")
+        registry = MappingRegistry()
+        
+        first = registry.load(str(path))
+        second = registry.load(str(path))
+        assert first is second
+        assert registry.loads == 1
+        
+    # 2) a changed file is re-read
+    def test_invalidates_on_mtime_change(self, tmp_path):
+        path = tmp_path / "synonyms.json"
+        path.write_text(json.dumps({"AGE": ["age"]}), encoding="utf-8")
+        registry = MappingRegistry()
+        registry.load(str(path))
+        
+        path.write_text(json.dumps({"AGE": ["age", "student age"]}), encoding="utf-8")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        assert registry.load(str(path)) == {"AGE": ["age", "student age"]}
+        assert registry.loads == 2
+        
+    # 3) uppercase synonym sets are precomputed
+    def test_column_synonym_sets(self, tmp_path):
+        path = tmp_path / "synonyms.json"
+        path.write_text(json.dumps({"POSTAL_CODE": ["zip", "Zip Code"]}), encoding="utf-8")
+        registry = MappingRegistry()
+        
+        sets = registry.column_synonym_sets(str(path))
+        assert sets["POSTAL_CODE"] == frozenset({"ZIP", "ZIP CODE"})
+        assert registry.column_synonym_sets(str(path)) is sets
+        
+    # 4) missing file
+    def test_missing_file(self, tmp_path):
+        registry = MappingRegistry()
+        try:
+            registry.load(str(tmp_path / "missing.json"))
+        except FileNotFoundError as e:
+            assert "not found" in str(e)
+        else:
+            raise AssertionError("Expected FileNotFoundError")
@@ -0,0 +1,45 @@
+import json
+import pandas as pd
+from src.report_pack import build_report_pack, MANIFEST_FILE_NAME
+
+def sample_results():
+    return {
+        "students_per_fiscal_year": pd.DataFrame({"FISCAL_YEAR": ["2023-2024", "2024-2025"], "TOTAL_STUDENTS": [120, 150]}),
+        "ethnicity_percentages": pd.DataFrame({
+            "FISCAL_YEAR": ["2023-2024", "2023-2024"], "ETHNICITY": ["Hispanic", "Black"], "PCT_OF_YEAR": [60.0, 40.0]
+        }),
+        "gender_percentages": pd.DataFrame({
+            "FISCAL_YEAR": ["2023-2024"], "PCT_MALE": [48.0], "PCT_FEMALE": [50.0], "PCT_OTHER": [2.0]
+        }),
+        "grade_percentages": pd.DataFrame({
+            "FISCAL_YEAR": ["2023-2024", "2023-2024"], "GRADE_LEVEL": ["9", "10"], "STUDENT_COUNT": [30, 70]
+        }),
+        "event_type": pd.DataFrame({
+            "FISCAL_YEAR": ["2023-2024"], "CLASS": [10], "FIELD_TRIP": [5], "WORKSHOP": [3],
+            "FUNDRAISER": [0], "CAMP": [2], "FUN_ACTIVITY": [1]
+        }),
+    }
+
+class TestReportPack:
+    
+    # 1) every chart is written in every format without a display
+    def test_renders_all_charts(self, tmp_path):
+        manifest = build_report_pack(sample_results(), str(tmp_path), formats=("png", "svg"), workers=2)
+        
+        assert manifest["failed"] == 0
+        assert len(manifest["charts"]) == 5
+        for chart in manifest["charts"]:
+            assert len(chart["files"]) == 2
+            for path in chart["files"]:
+                assert (tmp_path / path.split("/")[-1]).stat().st_size > 0
+        assert json.loads((tmp_path / MANIFEST_FILE_NAME).read_text())["formats"] == ["png", "svg"]
+        
+    # 2) a chart that fails is reported, the rest still render
+    def test_failed_chart_is_reported(self, tmp_path):
+        results = sample_results()
+        results["event_type"] = pd.DataFrame({"FISCAL_YEAR": ["2023-2024"]})
+        manifest = build_report_pack(results, str(tmp_path), formats=("png",), workers=2)
+        
+        failed = [chart for chart in manifest["charts"] if chart["error"] is not None]
+        assert [chart["chart"] for chart in failed] == ["event_type"]
+        assert manifest["failed"] == 1
@@ -0,0 +1,47 @@
+import pandas as pd
+from src.reports import ReportCache, run_reports
+from tests.fake_snowflake import FakeConnection
+
+QUERIES = {
+    "students": "SELECT FISCAL_YEAR, TOTAL_STUDENTS FROM A",
+    "gender": "SELECT FISCAL_YEAR, PCT_MALE FROM B",
+}
+
+def make_conn():
+    return FakeConnection({
+        "SELECT FISCAL_YEAR, TOTAL_STUDENTS": pd.DataFrame({"FISCAL_YEAR": ["2023-2024"], "TOTAL_STUDENTS": [120]}),
+        "SELECT FISCAL_YEAR, PCT_MALE": pd.DataFrame({"FISCAL_YEAR": ["2023-2024"], "PCT_MALE": [48.5]}),
+    })
+
+class TestRunReports:
+    
+    # 1) all missing queries are submitted asynchronously
+    def test_runs_all_queries(self, tmp_path):
+        conn = make_conn()
+        results = run_reports(QUERIES, ReportCache(str(tmp_path)), conn=conn)
+        
+        assert list(results) == ["students", "gender"]
+        assert results["students"]["TOTAL_STUDENTS"].tolist() == [120]
+        assert len(conn.executed) == 2
+        
+    # 2) cached results skip the warehouse
+    def test_uses_parquet_cache(self, tmp_path):
+        cache = ReportCache(str(tmp_path))
+        run_reports(QUERIES, cache, conn=make_conn())
+        
+        conn = make_conn()
+        results = run_reports(QUERIES, cache, conn=conn)
+        assert conn.executed == []
+        assert results["gender"]["PCT_MALE"].tolist() == [48.5]
+        
+    # 3) expired entries and refresh re-run the queries
+    def test_ttl_and_refresh(self, tmp_path):
+        run_reports(QUERIES, ReportCache(str(tmp_path)), conn=make_conn())
+        
+        conn = make_conn()
+        run_reports(QUERIES, ReportCache(str(tmp_path), ttl=-1), conn=conn)
+        assert len(conn.executed) == 2
+        
+        conn = make_conn()
+        run_reports(QUERIES, ReportCache(str(tmp_path)), refresh=True, conn=conn)
+        assert len(conn.executed) == 2
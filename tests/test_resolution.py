@@ -0,0 +1,74 @@
+import pytest
+from src.resolution import ResolutionCache, ColumnResolver
+from src.cleaner import CleaningPipeline
+
+class TestResolutionCache:
+    
+    # 1) hits and misses are counted
+    def test_hit_miss_stats(self):
+        cache = ResolutionCache()
+        assert cache.get("M") is None
+        cache.put("M", ("1", True))
+        assert cache.get("M") == ("1", True)
+        
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        
+    # 2) least recently used entry is evicted first
+    def test_lru_eviction(self):
+        cache = ResolutionCache(maxsize=2)
+        cache.put("a", ("1", True))
+        cache.put("b", ("2", True))
+        cache.get("a")
+        cache.put("c", ("3", True))
+        
+        assert cache.get("b") is None
+        assert cache.get("a") == ("1", True)
+        assert cache.stats()["evictions"] == 1
+        assert len(cache) == 2
+        
+    # 3) invalid size
+    def test_invalid_size(self):
+        with pytest.raises(ValueError, match="must be positive"):
+            ResolutionCache(maxsize=0)
+
+
+class TestUnmatchedReport:
+    
+    # 1) unmatched values are collected silently and not searched again after eviction
+    def test_evicted_unmatched(self, capsys):
+        resolver = ColumnResolver("GENDER_ID", cache=ResolutionCache(maxsize=1), fuzzy=False)
+        calls = []
+        resolve_uncached = resolver.resolve_uncached
+        resolver.resolve_uncached = lambda raw, norm=None: calls.append(raw) or resolve_uncached(raw, norm)
+        
+        for value in ["Zzyzx", "F", "Zzyzx", "F"]:
+            resolver.resolve(value)
+        
+        assert resolver.resolve("Zzyzx") == "Zzyzx"
+        assert calls == ["Zzyzx", "F", "F"]
+        assert resolver.unmatched == {"Zzyzx"}
+        assert capsys.readouterr().out == ""
+        assert resolver.format_unmatched() == "No match found for 1 GENDER_ID values. Keeping original values: 'Zzyzx'"
+    
+    # 2) a pipeline run reports each column's unmatched values once
+    def test_pipeline_reports_once(self, capsys):
+        rows = [["Gender"], ["Zzyzx"], ["Zzyzx"], ["Qqq"], ["F"]]
+        pipeline = CleaningPipeline(["GENDER_ID"])
+        pipeline.prepare(rows[0])
+        pipeline.run(rows)
+        
+        lines = [line for line in capsys.readouterr().out.splitlines() if "No match" in line]
+        assert lines == ["No match found for 2 GENDER_ID values. Keeping original values: 'Qqq', 'Zzyzx'"]
+    
+    # 3) the "" synonym of NULL resolves empty values but is not a substring of unknown ones
+    def test_empty_key_synonym(self):
+        resolver = ColumnResolver("ORG_ID", fuzzy=False)
+        assert resolver.lookup[""] == 382
+        
+        assert resolver.resolve("") == "382"
+        assert resolver.resolve("Zzyzx Qqq") == "Zzyzx Qqq"
+        assert resolver.resolve("Pomona High School") == "233"
+        assert resolver.unmatched == {"Zzyzx Qqq"}
@@ -0,0 +1,135 @@
+import contextlib
+import io
+import pytest
+from src.cleaner import (
+    CleaningPipeline, Roster, read_roster, readCSV, transfer_rows_to_tsv_with_mapping,
+    map_headers_to_tsv_columns, COLUMNS_TO_CLEAN, OperationCancelled
+)
+from src.csv_readers import CSV_READERS
+
+ROWS = [
+    ["First Name", "Gender", "Ethnicity", "School"],
+    ["Ana", "F", "Hispanic", "Pomona High School"],
+    ["Ben", "m", "Black", "Unknown Academy"],
+    ["Cy", "F", "Hispanic", "Pomona High School"],
+]
+
+def large_rows(num_rows: int = 12_000) -> list[list[str]]:
+    genders = ["M", "F", "Girl", "boy"]
+    return [["First Name", "Gender", "Grade"]] + [
+        [f"Student{i}", genders[i % 4], str(i % 300)] for i in range(num_rows)
+    ]
+
+class TestRoster:
+
+    # 1) a roster reads back exactly like the rows it was built from
+    def test_row_compatibility(self):
+        roster = Roster.from_rows(ROWS)
+
+        assert list(roster) == ROWS
+        assert len(roster) == 4 and roster.num_rows == 3
+        assert roster[0] == ROWS[0] and roster[-1] == ROWS[-1]
+        assert roster[1:3] == ROWS[1:3]
+        assert roster.column(3) == ["Pomona High School", "Unknown Academy", "Pomona High School"]
+        with pytest.raises(IndexError):
+            roster[4]
+        assert not Roster.from_rows([])
+
+    # 2) rows of different lengths are kept as they are
+    def test_ragged(self):
+        rows = [["a", "b"], ["1"], ["2", "3", "4"], ["5", "6"]]
+        assert Roster.from_rows(rows).to_rows() == rows
+
+    # 3) repeated columns are dictionary encoded, distinct ones packed, codes widen as needed
+    def test_storage(self):
+        rows = large_rows()
+        roster = Roster.from_rows(rows)
+        names, genders, grades = roster.columns
+
+        assert type(names).__name__ == "PackedColumn"
+        assert genders.values == ["M", "F", "Girl", "boy"] and genders.codes.typecode == "B"
+        assert grades.codes.typecode == "H"
+        assert roster.to_rows() == rows
+        assert roster[9_000] == rows[9_000]
+
+    # 4) map_column calls the function once per distinct value and leaves the original alone
+    def test_map_column(self):
+        roster = Roster.from_rows(large_rows())
+        calls = []
+        def upper(value):
+            calls.append(value)
+            return value.upper()
+
+        mapped = roster.map_column(1, upper)
+        assert len(calls) == 4
+        assert mapped[3][1] == "GIRL" and roster[3][1] == "Girl"
+        assert mapped.columns[0] is roster.columns[0]
+
+
+class TestRosterPipeline:
+
+    # 1) cleaning a roster gives the same rows and cache stats as the row engine
+    def test_clean_matches_rows(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            rows_pipeline = CleaningPipeline(COLUMNS_TO_CLEAN)
+            rows_pipeline.prepare(ROWS[0])
+            expected = rows_pipeline.run(ROWS)
+
+            roster_pipeline = CleaningPipeline(COLUMNS_TO_CLEAN)
+            roster_pipeline.prepare(ROWS[0])
+            roster = Roster.from_rows(ROWS)
+            cleaned = roster_pipeline.run(roster)
+
+        assert isinstance(cleaned, Roster)
+        assert cleaned.to_rows() == expected
+        assert list(roster) == ROWS
+        for column_name in COLUMNS_TO_CLEAN:
+            assert roster_pipeline.caches[column_name].stats() == rows_pipeline.caches[column_name].stats()
+
+    # 2) cleaning reports progress while each column is mapped and can be cancelled part way
+    def test_progress_and_cancel(self):
+        rows = [["Gender", "School"]] + [["F" if i % 2 else "M", f"School {i}"] for i in range(5_000)]
+        roster = Roster.from_rows(rows)
+        progress = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            pipeline = CleaningPipeline(["GENDER_ID", "ORG_ID"])
+            pipeline.prepare(rows[0])
+            pipeline.run(roster, progress_callback=progress.append)
+        assert len(progress) > 3 and progress == sorted(progress)
+        assert progress[0] < 5_000 and progress[-1] == 5_000
+        
+        resolved = []
+        def cancel(done):
+            if done > 2_500:
+                raise OperationCancelled()
+        with contextlib.redirect_stdout(io.StringIO()):
+            pipeline = CleaningPipeline(["GENDER_ID", "ORG_ID"])
+            pipeline.prepare(rows[0])
+            resolve = pipeline.resolvers["ORG_ID"].resolve
+            pipeline.resolvers["ORG_ID"].resolve = lambda value: resolved.append(value) or resolve(value)
+            with pytest.raises(OperationCancelled):
+                pipeline.run(roster, progress_callback=cancel)
+        assert 0 < len(resolved) < 5_000
+        assert list(roster) == rows
+    
+    # 3) every reader loads the same roster as readCSV, and a roster exports like row lists
+    @pytest.mark.parametrize("reader", CSV_READERS)
+    def test_read_roster(self, tmp_path, reader):
+        csv_path = tmp_path / "roster.csv"
+        csv_path.write_text("\n".join(",".join(row) for row in ROWS) + "\n", encoding="utf-8")
+
+        roster = read_roster(str(csv_path), reader)
+        assert roster.to_rows() == readCSV(str(csv_path))
+
+        tsv_path = tmp_path / "roster.tsv"
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert transfer_rows_to_tsv_with_mapping(roster, str(tsv_path), map_headers_to_tsv_columns(roster[0]))
+        assert len(tsv_path.read_text(encoding="utf-8").splitlines()) == 4
+
+    # 4) missing and empty files
+    def test_read_roster_errors(self, tmp_path, capsys):
+        assert read_roster(str(tmp_path / "missing.csv")) is None
+        assert "not found" in capsys.readouterr().out
+        empty = tmp_path / "empty.csv"
+        empty.write_text("", encoding="utf-8")
+        assert not read_roster(str(empty))
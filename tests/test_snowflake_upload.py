@@ -0,0 +1,102 @@
+import gzip
+import os
+import pytest
+import src.snowflake_upload as snowflake_upload
+from src.snowflake_upload import upload_tsv_via_stage, upload_parquet_via_stage, upload_tsv_via_write_pandas, gzip_file
+from tests.fake_snowflake import FakeConnection
+
+TSV = "EVENT_ID\tSESSION_ID\n1\t100\n2\t101\n"
+
+class TestUploadViaStage:
+    
+    # 1) gzip output round-trips
+    def test_gzip_file(self, tmp_path):
+        tsv_path = tmp_path / "roster.tsv"
+        tsv_path.write_text(TSV, encoding="utf-8")
+        
+        gz_path = gzip_file(str(tsv_path))
+        with gzip.open(gz_path, "rt", encoding="utf-8") as f:
+            assert f.read() == TSV
+    
+    # 2) PUT then COPY INTO are issued and rows are counted
+    def test_put_and_copy(self, tmp_path):
+        tsv_path = tmp_path / "roster.tsv"
+        tsv_path.write_text(TSV, encoding="utf-8")
+        conn = FakeConnection({"COPY INTO": [("roster.tsv.gz", "LOADED", 2, 2, 1, 0, None, None, None, None)]})
+        
+        report = upload_tsv_via_stage(conn, str(tsv_path))
+        
+        assert report["rows_loaded"] == 2
+        assert conn.executed[0].startswith("PUT 'file://")
+        assert "@%EVENT_STUDENT_DEMOGRAPHIC" in conn.executed[0]
+        assert conn.executed[1].startswith("COPY INTO EVENT_STUDENT_DEMOGRAPHIC")
+        assert "roster.tsv.gz" in conn.executed[1]
+        assert set(report["timings"]) == {"compress", "put", "copy"}
+        assert not os.path.exists(str(tsv_path) + ".gz")
+        
+    # 3) failed COPY raises
+    def test_copy_failure(self, tmp_path):
+        tsv_path = tmp_path / "roster.tsv"
+        tsv_path.write_text(TSV, encoding="utf-8")
+        conn = FakeConnection({"COPY INTO": [("roster.tsv.gz", "LOAD_FAILED", 2, 0, 1, 2, "bad row", None, None, None)]})
+        
+        with pytest.raises(RuntimeError, match="COPY INTO"):
+            upload_tsv_via_stage(conn, str(tsv_path))
+            
+    # 4) missing file
+    def test_missing_file(self):
+        with pytest.raises(FileNotFoundError):
+            upload_tsv_via_stage(FakeConnection(), "missing.tsv")
+
+
+class TestUploadParquet:
+    
+    # 1) Parquet is PUT as it is and copied by column name
+    def test_put_and_copy(self, tmp_path):
+        parquet_path = tmp_path / "roster.parquet"
+        parquet_path.write_bytes(b"PAR1")
+        conn = FakeConnection({"COPY INTO": [("roster.parquet", "LOADED", 2, 2, 1, 0, None, None, None, None)]})
+        
+        report = upload_parquet_via_stage(conn, str(parquet_path))
+        
+        assert report["rows_loaded"] == 2
+        assert "roster.parquet'" in conn.executed[0]
+        assert "TYPE = PARQUET" in conn.executed[1] and "MATCH_BY_COLUMN_NAME" in conn.executed[1]
+        assert set(report["timings"]) == {"put", "copy"}
+
+
+class TestUploadViaWritePandas:
+    
+    # 1) each chunk goes to write_pandas as strings, with empty fields as NULL
+    def test_chunks(self, tmp_path, monkeypatch):
+        tsv_path = tmp_path / "roster.tsv"
+        tsv_path.write_text("EVENT_ID\tPOSTAL_CODE\n1\t02139\n2\t\n3\t90210\n", encoding="utf-8")
+        conn = FakeConnection()
+        calls = []
+        
+        def fake_write_pandas(conn, df, table_name, **kwargs):
+            calls.append((conn, df, table_name, kwargs))
+            return True, 1, len(df), []
+        monkeypatch.setattr(snowflake_upload, "write_pandas", fake_write_pandas)
+        
+        report = upload_tsv_via_write_pandas(conn, str(tsv_path), chunk_size=2)
+        
+        assert report["rows_loaded"] == 3 and report["chunks"] == 2
+        first, second = calls[0][1], calls[1][1]
+        assert list(first.columns) == ["EVENT_ID", "POSTAL_CODE"]
+        # leading zeros survive and the empty postal code is sent as NULL
+        assert first["EVENT_ID"].tolist() == ["1", "2"]
+        assert first["POSTAL_CODE"].iloc[0] == "02139" and first["POSTAL_CODE"].isna().tolist() == [False, True]
+        assert second.to_dict("list") == {"EVENT_ID": ["3"], "POSTAL_CODE": ["90210"]}
+        assert all(call[0] is conn and call[2] == "EVENT_STUDENT_DEMOGRAPHIC" for call in calls)
+        assert calls[0][3] == {"compression": "snappy"}
+        assert set(report["timings"]) == {"read", "write"}
+    
+    # 2) a failed chunk raises
+    def test_failure(self, tmp_path, monkeypatch):
+        tsv_path = tmp_path / "roster.tsv"
+        tsv_path.write_text(TSV, encoding="utf-8")
+        monkeypatch.setattr(snowflake_upload, "write_pandas", lambda *args, **kwargs: (False, 1, 0, []))
+        
+        with pytest.raises(RuntimeError, match="chunk 1"):
+            upload_tsv_via_write_pandas(FakeConnection(), str(tsv_path))
@@ -0,0 +1,60 @@
+from src.cleaner import stream_csv_to_tsv, transfer_csv_to_tsv_with_mapping, map_csv_to_tsv_columns, TSV_HEADERS
+
+RAW_CSV = "First Name,Last Name,Gender,Age,Grade,Ethnicity,School\n" \
+          "Ana,Lopez,F,12,7,Hispanic,Pomona High School\n" \
+          "\n" \
+          "Ben,Smith,m,13,8,Black,Unknown Academy\n"
+
+class TestStreamCSVToTSV:
+    
+    # 1) rows are cleaned and projected onto the TSV columns
+    def test_stream_cleans_and_projects(self, tmp_path):
+        csv_path = tmp_path / "roster.csv"
+        tsv_path = tmp_path / "roster.tsv"
+        csv_path.write_text(RAW_CSV, encoding="utf-8")
+        
+        written = stream_csv_to_tsv(str(csv_path), str(tsv_path), chunk_size=1)
+        
+        lines = tsv_path.read_text(encoding="utf-8").splitlines()
+        assert written == 2
+        assert lines[0].split("\t") == TSV_HEADERS
+        first = dict(zip(TSV_HEADERS, lines[1].split("\t")))
+        assert first["GENDER_ID"] == "2"
+        assert first["ETHNICITY_ID"] == "4"
+        assert first["STUDENT_FIRST_NAME"] == "Ana"
+        
+    # 2) transfer rejects files with headers only
+    def test_transfer_headers_only(self, tmp_path, capsys):
+        csv_path = tmp_path / "headers.csv"
+        csv_path.write_text("EVENT_ID,SESSION_ID\n", encoding="utf-8")
+        mapping = map_csv_to_tsv_columns(str(csv_path))
+        
+        assert transfer_csv_to_tsv_with_mapping(str(csv_path), str(tmp_path / "out.tsv"), mapping) is False
+        assert "no data rows" in capsys.readouterr().out
+
+
+class TestInMemoryExport:
+    
+    # 1) header mapping works without a file
+    def test_map_headers(self):
+        from src.cleaner import map_headers_to_tsv_columns
+        result = map_headers_to_tsv_columns(["event id", "session id", "zip code"])
+        assert result["POSTAL_CODE"] == "zip code"
+        
+    # 2) only the header row is read from disk
+    def test_read_csv_headers(self, tmp_path):
+        from src.cleaner import read_csv_headers
+        csv_path = tmp_path / "roster.csv"
+        csv_path.write_text("\nA,B\n1,2\n", encoding="utf-8")
+        assert read_csv_headers(str(csv_path)) == ["A", "B"]
+        
+    # 3) rows are written straight to TSV, no temp CSV
+    def test_transfer_rows(self, tmp_path):
+        from src.cleaner import transfer_rows_to_tsv_with_mapping, map_headers_to_tsv_columns
+        rows = [["EVENT_ID", "SESSION_ID"], ["1", "100"], ["2", " 101 "]]
+        tsv_path = tmp_path / "out.tsv"
+        
+        assert transfer_rows_to_tsv_with_mapping(iter(rows), str(tsv_path), map_headers_to_tsv_columns(rows[0]))
+        lines = tsv_path.read_text(encoding="utf-8").splitlines()
+        assert lines[2].split("\t")[:2] == ["2", "101"]
+        assert list(tmp_path.iterdir()) == [tsv_path]
@@ -0,0 +1,78 @@
+import json
+from src.sync_mappings import sync_mappings
+from tests.fake_snowflake import FakeConnection
+
+class FakeWarehouse(FakeConnection):
+    """Answers the sync queries from in-memory tables: {table: [(name, id), ...]}."""
+    def __init__(self, tables):
+        super().__init__()
+        self.tables = tables
+    
+    def respond(self, query):
+        table = next(name for name in self.tables if f"FROM {name}" in query)
+        rows = self.tables[table]
+        if query.startswith("SELECT MAX("):
+            if "WHERE" in query:
+                # fingerprint up to the high-water mark recorded in the fake
+                rows = [row for row in rows if row[1] <= self.high_water[table]]
+            if not rows:
+                return [(None, 0, None)]
+            return [(max(row[1] for row in rows), len(rows), hash(tuple(sorted(rows))))]
+        if "WHERE" in query:
+            return [row for row in rows if row[1] > self.high_water[table]]
+        return list(rows)
+
+TABLES = {
+    "ETHNICITY": [("Asian", 2), ("White", 5)],
+    "GENDER": [("Male", 1), ("Female", 2)],
+    "ORGANIZATION": [("STEAM:CODERS", 1), ("Innovate Pasadena", 2)],
+}
+
+class TestSyncMappings:
+    
+    def run_sync(self, tmp_path, conn, full=False):
+        return sync_mappings(conn, str(tmp_path / "key_ids.json"), str(tmp_path / "state.json"), full=full)
+    
+    # 1) first sync fetches everything
+    def test_first_sync_is_full(self, tmp_path):
+        conn = FakeWarehouse({k: list(v) for k, v in TABLES.items()})
+        reports = self.run_sync(tmp_path, conn)
+        
+        assert [r["mode"] for r in reports] == ["full", "full", "full"]
+        data = json.loads((tmp_path / "key_ids.json").read_text())
+        assert data["org_id"] == {"STEAM:CODERS": 1, "Innovate Pasadena": 2}
+        
+    # 2) unchanged tables are skipped, appended rows are fetched incrementally
+    def test_incremental_sync(self, tmp_path):
+        conn = FakeWarehouse({k: list(v) for k, v in TABLES.items()})
+        self.run_sync(tmp_path, conn)
+        
+        conn.tables["ORGANIZATION"].append(("Warner Bros.", 3))
+        conn.high_water = {"ORGANIZATION": 2}
+        conn.executed.clear()
+        reports = {r["table"]: r for r in self.run_sync(tmp_path, conn)}
+        
+        assert reports["GENDER"]["mode"] == "unchanged"
+        assert reports["ORGANIZATION"]["mode"] == "incremental"
+        assert reports["ORGANIZATION"]["added"] == 1
+        data = json.loads((tmp_path / "key_ids.json").read_text())
+        assert data["org_id"]["Warner Bros."] == 3
+        
+    # 3) renamed rows force a full fetch of that table
+    def test_changed_rows_trigger_full(self, tmp_path):
+        conn = FakeWarehouse({k: list(v) for k, v in TABLES.items()})
+        self.run_sync(tmp_path, conn)
+        
+        conn.tables["GENDER"][1] = ("Woman", 2)
+        conn.high_water = {"GENDER": 2}
+        reports = {r["table"]: r for r in self.run_sync(tmp_path, conn)}
+        
+        assert reports["GENDER"]["mode"] == "full"
+        assert reports["GENDER"]["added"] == 1 and reports["GENDER"]["removed"] == 1
+        
+    # 4) --full ignores stored state
+    def test_full_flag(self, tmp_path):
+        conn = FakeWarehouse({k: list(v) for k, v in TABLES.items()})
+        self.run_sync(tmp_path, conn)
+        reports = self.run_sync(tmp_path, conn, full=True)
+        assert all(r["mode"] == "full" for r in reports)